@@ -0,0 +1,71 @@
+"""Synthetic Cube responses shared by the benchmarks."""
+
+import random
+from typing import Any
+
+
+def load_payload(rows: int, seed: int = 0) -> dict[str, Any]:
+    """Build a `/v1/load` response shaped like an ungrouped task export."""
+    rng = random.Random(seed)
+    statuses = ["Completed", "Open", "In Progress", "Blocked"]
+    return {
+        "queryType": "regularQuery",
+        "results": [
+            {
+                "query": {
+                    "measures": ["tasks.count", "tasks.hours"],
+                    "dimensions": ["tasks.id", "tasks.status"],
+                    "timeDimensions": [
+                        {"dimension": "tasks.created_at", "granularity": "day"}
+                    ],
+                },
+                "lastRefreshTime": "2024-06-01T00:00:00.000Z",
+                "annotation": {
+                    "measures": {
+                        "tasks.count": {"title": "Count", "type": "number"},
+                        "tasks.hours": {"title": "Hours", "type": "number"},
+                    },
+                    "dimensions": {
+                        "tasks.id": {"title": "Id", "type": "number"},
+                        "tasks.status": {"title": "Status", "type": "string"},
+                    },
+                    "segments": {},
+                    "timeDimensions": {
+                        "tasks.created_at.day": {
+                            "title": "Created At",
+                            "type": "time",
+                        },
+                        "tasks.created_at": {
+                            "title": "Created At",
+                            "type": "time",
+                        },
+                    },
+                },
+                "data": [
+                    {
+                        "tasks.id": str(i),
+                        "tasks.status": rng.choice(statuses),
+                        "tasks.created_at.day": f"2024-{rng.randint(1, 12):02d}-"
+                        f"{rng.randint(1, 28):02d}T00:00:00.000",
+                        "tasks.created_at": f"2024-{rng.randint(1, 12):02d}-"
+                        f"{rng.randint(1, 28):02d}T00:00:00.000",
+                        "tasks.count": str(rng.randint(1, 50)),
+                        "tasks.hours": f"{rng.uniform(0, 100):.2f}",
+                    }
+                    for i in range(rows)
+                ],
+            }
+        ],
+    }
+
+
+def best_of(fn: Any, repeat: int = 5) -> float:
+    """Return the fastest wall time of `repeat` runs in seconds."""
+    import time
+
+    timings: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
@@ -0,0 +1,51 @@
+"""
+Cube.dev HTTP Client - Coercion Benchmark
+
+Compares converting the string values of a large `/v1/load` result row by
+row against converting whole columns with `V1LoadColumns.coerce`.
+
+    python benchmarks/coercion.py [rows]
+"""
+
+import importlib.util
+import sys
+from datetime import datetime
+from typing import Any
+
+from _payloads import best_of, load_payload
+
+from cube_http.types.v1 import V1LoadResponse
+
+
+def main(rows: int) -> None:
+    response = V1LoadResponse.model_validate(load_payload(rows))
+    result = response.results[0]
+    types = result.annotation.member_types()
+
+    def per_row() -> list[dict[str, Any]]:
+        converted: list[dict[str, Any]] = []
+        for row in result.data:
+            out = dict(row)
+            for member, value in row.items():
+                if types.get(member) == "number":
+                    out[member] = float(value)
+                elif types.get(member) == "time":
+                    out[member] = datetime.fromisoformat(value)
+            converted.append(out)
+        return converted
+
+    columns = result.to_columns()
+    print(f"{rows} rows\n")
+    print(f"{'per row':<16}{best_of(per_row) * 1000:>10.1f}ms")
+    print(
+        f"{'columns':<16}{best_of(lambda: columns.coerce(types)) * 1000:>10.1f}ms"
+    )
+    if importlib.util.find_spec("numpy") is None:
+        print("skipping numpy: not installed")
+        return
+    numpy_time = best_of(lambda: columns.coerce(types, numpy=True))
+    print(f"{'columns (numpy)':<16}{numpy_time * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,117 @@
+"""
+Cube.dev HTTP Client - Compression Benchmark
+
+Measures bytes on the wire and CPU time for compressed request bodies,
+from a small query to queries filtering on long ID lists, and for
+`/v1/load` response bodies in each encoding httpx can decode here.
+
+    python benchmarks/compression.py
+"""
+
+import gzip
+import importlib
+import importlib.util
+import json
+import random
+from functools import partial
+from typing import Any, Callable
+
+from _payloads import best_of, load_payload
+
+from cube_http.routes._compression import BodyCompressor
+
+
+def main() -> None:
+    print("request bodies\n")
+    print(f"{'query':<16}{'encoding':<12}{'bytes':>10}{'ratio':>8}{'time':>12}")
+    for name, ids in (("small", 0), ("1k ids", 1_000), ("10k ids", 10_000)):
+        body = json.dumps(_query(ids), separators=(",", ":")).encode()
+        print(f"{name:<16}{'identity':<12}{len(body):>10}{1:>8.2f}{'':>12}")
+        for encoding, options in _request_encodings().items():
+            compress = BodyCompressor(options | {"threshold": 0}).compress
+            elapsed = best_of(partial(compress, body), repeat=20)
+            size = len(compress(body)[0])
+            print(
+                f"{'':<16}{encoding:<12}{size:>10}"
+                f"{len(body) / size:>8.2f}{elapsed * 1e6:>10.0f}us"
+            )
+
+    print("\nresponse bodies, 10k rows\n")
+    print(f"{'encoding':<12}{'bytes':>10}{'ratio':>8}{'decode':>12}")
+    body = json.dumps(load_payload(10_000)).encode()
+    print(f"{'identity':<12}{len(body):>10}{1:>8.2f}")
+    for encoding, (compress, decompress) in _response_encodings().items():
+        compressed = compress(body)
+        elapsed = best_of(partial(decompress, compressed))
+        print(
+            f"{encoding:<12}{len(compressed):>10}"
+            f"{len(body) / len(compressed):>8.2f}{elapsed * 1000:>10.1f}ms"
+        )
+
+
+def _query(ids: int) -> dict[str, Any]:
+    rng = random.Random(0)
+    query: dict[str, Any] = {
+        "measures": ["tasks.count", "tasks.hours"],
+        "dimensions": ["tasks.status"],
+        "timeDimensions": [
+            {
+                "dimension": "tasks.created_at",
+                "granularity": "day",
+                "dateRange": ["2024-01-01", "2024-12-31"],
+            }
+        ],
+    }
+    if ids:
+        query["filters"] = [
+            {
+                "member": "tasks.project_id",
+                "operator": "equals",
+                "values": [str(rng.randint(10**8, 10**9)) for _ in range(ids)],
+            }
+        ]
+    return {"query": query, "queryType": "multi"}
+
+
+def _request_encodings() -> dict[str, Any]:
+    encodings: dict[str, Any] = {
+        "gzip-1": {"algorithm": "gzip", "level": 1},
+        "gzip-6": {"algorithm": "gzip"},
+    }
+    if importlib.util.find_spec("zstandard") is not None:
+        encodings["zstd-3"] = {"algorithm": "zstd"}
+    else:
+        print("skipping zstd: zstandard not installed\n")
+    return encodings
+
+
+Codec = tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]
+
+
+def _response_encodings() -> dict[str, Codec]:
+    encodings: dict[str, Codec] = {
+        "gzip": (lambda b: gzip.compress(b, 6), gzip.decompress),
+    }
+    try:
+        brotli: Any = importlib.import_module("brotli")
+
+        encodings["br"] = (
+            lambda b: brotli.compress(b, quality=5),
+            brotli.decompress,
+        )
+    except ImportError:
+        print("skipping br: brotli not installed")
+    try:
+        import zstandard
+
+        encodings["zstd"] = (
+            zstandard.ZstdCompressor(level=3).compress,
+            zstandard.ZstdDecompressor().decompress,
+        )
+    except ImportError:
+        print("skipping zstd: zstandard not installed")
+    return encodings
+
+
+if __name__ == "__main__":
+    main()
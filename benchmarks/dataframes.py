@@ -0,0 +1,83 @@
+"""
+Cube.dev HTTP Client - DataFrame Export Benchmark
+
+Compares building DataFrames from a large `/v1/load` result the naive way,
+from the row dicts, against `to_arrow`, `to_polars` and `to_pandas`. Time
+and peak traced memory are reported for each. Naive frames keep Cube's
+strings, except for `pandas naive typed` which converts them afterwards.
+
+    python benchmarks/dataframes.py [rows]
+"""
+
+import importlib
+import sys
+import tracemalloc
+from typing import Any, Callable
+
+from _payloads import best_of, load_payload
+
+from cube_http.types.v1 import V1LoadResponse
+
+
+def main(rows: int) -> None:
+    payload = load_payload(rows)
+
+    def result() -> Any:
+        return V1LoadResponse.model_validate(payload).results[0]
+
+    cases: dict[str, Callable[[Any], Any]] = {}
+    try:
+        pd: Any = importlib.import_module("pandas")
+
+        cases["pandas naive"] = lambda r: pd.DataFrame(r.data)
+        cases["pandas naive typed"] = lambda r: _typed(pd, r)
+        cases["to_pandas"] = lambda r: r.to_pandas()
+    except ImportError:
+        print("skipping pandas: not installed")
+    try:
+        pl: Any = importlib.import_module("polars")
+
+        cases["polars naive"] = lambda r: pl.DataFrame(r.data)
+        cases["to_polars"] = lambda r: r.to_polars()
+    except ImportError:
+        print("skipping polars: not installed")
+    try:
+        pa: Any = importlib.import_module("pyarrow")
+
+        cases["arrow naive"] = lambda r: pa.Table.from_pylist(r.data)
+        cases["to_arrow"] = lambda r: r.to_arrow()
+    except ImportError:
+        print("skipping pyarrow: not installed")
+
+    print(f"{rows} rows\n")
+    print(f"{'export':<20}{'time':>12}{'peak':>12}")
+    for name, export in cases.items():
+        elapsed, peak = _measure(result, export)
+        print(f"{name:<20}{elapsed * 1000:>10.1f}ms{peak / 1024**2:>9.1f}MiB")
+
+
+def _typed(pd: Any, result: Any) -> Any:
+    frame = pd.DataFrame(result.data)
+    for member, member_type in result.annotation.member_types().items():
+        if member_type == "number":
+            frame[member] = pd.to_numeric(frame[member])
+        elif member_type == "time":
+            frame[member] = pd.to_datetime(frame[member])
+    return frame
+
+
+def _measure(
+    result: Callable[[], Any], export: Callable[[Any], Any]
+) -> tuple[float, int]:
+    results = [result() for _ in range(5)]
+    elapsed = best_of(lambda: export(results.pop()))
+    fresh = result()
+    tracemalloc.start()
+    export(fresh)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,156 @@
+"""
+Cube.dev HTTP Client - HTTP/1.1 vs HTTP/2 Benchmark
+
+Sends concurrent small `/v1/load` queries through an `AsyncClient` to a
+local TLS stub server running in another process, over HTTP/1.1 with the
+default and a larger keepalive pool and over HTTP/2, and reports the wall
+time and the number of connections the server accepted. The stub answers
+after a short delay, standing in for Cube's query latency.
+
+Requires the `http2` extra, `hypercorn` and `trustme`:
+
+    python benchmarks/http2.py [requests] [latency_ms]
+"""
+
+import asyncio
+import importlib
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import tempfile
+import time
+from typing import Any
+
+from _payloads import load_payload
+
+import cube_http
+
+CASES: dict[str, dict[str, Any]] = {
+    "HTTP/1.1": {},
+    "HTTP/1.1, 100 keepalive": {"limits": {"max_keepalive_connections": 100}},
+    "HTTP/2": {"http2": True},
+}
+
+
+def main(requests: int, latency: float) -> None:
+    try:
+        import trustme
+    except ImportError:
+        print("requires hypercorn and trustme: pip install hypercorn trustme")
+        return
+
+    ca = trustme.CA()
+    cert = ca.issue_cert("127.0.0.1")
+    with tempfile.TemporaryDirectory() as tmp:
+        certfile, keyfile, cafile = (
+            os.path.join(tmp, name) for name in ("cert.pem", "key.pem", "ca.pem")
+        )
+        cert.cert_chain_pems[0].write_to_path(certfile)
+        cert.private_key_pem.write_to_path(keyfile)
+        ca.cert_pem.write_to_path(cafile)
+        # The transport the client creates trusts the stub's CA through this
+        os.environ["SSL_CERT_FILE"] = cafile
+
+        port = _free_port()
+        server = multiprocessing.Process(
+            target=_serve, args=(port, certfile, keyfile, latency), daemon=True
+        )
+        server.start()
+        try:
+            asyncio.run(_compare(port, requests, latency))
+        finally:
+            server.terminate()
+
+
+async def _compare(port: int, requests: int, latency: float) -> None:
+    url = f"https://127.0.0.1:{port}/cubejs-api"
+    await _wait_for_server(url)
+
+    print(
+        f"{requests} concurrent loads, {latency * 1000:.0f}ms server latency\n"
+    )
+    print(f"{'client':<24}{'time':>12}{'connections':>14}")
+    for name, options in CASES.items():
+        elapsed, connections = await _run(url, options, requests)
+        print(f"{name:<24}{elapsed * 1000:>10.1f}ms{connections:>14}")
+
+
+async def _run(
+    url: str, options: dict[str, Any], requests: int
+) -> tuple[float, int]:
+    query: Any = {"query": {"measures": ["tasks.count"]}}
+    async with cube_http.AsyncClient(
+        {"url": url, "token": "t", **options}
+    ) as cube:
+        await cube.v1.load(query)  # connect and negotiate before timing
+        before = await _connections(cube)
+        start = time.perf_counter()
+        await asyncio.gather(*(cube.v1.load(query) for _ in range(requests)))
+        elapsed = time.perf_counter() - start
+        return elapsed, await _connections(cube) - before
+
+
+async def _connections(cube: cube_http.AsyncClient) -> int:
+    res = await cube.http_client.get("stats")
+    return res.json()["connections"]
+
+
+async def _wait_for_server(url: str) -> None:
+    async with cube_http.AsyncClient({"url": url, "token": "t"}) as cube:
+        for _ in range(50):
+            try:
+                await cube.http_client.get("stats")
+                return
+            except Exception:
+                await asyncio.sleep(0.1)
+
+
+def _serve(port: int, certfile: str, keyfile: str, latency: float) -> None:
+    from hypercorn.config import Config
+
+    serve: Any = importlib.import_module("hypercorn.asyncio").serve
+
+    body = json.dumps(load_payload(5)).encode()
+    connections: set[Any] = set()
+
+    async def app(scope: Any, receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            return
+        connections.add(scope["client"])
+        while (await receive()).get("more_body"):
+            pass
+        content = body
+        if scope["path"].endswith("/stats"):
+            content = json.dumps({"connections": len(connections)}).encode()
+        else:
+            await asyncio.sleep(latency)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
+
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.certfile, config.keyfile = certfile, keyfile
+    config.loglevel = "ERROR"
+    config.h2_max_concurrent_streams = 1000
+    asyncio.run(serve(app, config))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        (float(sys.argv[2]) if len(sys.argv) > 2 else 20) / 1000,
+    )
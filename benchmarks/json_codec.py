@@ -0,0 +1,74 @@
+"""
+Cube.dev HTTP Client - JSON Codec Benchmark
+
+Compares decoding a large `/v1/load` response and encoding a large request
+body with the default httpx/stdlib handling and each `json_codec`. Validated
+decoding is the same with every codec, pydantic's `model_validate_json`, so
+it is measured once against the default.
+
+    python benchmarks/json_codec.py [rows]
+"""
+
+import json
+import sys
+from typing import Any
+
+import httpx
+from _payloads import best_of, load_payload
+
+from cube_http._json import JsonCodec, resolve_codec
+from cube_http.types.v1 import V1LoadResponse
+
+
+def main(rows: int) -> None:
+    body = json.dumps(load_payload(rows)).encode()
+    res = httpx.Response(200, content=body)
+    request_body = {
+        "query": {
+            "measures": ["tasks.count"],
+            "filters": [
+                {
+                    "member": "tasks.id",
+                    "operator": "equals",
+                    "values": [str(i) for i in range(50_000)],
+                }
+            ],
+        }
+    }
+
+    codecs: dict[str, JsonCodec | None] = {"default": None}
+    for name in ("stdlib", "orjson", "msgspec"):
+        try:
+            codecs[name] = resolve_codec(name)  # type: ignore[arg-type]
+        except ImportError:
+            print(f"skipping {name}: not installed")
+
+    print(f"{rows} rows, {len(body) / 1024**2:.1f} MiB response body\n")
+    default = best_of(lambda: V1LoadResponse.from_response(res))
+    validated = best_of(lambda: V1LoadResponse.model_validate_json(body))
+    print(
+        f"validated  default {default * 1000:.1f}ms, any codec {validated * 1000:.1f}ms\n"
+    )
+    print(f"{'codec':<10}{'trusted':>12}{'encode':>12}")
+    for name, codec in codecs.items():
+        trusted, encode = _measure(res, request_body, codec)
+        print(f"{name:<10}{trusted * 1000:>10.1f}ms{encode * 1000:>10.1f}ms")
+
+
+def _measure(
+    res: httpx.Response, request_body: dict[str, Any], codec: JsonCodec | None
+) -> tuple[float, float]:
+    trusted = best_of(
+        lambda: V1LoadResponse.from_response(res, {"trusted": True}, codec)
+    )
+    if codec is None:
+        encode = best_of(
+            lambda: httpx.Request("POST", "http://cube", json=request_body)
+        )
+    else:
+        encode = best_of(lambda: codec.dumps(request_body))
+    return trusted, encode
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,269 @@
+import itertools
+import threading
+import time
+from typing import (
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Literal,
+    Sequence,
+    TypedDict,
+)
+
+import httpx
+from typing_extensions import NotRequired
+
+BalancingStrategy = Literal["round_robin", "least_outstanding", "ewma"]
+
+
+class LoadBalancingOptions(TypedDict, total=False):
+    strategy: NotRequired[BalancingStrategy]
+    """How the endpoint of each request is picked among healthy ones. Defaults to "least_outstanding\""""
+
+    ewma_decay: NotRequired[float]
+    """Seconds over which the latency average of the `ewma` strategy forgets old samples. Defaults to 10.0"""
+
+    max_failures: NotRequired[int]
+    """Consecutive failures after which an endpoint is taken out of rotation. Defaults to 3"""
+
+    cooldown: NotRequired[float]
+    """Seconds an unhealthy endpoint stays out of rotation. Defaults to 10.0"""
+
+    failover: NotRequired[bool]
+    """Send a request again to another endpoint when it failed with a transport error. Defaults to True"""
+
+    status_codes: NotRequired[Sequence[int]]
+    """Response status codes counted as endpoint failures. Defaults to 502, 503 and 504"""
+
+
+class Endpoint:
+    """A Cube API base URL and what the client observed about it."""
+
+    def __init__(self, url: str) -> None:
+        self.url = httpx.URL(url)
+        self.outstanding = 0
+        self.latency = 0.0
+        self.failures = 0
+        self.unhealthy_until = 0.0
+        self._sampled_at: float | None = None
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.unhealthy_until
+
+    def observe_latency(self, latency: float, decay: float) -> None:
+        now = time.monotonic()
+        if self._sampled_at is None:
+            self.latency = latency
+        else:
+            weight = 2 ** (-(now - self._sampled_at) / decay)
+            self.latency = self.latency * weight + latency * (1 - weight)
+        self._sampled_at = now
+
+
+class EndpointPool:
+    """Picks endpoints for requests and tracks their health."""
+
+    def __init__(
+        self, urls: Sequence[str], options: LoadBalancingOptions
+    ) -> None:
+        if not urls:
+            raise ValueError("At least one base URL must be provided")
+        self.endpoints = [Endpoint(url) for url in urls]
+        self._strategy = options.get("strategy", "least_outstanding")
+        self._decay = options.get("ewma_decay", 10.0)
+        self._max_failures = options.get("max_failures", 3)
+        self._cooldown = options.get("cooldown", 10.0)
+        self._status_codes = options.get("status_codes", (502, 503, 504))
+        self.failover = options.get("failover", True)
+        self._turn = itertools.count()
+        self._lock = threading.Lock()
+
+    def acquire(self, exclude: Sequence[Endpoint] = ()) -> Endpoint | None:
+        """Pick an endpoint not in `exclude` and count the request against it."""
+        with self._lock:
+            candidates = [e for e in self.endpoints if e not in exclude]
+            if not candidates:
+                return None
+            # Unhealthy endpoints are only tried once every endpoint is
+            candidates = [e for e in candidates if e.healthy] or candidates
+            start = next(self._turn) % len(candidates)
+            rotated = candidates[start:] + candidates[:start]
+            if self._strategy == "least_outstanding":
+                endpoint = min(rotated, key=lambda e: e.outstanding)
+            elif self._strategy == "ewma":
+                endpoint = min(
+                    rotated, key=lambda e: e.latency * (e.outstanding + 1)
+                )
+            else:
+                endpoint = rotated[0]
+            endpoint.outstanding += 1
+            return endpoint
+
+    def release(self, endpoint: Endpoint) -> None:
+        with self._lock:
+            endpoint.outstanding -= 1
+
+    def record(
+        self, endpoint: Endpoint, latency: float, res: httpx.Response | None
+    ) -> None:
+        """Record a response, or a transport error when `res` is None."""
+        with self._lock:
+            endpoint.observe_latency(latency, self._decay)
+            if res is not None and res.status_code not in self._status_codes:
+                endpoint.failures = 0
+                return
+            endpoint.failures += 1
+            if endpoint.failures >= self._max_failures:
+                endpoint.unhealthy_until = time.monotonic() + self._cooldown
+
+    def rebase(
+        self, request: httpx.Request, endpoint: Endpoint
+    ) -> httpx.Request:
+        """Copy a request built against the first endpoint onto `endpoint`."""
+        base = self.endpoints[0].url.raw_path.rstrip(b"/")
+        path = request.url.raw_path
+        # Paths outside the base URL, e.g. `/readyz`, are kept as they are
+        if path.startswith(base):
+            path = endpoint.url.raw_path.rstrip(b"/") + path[len(base) :]
+        url = endpoint.url.copy_with(raw_path=path)
+        headers = request.headers.copy()
+        headers["Host"] = url.netloc.decode("ascii")
+        return httpx.Request(
+            request.method,
+            url,
+            headers=headers,
+            stream=request.stream,
+            extensions=request.extensions,
+        )
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(
+        self, stream: httpx.SyncByteStream, release: Callable[[], None]
+    ) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    def __init__(
+        self, stream: httpx.AsyncByteStream, release: Callable[[], None]
+    ) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class LoadBalancingTransport(httpx.BaseTransport):
+    """Spreads requests over several Cube API base URLs."""
+
+    def __init__(
+        self, transport: httpx.BaseTransport, pool: EndpointPool
+    ) -> None:
+        self._transport = transport
+        self.pool = pool
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        tried: list[Endpoint] = []
+        while (endpoint := self.pool.acquire(tried)) is not None:
+            tried.append(endpoint)
+            start = time.monotonic()
+            try:
+                res = self._transport.handle_request(
+                    self.pool.rebase(request, endpoint)
+                )
+            except httpx.TransportError:
+                self.pool.record(endpoint, time.monotonic() - start, None)
+                self.pool.release(endpoint)
+                if not self.pool.failover or len(tried) == len(
+                    self.pool.endpoints
+                ):
+                    raise
+                continue
+            except BaseException:
+                self.pool.release(endpoint)
+                raise
+            self.pool.record(endpoint, time.monotonic() - start, res)
+            if res.is_closed:
+                self.pool.release(endpoint)
+                return res
+            # The request counts as outstanding until its body is consumed
+            assert isinstance(res.stream, httpx.SyncByteStream)
+            res.stream = _ReleasingStream(
+                res.stream, lambda: self.pool.release(endpoint)
+            )
+            return res
+        raise httpx.ConnectError("No endpoint left to send the request to")
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncLoadBalancingTransport(httpx.AsyncBaseTransport):
+    """Spreads requests over several Cube API base URLs."""
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, pool: EndpointPool
+    ) -> None:
+        self._transport = transport
+        self.pool = pool
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        tried: list[Endpoint] = []
+        while (endpoint := self.pool.acquire(tried)) is not None:
+            tried.append(endpoint)
+            start = time.monotonic()
+            try:
+                res = await self._transport.handle_async_request(
+                    self.pool.rebase(request, endpoint)
+                )
+            except httpx.TransportError:
+                self.pool.record(endpoint, time.monotonic() - start, None)
+                self.pool.release(endpoint)
+                if not self.pool.failover or len(tried) == len(
+                    self.pool.endpoints
+                ):
+                    raise
+                continue
+            except BaseException:
+                self.pool.release(endpoint)
+                raise
+            self.pool.record(endpoint, time.monotonic() - start, res)
+            if res.is_closed:
+                self.pool.release(endpoint)
+                return res
+            # The request counts as outstanding until its body is consumed
+            assert isinstance(res.stream, httpx.AsyncByteStream)
+            res.stream = _AsyncReleasingStream(
+                res.stream, lambda: self.pool.release(endpoint)
+            )
+            return res
+        raise httpx.ConnectError("No endpoint left to send the request to")
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
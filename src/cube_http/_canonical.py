@@ -0,0 +1,103 @@
+import hashlib
+import json
+from typing import Any, Mapping, cast
+
+# Operators whose `values` form a set, so their order does not change results
+_UNORDERED_VALUE_OPERATORS = frozenset(
+    {
+        "equals",
+        "notEquals",
+        "contains",
+        "notContains",
+        "startsWith",
+        "notStartsWith",
+        "endsWith",
+        "notEndsWith",
+    }
+)
+
+# Keys whose items can be listed in any order when the query sets `order`
+_UNORDERED_KEYS = ("measures", "dimensions", "segments", "timeDimensions")
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
+
+
+def _canonical_filter(item: Mapping[str, Any]) -> dict[str, Any]:
+    out = dict(item)
+    for logical in ("and", "or"):
+        if logical in out:
+            out[logical] = _canonical_filters(out[logical])
+    if out.get("operator") in _UNORDERED_VALUE_OPERATORS and out.get("values"):
+        out["values"] = sorted(out["values"], key=_dumps)
+    return out
+
+
+def _canonical_filters(items: list[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    return sorted((_canonical_filter(item) for item in items), key=_dumps)
+
+
+def order_pairs(order: Any) -> list[list[Any]]:
+    """Turn any form of a query `order` into `[member, direction]` pairs."""
+    items: list[Any] = [order] if isinstance(order, Mapping) else list(order)
+    pairs: list[list[Any]] = []
+    for item in items:
+        if isinstance(item, Mapping):
+            pairs.extend(
+                [member, direction]
+                for member, direction in cast(Mapping[str, Any], item).items()
+            )
+        else:
+            pairs.append(list(item))
+    return pairs
+
+
+def canonical_query(query: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Normalize a load query so equivalent queries compare equal.
+
+    Filters and values of set-like filter operators are sorted. Member lists
+    and time dimensions are sorted only when the query has an `order`, since
+    without one Cube orders rows by the first time dimension, measure or
+    dimension. Ordering is kept as given since it changes the result, with
+    dict-style ordering turned into pairs to preserve it.
+    """
+    # An empty `order` turns the default ordering off, so it is kept
+    ordered = query.get("order") is not None
+    out: dict[str, Any] = {}
+    for key, value in query.items():
+        if key == "order":
+            if value is not None:
+                out[key] = order_pairs(value)
+            continue
+        if value is None or value == [] or (key == "offset" and value == 0):
+            continue
+        if key in _UNORDERED_KEYS and ordered:
+            value = sorted(value, key=_dumps)
+        elif key == "filters":
+            value = _canonical_filters(value)
+        out[key] = value
+    return out
+
+
+def request_queries(request: Mapping[str, Any]) -> list[Mapping[str, Any]]:
+    """Queries of a load request, which holds a single query or a list."""
+    query = request["query"]
+    if isinstance(query, list):
+        return list(cast(list[Mapping[str, Any]], query))
+    return [query]
+
+
+def canonical_key(request: Mapping[str, Any]) -> str:
+    """Stable hash of a load request, identical for equivalent queries."""
+    queries = [canonical_query(q) for q in request_queries(request)]
+    canonical = dict(request) | {
+        "query": queries if isinstance(request["query"], list) else queries[0]
+    }
+    return hashlib.sha256(_dumps(canonical).encode()).hexdigest()
+
+
+def exact_key(request: Mapping[str, Any]) -> str:
+    """Hash of a request as given, for responses that depend on member order."""
+    return hashlib.sha256(_dumps(request).encode()).hexdigest()
@@ -0,0 +1,78 @@
+import json
+from typing import Any, Literal, Protocol, runtime_checkable
+
+JsonCodecName = Literal["stdlib", "orjson", "msgspec", "auto"]
+
+
+@runtime_checkable
+class JsonCodec(Protocol):
+    """Encodes request bodies and decodes response bodies."""
+
+    def dumps(self, value: Any) -> bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+class StdlibJsonCodec:
+    def dumps(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError(
+                "orjson is required for the orjson codec. "
+                "Install it with `pip install cube-http-client[orjson]`"
+            ) from e
+        self._orjson = orjson
+
+    def dumps(self, value: Any) -> bytes:
+        return self._orjson.dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec:
+    def __init__(self) -> None:
+        try:
+            import msgspec
+        except ImportError as e:
+            raise ImportError(
+                "msgspec is required for the msgspec codec. "
+                "Install it with `pip install cube-http-client[msgspec]`"
+            ) from e
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any) -> bytes:
+        return self._encoder.encode(value)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+def resolve_codec(codec: JsonCodecName | JsonCodec | None) -> JsonCodec | None:
+    """Turn the `json_codec` client option into a codec instance."""
+    if codec is None or isinstance(codec, JsonCodec):
+        return codec
+    if codec == "stdlib":
+        return StdlibJsonCodec()
+    if codec == "orjson":
+        return OrjsonCodec()
+    if codec == "msgspec":
+        return MsgspecCodec()
+    if codec == "auto":
+        for codec_class in (OrjsonCodec, MsgspecCodec):
+            try:
+                return codec_class()
+            except ImportError:
+                continue
+        return StdlibJsonCodec()
+    raise ValueError(f"Unknown JSON codec: {codec!r}")
@@ -0,0 +1,154 @@
+import codecs
+import json
+from typing import Any, Generator, Iterator, Literal, Union
+
+ResultStart = tuple[Literal["result_start"], int, dict[str, Any]]
+Row = tuple[Literal["row"], int, Any]
+ResultEnd = tuple[Literal["result"], int, dict[str, Any]]
+ResponseEnd = tuple[Literal["response"], dict[str, Any]]
+Event = Union[ResultStart, Row, ResultEnd, ResponseEnd]
+
+_NEED_DATA = object()
+_WHITESPACE = " \t\n\r"
+
+_Parse = Generator[Any, None, Any]
+
+
+class LoadResponseParser:
+    """
+    Incremental parser for `/v1/load` response bodies.
+
+    Bytes are pushed with `feed` and `events` yields what they complete: a
+    `result_start` event with the result fields seen before its `data`,
+    one `row` event per item of `data`, a `result` event with the remaining
+    fields and a final `response` event with the top-level fields. Only the
+    row being decoded is held in memory, never the whole `data` array.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._parser = self._parse()
+
+    def feed(self, chunk: bytes, final: bool = False) -> None:
+        self._buf = self._buf[self._pos :] + self._decoder.decode(chunk, final)
+        self._pos = 0
+        self._eof = final
+
+    def events(self) -> Iterator[Event]:
+        """Yield the events completed by the data fed so far."""
+        for event in self._parser:
+            if event is _NEED_DATA:
+                return
+            yield event
+
+    def _error(self, message: str) -> ValueError:
+        return ValueError(f"Invalid load response: {message} at {self._pos}")
+
+    def _peek(self) -> _Parse:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            while (
+                self._pos < len(self._buf)
+                and self._buf[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if self._eof:
+                raise self._error("unexpected end of body")
+            yield _NEED_DATA
+
+    def _expect(self, char: str) -> _Parse:
+        if (yield from self._peek()) != char:
+            raise self._error(f"expected {char!r}")
+        self._pos += 1
+
+    def _value(self) -> _Parse:
+        yield from self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                yield _NEED_DATA
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buf) and not self._eof:
+                yield _NEED_DATA
+                continue
+            self._pos = end
+            return value
+
+    def _members(self) -> _Parse:
+        """Yield the keys of an object, leaving the position at each value."""
+        yield from self._expect("{")
+        if (yield from self._peek()) == "}":
+            self._pos += 1
+            return
+        while True:
+            key = yield from self._value()
+            yield from self._expect(":")
+            yield key
+            char = yield from self._peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise self._error("expected ',' or '}'")
+
+    def _items(self) -> _Parse:
+        """Yield once per array item, leaving the position at each item."""
+        yield from self._expect("[")
+        if (yield from self._peek()) == "]":
+            self._pos += 1
+            return
+        while True:
+            yield None
+            char = yield from self._peek()
+            self._pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise self._error("expected ',' or ']'")
+
+    def _parse(self) -> _Parse:
+        top: dict[str, Any] = {}
+        for key in self._members():
+            if key is _NEED_DATA:
+                yield key
+            elif key == "results":
+                yield from self._results()
+            else:
+                top[key] = yield from self._value()
+        yield "response", top
+
+    def _results(self) -> _Parse:
+        index = 0
+        for item in self._items():
+            if item is _NEED_DATA:
+                yield item
+                continue
+            yield from self._result(index)
+            index += 1
+
+    def _result(self, index: int) -> _Parse:
+        result: dict[str, Any] = {}
+        for key in self._members():
+            if key is _NEED_DATA:
+                yield key
+                continue
+            if key != "data":
+                result[key] = yield from self._value()
+                continue
+            yield "result_start", index, dict(result)
+            for item in self._items():
+                if item is _NEED_DATA:
+                    yield item
+                    continue
+                yield "row", index, (yield from self._value())
+        yield "result", index, result
@@ -1,18 +1,49 @@
+import asyncio
+import contextlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
-from typing import Any, Generic, Mapping, TypedDict, TypeVar, cast
+from typing import Any, Generic, Mapping, Sequence, TypedDict, TypeVar, cast
 
 import httpx
 from typing_extensions import NotRequired
 
+from ._balancing import (
+    AsyncLoadBalancingTransport,
+    EndpointPool,
+    LoadBalancingOptions,
+    LoadBalancingTransport,
+)
+from ._json import JsonCodec, JsonCodecName
+from .routes._batching import LoadBatchOptions
+from .routes._cache import LoadCacheOptions, MetaCacheOptions
+from .routes._circuit import CircuitBreakerOptions
+from .routes._compression import CompressionOptions
+from .routes._hedging import HedgeOptions
+from .routes._limiter import AdaptiveConcurrencyOptions
+from .routes._polling import ContinueWaitOptions
+from .routes._retry import RetryOptions
 from .routes.v1 import AsyncV1Routes, SyncV1Routes
+from .types._base import DecodeOptions
+
+
+class PoolLimitsOptions(TypedDict, total=False):
+    max_connections: NotRequired[int | None]
+    """Maximum number of open connections, None for no limit. Defaults to 100"""
+
+    max_keepalive_connections: NotRequired[int | None]
+    """Maximum number of idle connections kept open, None for no limit. Defaults to 20"""
+
+    keepalive_expiry: NotRequired[float | None]
+    """Seconds an idle connection is kept open. Defaults to 5.0"""
 
 
 class BaseClientOptions(TypedDict, total=False):
     token: str
     """API token used to authorize requests and determine SQL database you're accessing"""
 
-    url: str
-    """Deployment base URL"""
+    url: str | list[str]
+    """Deployment base URL, or base URLs of several API instances to balance requests across"""
 
     timeout: NotRequired[float | httpx.Timeout]
     """Timeout configuration to use when sending requests"""
@@ -23,6 +54,57 @@ class BaseClientOptions(TypedDict, total=False):
     default_headers: NotRequired[Mapping[str, str]]
     """Default headers to add to every request"""
 
+    http2: NotRequired[bool]
+    """Negotiate HTTP/2 to multiplex concurrent requests over a few connections. Requires the `http2` extra. Defaults to False"""
+
+    limits: NotRequired[PoolLimitsOptions | httpx.Limits]
+    """Connection pool limits. Defaults to 100 connections, 20 of them kept alive for 5 seconds"""
+
+    socket_options: NotRequired[Sequence[tuple[int, int, int]]]
+    """Options set on every new socket, e.g. `(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)`. Defaults to None"""
+
+    retry: NotRequired[RetryOptions]
+    """Retry requests failing with transient status codes or transport errors, with backoff. Disabled by default"""
+
+    circuit_breaker: NotRequired[CircuitBreakerOptions]
+    """Fail fast with `CircuitOpenError` while the deployment keeps failing or responding slowly. Disabled by default"""
+
+    continue_wait: NotRequired[ContinueWaitOptions]
+    """Poll `/v1/load` and `/v1/sql` while Cube answers `Continue wait`. Disabled by default"""
+
+    meta_cache: NotRequired[MetaCacheOptions]
+    """Cache parsed `/v1/meta` responses with a TTL and ETag revalidation. Disabled by default"""
+
+    load_cache: NotRequired[LoadCacheOptions]
+    """Cache parsed `/v1/load` responses in memory, keyed by the canonical query. Disabled by default"""
+
+    coalesce_requests: NotRequired[bool]
+    """Share one HTTP call and parsed response between identical `/v1/load` and `/v1/sql` requests in flight at the same time. Defaults to False"""
+
+    decode: NotRequired[DecodeOptions]
+    """Default options for decoding `/v1/load` responses, overridable per call"""
+
+    compression: NotRequired[CompressionOptions]
+    """Compress large request bodies with gzip or zstd. Disabled by default"""
+
+    json_codec: NotRequired[JsonCodecName | JsonCodec]
+    """JSON codec for request and response bodies. `auto` picks orjson or msgspec when installed. Defaults to httpx's stdlib handling"""
+
+    max_concurrency: NotRequired[int]
+    """Maximum number of requests in flight at once across the client. Defaults to None for no limit"""
+
+    hedging: NotRequired[HedgeOptions]
+    """Send a duplicate `/v1/load` or `/v1/meta` request on an `AsyncClient` when the first is slower than usual, keeping the first response. Disabled by default"""
+
+    adaptive_concurrency: NotRequired[AdaptiveConcurrencyOptions]
+    """Limit requests in flight with a limit that grows while Cube answers fast and shrinks on overload, latency spikes or errors. Disabled by default"""
+
+    load_balancing: NotRequired[LoadBalancingOptions]
+    """How requests are spread when `url` lists several base URLs. Defaults to the least outstanding requests with failover"""
+
+    load_batching: NotRequired[LoadBatchOptions]
+    """Send `/v1/load` queries issued within a short window on an `AsyncClient` as one multi-query request. Disabled by default"""
+
 
 class ClientOptions(BaseClientOptions):
     http_client: NotRequired[httpx.Client]
@@ -38,6 +120,16 @@ ClientOptionsLike = ClientOptions | dict[str, Any]
 AsyncClientOptionsLike = AsyncClientOptions | dict[str, Any]
 
 
+_DEFAULT_LIMITS: PoolLimitsOptions = {
+    "max_connections": 100,
+    "max_keepalive_connections": 20,
+    "keepalive_expiry": 5.0,
+}
+
+# Options configuring the transport, which a custom HTTP client brings itself
+_TRANSPORT_OPTIONS = ("http2", "limits", "socket_options")
+
+
 def _extract_token_from_headers(headers: httpx.Headers) -> str | None:
     auth_header = headers.get("authorization")
     if auth_header and auth_header.startswith("Bearer "):
@@ -71,6 +163,7 @@ class BaseClient(Generic[_C, _T, _R]):
     """Base class with shared logic for both sync and async clients."""
 
     _http_client: _C
+    _options: dict[str, Any]
 
     def __init__(
         self,
@@ -82,6 +175,16 @@ class BaseClient(Generic[_C, _T, _R]):
         http_client = options.get("http_client")
 
         if http_client:
+            if isinstance(options.get("url"), list):
+                raise ValueError(
+                    "Several base URLs can only be used when not using a custom HTTP client"
+                )
+            if transport_options := [
+                o for o in _TRANSPORT_OPTIONS if o in options
+            ]:
+                raise ValueError(
+                    f"{', '.join(transport_options)} can only be set when not using a custom HTTP client"
+                )
             # Use provided client with merged options
             self._setup_with_custom_client(options, http_client)
         else:
@@ -99,7 +202,8 @@ class BaseClient(Generic[_C, _T, _R]):
         # Validate required options
         self._validate_required_options(options, custom_client=True)
 
-        # Store the custom client
+        # Store the custom client and options
+        self._options = options
         self._http_client = cast(_C, http_client)
 
         # Update client configuration as needed
@@ -114,16 +218,46 @@ class BaseClient(Generic[_C, _T, _R]):
         # Validate required options when creating a new client
         self._validate_required_options(options, custom_client=False)
 
+        # Store options for the routes
+        self._options = options
+
         # Create standard headers
         headers = self._create_headers(options)
 
-        # Create a new client instance
-        self._http_client = client_class(
-            base_url=options.get("url", ""),
-            headers=headers,
-            timeout=options.get("timeout"),
-            transport=transport_class(retries=options.get("max_retries", 0)),  # type: ignore
+        # Create a new client instance, balanced over several URLs if given
+        url: str | list[str] = options.get("url", "")
+        pool: EndpointPool | None = None
+        if isinstance(url, list):
+            pool = EndpointPool(url, options.get("load_balancing", {}))
+            url = url[0]
+        transport = transport_class(
+            retries=options.get("max_retries", 0),
+            http2=options.get("http2", False),
+            limits=self._create_limits(options),
+            socket_options=options.get("socket_options"),
         )
+        if isinstance(transport, httpx.AsyncHTTPTransport):
+            async_transport: httpx.AsyncBaseTransport = transport
+            if pool is not None:
+                async_transport = AsyncLoadBalancingTransport(transport, pool)
+            assert issubclass(client_class, httpx.AsyncClient)
+            self._http_client = client_class(
+                base_url=url,
+                headers=headers,
+                timeout=options.get("timeout"),
+                transport=async_transport,
+            )
+        else:
+            sync_transport: httpx.BaseTransport = transport
+            if pool is not None:
+                sync_transport = LoadBalancingTransport(transport, pool)
+            assert issubclass(client_class, httpx.Client)
+            self._http_client = client_class(
+                base_url=url,
+                headers=headers,
+                timeout=options.get("timeout"),
+                transport=sync_transport,
+            )
 
     def _validate_required_options(
         self,
@@ -148,6 +282,22 @@ class BaseClient(Generic[_C, _T, _R]):
             )
             raise ValueError(f"API token must be provided {source}")
 
+    def _warmup_size(self, n_connections: int) -> int:
+        # Requests beyond the pool size would wait for a connection held open
+        # by the warmup itself, so open at most `max_connections`
+        if self._options.get("http_client") is not None:
+            return n_connections
+        max_connections = self._create_limits(self._options).max_connections
+        if max_connections is None:
+            return n_connections
+        return min(n_connections, max_connections)
+
+    def _create_limits(self, options: dict[str, Any]) -> httpx.Limits:
+        limits = options.get("limits", {})
+        if isinstance(limits, httpx.Limits):
+            return limits
+        return httpx.Limits(**(_DEFAULT_LIMITS | limits))
+
     def _create_headers(self, options: dict[str, Any]) -> dict[str, str]:
         # Create standard headers with authorization and content type
         headers = {
@@ -191,7 +341,12 @@ class Client(BaseClient[httpx.Client, httpx.HTTPTransport, SyncV1Routes]):
     """Synchronous HTTP client for the Cube.dev REST API."""
 
     def __init__(self, options: ClientOptionsLike) -> None:
+        if options.get("meta_cache", {}).get("stale_while_revalidate"):
+            raise ValueError(
+                "meta_cache stale_while_revalidate can only be used with an AsyncClient"
+            )
         super().__init__(dict(options), httpx.Client, httpx.HTTPTransport)
+        self._keepalive: tuple[threading.Thread, threading.Event] | None = None
 
     def __enter__(self) -> "Client":
         return self
@@ -206,15 +361,102 @@ class Client(BaseClient[httpx.Client, httpx.HTTPTransport, SyncV1Routes]):
 
     def close(self) -> None:
         """Close the underlying HTTP client."""
+        self._stop_keepalive()
         self.http_client.close()
 
+    def warmup(
+        self,
+        n_connections: int = 1,
+        *,
+        path: str = "/readyz",
+        keepalive: float | None = None,
+    ) -> int:
+        """
+        Open pooled connections before the first queries need them.
+
+        Holds `n_connections` requests to Cube's readiness endpoint open at
+        once, so each one establishes its own connection, handshakes
+        included, and leaves it in the pool. Failed requests are not raised.
+
+        Args:
+            n_connections: Number of connections to open, at most the pool's `max_connections`.
+                           Nothing is sent if 0 or less
+            path: Path requested on each connection, from the root of the deployment
+            keepalive: Optional interval in seconds at which to repeat the warmup until
+                       the client is closed, so idle connections are not dropped. Should be
+                       shorter than the pool's `keepalive_expiry`
+
+        Returns:
+            The number of requests that got a response
+        """
+        n_open = self._warmup_size(n_connections)
+        if n_open <= 0:
+            return 0
+        url = self.http_client.base_url.join(path)
+        opened = self._open_connections(url, n_open)
+        if keepalive is not None:
+            self._stop_keepalive()
+            stop = threading.Event()
+            thread = threading.Thread(
+                target=self._run_keepalive,
+                args=(url, n_open, keepalive, stop),
+                name="cube-http-keepalive",
+                daemon=True,
+            )
+            self._keepalive = thread, stop
+            thread.start()
+        return opened
+
+    def _open_connections(self, url: httpx.URL, n_connections: int) -> int:
+        barrier = threading.Barrier(n_connections)
+
+        def open_connection(_: int) -> bool:
+            try:
+                res = self.http_client.send(
+                    self.http_client.build_request("GET", url), stream=True
+                )
+            except httpx.HTTPError:
+                res = None
+            try:
+                # Keep the connection busy until all of them are open
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                pass
+            finally:
+                if res is not None:
+                    # An unread body would close the connection instead
+                    with contextlib.suppress(httpx.HTTPError):
+                        res.read()
+                    res.close()
+            return res is not None
+
+        with ThreadPoolExecutor(max_workers=n_connections) as pool:
+            return sum(pool.map(open_connection, range(n_connections)))
+
+    def _run_keepalive(
+        self,
+        url: httpx.URL,
+        n_connections: int,
+        interval: float,
+        stop: threading.Event,
+    ) -> None:
+        while not stop.wait(interval):
+            self._open_connections(url, n_connections)
+
+    def _stop_keepalive(self) -> None:
+        if self._keepalive is not None:
+            thread, stop = self._keepalive
+            stop.set()
+            thread.join()
+            self._keepalive = None
+
     @property
     def http_client(self) -> httpx.Client:
         return self._http_client
 
     @cached_property
     def v1(self) -> SyncV1Routes:
-        return SyncV1Routes(self.http_client)
+        return SyncV1Routes(self.http_client, self._options)
 
 
 class AsyncClient(
@@ -226,6 +468,7 @@ class AsyncClient(
         super().__init__(
             dict(options), httpx.AsyncClient, httpx.AsyncHTTPTransport
         )
+        self._keepalive: asyncio.Task[None] | None = None
 
     async def __aenter__(self) -> "AsyncClient":
         return self
@@ -240,12 +483,87 @@ class AsyncClient(
 
     async def close(self) -> None:
         """Close the underlying HTTP client."""
+        await self._stop_keepalive()
+        if "v1" in self.__dict__:
+            await self.v1.aclose()
         await self.http_client.aclose()
 
+    async def warmup(
+        self,
+        n_connections: int = 1,
+        *,
+        path: str = "/readyz",
+        keepalive: float | None = None,
+    ) -> int:
+        """
+        Open pooled connections before the first queries need them.
+
+        Holds `n_connections` requests to Cube's readiness endpoint open at
+        once, so each one establishes its own connection, handshakes
+        included, and leaves it in the pool. Failed requests are not raised.
+
+        Args:
+            n_connections: Number of connections to open, at most the pool's `max_connections`.
+                           Nothing is sent if 0 or less
+            path: Path requested on each connection, from the root of the deployment
+            keepalive: Optional interval in seconds at which to repeat the warmup until
+                       the client is closed, so idle connections are not dropped. Should be
+                       shorter than the pool's `keepalive_expiry`
+
+        Returns:
+            The number of requests that got a response
+        """
+        n_open = self._warmup_size(n_connections)
+        if n_open <= 0:
+            return 0
+        url = self.http_client.base_url.join(path)
+        opened = await self._open_connections(url, n_open)
+        if keepalive is not None:
+            await self._stop_keepalive()
+            self._keepalive = asyncio.create_task(
+                self._run_keepalive(url, n_open, keepalive)
+            )
+        return opened
+
+    async def _open_connections(self, url: httpx.URL, n_connections: int) -> int:
+        async def open_connection() -> httpx.Response | None:
+            try:
+                return await self.http_client.send(
+                    self.http_client.build_request("GET", url), stream=True
+                )
+            except httpx.HTTPError:
+                return None
+
+        # Keep every connection busy until all of them are open
+        responses = await asyncio.gather(
+            *(open_connection() for _ in range(n_connections))
+        )
+        for res in responses:
+            if res is not None:
+                # An unread body would close the connection instead
+                with contextlib.suppress(httpx.HTTPError):
+                    await res.aread()
+                await res.aclose()
+        return sum(res is not None for res in responses)
+
+    async def _run_keepalive(
+        self, url: httpx.URL, n_connections: int, interval: float
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self._open_connections(url, n_connections)
+
+    async def _stop_keepalive(self) -> None:
+        if self._keepalive is not None:
+            self._keepalive.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._keepalive
+            self._keepalive = None
+
     @property
     def http_client(self) -> httpx.AsyncClient:
         return self._http_client
 
     @cached_property
     def v1(self) -> AsyncV1Routes:
-        return AsyncV1Routes(self.http_client)
+        return AsyncV1Routes(self.http_client, self._options)
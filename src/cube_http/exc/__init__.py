@@ -1,3 +1,4 @@
+from .circuit import CircuitOpenError
 from .v1 import V1LoadError, V1MetaError, V1SqlError
 
-__all__ = ["V1LoadError", "V1MetaError", "V1SqlError"]
+__all__ = ["CircuitOpenError", "V1LoadError", "V1MetaError", "V1SqlError"]
@@ -0,0 +1,12 @@
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+    def __init__(self, retry_after: float) -> None:
+        self.retry_after = retry_after
+        super().__init__(str(self))
+
+    def __str__(self) -> str:
+        return (
+            "Circuit breaker is open after repeated failures. "
+            f"Retry in {self.retry_after:.1f}s"
+        )
@@ -1,11 +1,100 @@
-from typing import Any, Literal, Mapping
+import asyncio
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Awaitable, Callable, Hashable, Literal, Mapping, TypeVar
 
 import httpx
 
+from .._canonical import canonical_key
+from .._json import StdlibJsonCodec, resolve_codec
+from ..types._base import POLLS_EXTENSION, RETRIES_EXTENSION
+from ._circuit import CircuitBreaker
+from ._compression import BodyCompressor
+from ._hedging import Hedger, is_hedge_success
+from ._limiter import (
+    AdaptiveConcurrencyOptions,
+    AdaptiveLimiter,
+    AsyncAdaptiveLimiter,
+    is_overload,
+)
+from ._polling import PollSchedule, is_continue_wait, is_small
+from ._retry import RetrySchedule
+from ._singleflight import AsyncSingleFlight, SyncSingleFlight
+
+_R = TypeVar("_R")
+
+
+def _limiter_options(
+    options: AdaptiveConcurrencyOptions, max_concurrency: int | None
+) -> AdaptiveConcurrencyOptions:
+    # `max_concurrency` stays a hard cap when both options are set
+    if not max_concurrency:
+        return options
+    max_limit = options.get("max_limit", max_concurrency)
+    return options | {"max_limit": min(max_limit, max_concurrency)}
+
 
 class SyncRoute:
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(
+        self,
+        client: httpx.Client,
+        options: Mapping[str, Any] | None = None,
+    ) -> None:
         self._client = client
+        self._options = options or {}
+        self._codec = resolve_codec(self._options.get("json_codec"))
+        compression = self._options.get("compression")
+        self._compressor = (
+            BodyCompressor(compression) if compression is not None else None
+        )
+        self._single_flight = (
+            SyncSingleFlight()
+            if self._options.get("coalesce_requests")
+            else None
+        )
+        max_concurrency = self._options.get("max_concurrency")
+        adaptive = self._options.get("adaptive_concurrency")
+        self._limiter = (
+            AdaptiveLimiter(_limiter_options(adaptive, max_concurrency))
+            if adaptive is not None
+            else None
+        )
+        self._concurrency = (
+            threading.BoundedSemaphore(max_concurrency)
+            if max_concurrency and self._limiter is None
+            else None
+        )
+        circuit_breaker = self._options.get("circuit_breaker")
+        self._circuit = (
+            CircuitBreaker(circuit_breaker)
+            if circuit_breaker is not None
+            else None
+        )
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """Circuit breaker guarding the deployment, if enabled through `circuit_breaker`"""
+        return self._circuit
+
+    @property
+    def concurrency_limiter(self) -> AdaptiveLimiter | None:
+        """Adaptive limit on requests in flight, if enabled through `adaptive_concurrency`"""
+        return self._limiter
+
+    def _coalesce(
+        self,
+        route: str,
+        request: Mapping[str, Any],
+        variant: Hashable,
+        fn: Callable[[], _R],
+        request_key: str | None = None,
+    ) -> _R:
+        """Share one call between identical requests that are in flight together."""
+        if self._single_flight is None:
+            return fn()
+        key = route, request_key or canonical_key(request), variant
+        return self._single_flight.do(key, fn)
 
     def _build_request(
         self,
@@ -14,27 +103,216 @@ class SyncRoute:
         *,
         params: Mapping[str, Any] | None = None,
         body: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        content: bytes | None = None,
     ) -> httpx.Request:
+        if content is not None:
+            # Already encoded, and compressed if `headers` say so
+            return self._client.build_request(
+                method,
+                route,
+                params=params,
+                content=content,
+                headers={"Content-Type": "application/json", **(headers or {})},
+            )
+        if body is None or (self._codec is None and self._compressor is None):
+            return self._client.build_request(
+                method, route, params=params, json=body, headers=headers
+            )
+        content = (self._codec or StdlibJsonCodec()).dumps(body)
+        encoding: dict[str, str] = {}
+        if self._compressor is not None:
+            content, encoding = self._compressor.compress(content)
         return self._client.build_request(
-            method, route, params=params, json=body
+            method,
+            route,
+            params=params,
+            content=content,
+            headers={
+                "Content-Type": "application/json",
+                **encoding,
+                **(headers or {}),
+            },
         )
 
+    def _send(
+        self, req: httpx.Request, *, poll: bool = False, stream: bool = False
+    ) -> httpx.Response:
+        res = self._send_once(req, stream=stream)
+        continue_wait = self._options.get("continue_wait")
+        if not poll or continue_wait is None:
+            return res
+
+        # The request is already built, so re-polling only re-sends it
+        schedule = PollSchedule(continue_wait)
+        retries = res.extensions.get(RETRIES_EXTENSION, 0)
+        while is_continue_wait(res):
+            delay = schedule.next_delay()
+            if delay is None:
+                break
+            res.close()
+            time.sleep(delay)
+            res = self._send_once(req, stream=stream)
+            retries += res.extensions.get(RETRIES_EXTENSION, 0)
+
+        res.extensions[POLLS_EXTENSION] = schedule.polls
+        res.extensions[RETRIES_EXTENSION] = retries
+        return res
+
+    def _send_once(self, req: httpx.Request, *, stream: bool) -> httpx.Response:
+        retry = self._options.get("retry")
+        if retry is None:
+            return self._exchange(req, stream=stream)
+
+        schedule = RetrySchedule(retry, req)
+        while True:
+            try:
+                res = self._exchange(req, stream=stream)
+            except httpx.TransportError as e:
+                delay = schedule.next_delay(error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = schedule.next_delay(res)
+                if delay is None:
+                    res.extensions[RETRIES_EXTENSION] = schedule.retries
+                    return res
+                res.close()
+            time.sleep(delay)
+
+    def _exchange(self, req: httpx.Request, *, stream: bool) -> httpx.Response:
+        if self._limiter is None:
+            with self._concurrency or nullcontext():
+                return self._guarded_send(req, stream=stream)
+
+        self._limiter.acquire()
+        start = time.monotonic()
+        try:
+            res = self._guarded_send(req, stream=stream)
+        except httpx.TransportError:
+            self._limiter.release(time.monotonic() - start, overloaded=True)
+            raise
+        except BaseException:
+            self._limiter.release(None)
+            raise
+        self._limiter.release(time.monotonic() - start, is_overload(res))
+        return res
+
+    def _guarded_send(
+        self, req: httpx.Request, *, stream: bool
+    ) -> httpx.Response:
+        if self._circuit is None:
+            res = self._client.send(req, stream=stream)
+        else:
+            token = self._circuit.before_request()
+            start = time.monotonic()
+            try:
+                res = self._client.send(req, stream=stream)
+            except httpx.TransportError:
+                self._circuit.record(token, True, time.monotonic() - start)
+                raise
+            except BaseException:
+                self._circuit.release(token)
+                raise
+            self._circuit.record(
+                token, self._circuit.is_failure(res), time.monotonic() - start
+            )
+        if stream and is_small(res):
+            res.read()
+        return res
+
     def _get(
-        self, route: str, params: Mapping[str, Any] | None = None
+        self,
+        route: str,
+        params: Mapping[str, Any] | None = None,
+        *,
+        headers: Mapping[str, str] | None = None,
     ) -> httpx.Response:
-        req = self._build_request("GET", route, params=params)
-        return self._client.send(req)
+        req = self._build_request("GET", route, params=params, headers=headers)
+        return self._send(req)
 
     def _post(
-        self, route: str, body: Mapping[str, Any] | None = None
+        self,
+        route: str,
+        body: Mapping[str, Any] | None = None,
+        *,
+        poll: bool = False,
+        content: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
     ) -> httpx.Response:
-        req = self._build_request("POST", route, body=body)
-        return self._client.send(req)
+        req = self._build_request(
+            "POST", route, body=body, content=content, headers=headers
+        )
+        return self._send(req, poll=poll)
 
 
 class AsyncRoute:
-    def __init__(self, client: httpx.AsyncClient) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        options: Mapping[str, Any] | None = None,
+    ) -> None:
         self._client = client
+        self._options = options or {}
+        self._codec = resolve_codec(self._options.get("json_codec"))
+        compression = self._options.get("compression")
+        self._compressor = (
+            BodyCompressor(compression) if compression is not None else None
+        )
+        self._single_flight = (
+            AsyncSingleFlight()
+            if self._options.get("coalesce_requests")
+            else None
+        )
+        max_concurrency = self._options.get("max_concurrency")
+        adaptive = self._options.get("adaptive_concurrency")
+        self._limiter = (
+            AsyncAdaptiveLimiter(_limiter_options(adaptive, max_concurrency))
+            if adaptive is not None
+            else None
+        )
+        self._concurrency = (
+            asyncio.Semaphore(max_concurrency)
+            if max_concurrency and self._limiter is None
+            else None
+        )
+        circuit_breaker = self._options.get("circuit_breaker")
+        self._circuit = (
+            CircuitBreaker(circuit_breaker)
+            if circuit_breaker is not None
+            else None
+        )
+        hedging = self._options.get("hedging")
+        self._hedger = Hedger(hedging) if hedging is not None else None
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """Circuit breaker guarding the deployment, if enabled through `circuit_breaker`"""
+        return self._circuit
+
+    @property
+    def concurrency_limiter(self) -> AsyncAdaptiveLimiter | None:
+        """Adaptive limit on requests in flight, if enabled through `adaptive_concurrency`"""
+        return self._limiter
+
+    @property
+    def hedger(self) -> Hedger | None:
+        """Latency tracker deciding when to hedge, if enabled through `hedging`"""
+        return self._hedger
+
+    async def _coalesce(
+        self,
+        route: str,
+        request: Mapping[str, Any],
+        variant: Hashable,
+        fn: Callable[[], Awaitable[_R]],
+        request_key: str | None = None,
+    ) -> _R:
+        """Share one call between identical requests that are in flight together."""
+        if self._single_flight is None:
+            return await fn()
+        key = route, request_key or canonical_key(request), variant
+        return await self._single_flight.do(key, fn)
 
     def _build_request(
         self,
@@ -43,19 +321,167 @@ class AsyncRoute:
         *,
         params: Mapping[str, Any] | None = None,
         body: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        content: bytes | None = None,
     ) -> httpx.Request:
+        if content is not None:
+            # Already encoded, and compressed if `headers` say so
+            return self._client.build_request(
+                method,
+                route,
+                params=params,
+                content=content,
+                headers={"Content-Type": "application/json", **(headers or {})},
+            )
+        if body is None or (self._codec is None and self._compressor is None):
+            return self._client.build_request(
+                method, route, params=params, json=body, headers=headers
+            )
+        content = (self._codec or StdlibJsonCodec()).dumps(body)
+        encoding: dict[str, str] = {}
+        if self._compressor is not None:
+            content, encoding = self._compressor.compress(content)
         return self._client.build_request(
-            method, route, params=params, json=body
+            method,
+            route,
+            params=params,
+            content=content,
+            headers={
+                "Content-Type": "application/json",
+                **encoding,
+                **(headers or {}),
+            },
+        )
+
+    async def _send(
+        self,
+        req: httpx.Request,
+        *,
+        poll: bool = False,
+        stream: bool = False,
+        hedge: bool = False,
+    ) -> httpx.Response:
+        res = await self._send_hedged(req, stream=stream, hedge=hedge)
+        continue_wait = self._options.get("continue_wait")
+        if not poll or continue_wait is None:
+            return res
+
+        # The request is already built, so re-polling only re-sends it
+        schedule = PollSchedule(continue_wait)
+        retries = res.extensions.get(RETRIES_EXTENSION, 0)
+        while is_continue_wait(res):
+            delay = schedule.next_delay()
+            if delay is None:
+                break
+            await res.aclose()
+            await asyncio.sleep(delay)
+            res = await self._send_hedged(req, stream=stream, hedge=hedge)
+            retries += res.extensions.get(RETRIES_EXTENSION, 0)
+
+        res.extensions[POLLS_EXTENSION] = schedule.polls
+        res.extensions[RETRIES_EXTENSION] = retries
+        return res
+
+    async def _send_hedged(
+        self, req: httpx.Request, *, stream: bool, hedge: bool
+    ) -> httpx.Response:
+        if not hedge or self._hedger is None:
+            return await self._send_once(req, stream=stream)
+        # Idempotent reads only: a slow attempt races a duplicate of itself
+        return await self._hedger.run(
+            req.url.path,
+            lambda: self._send_once(req, stream=stream),
+            is_hedge_success,
         )
 
+    async def _send_once(
+        self, req: httpx.Request, *, stream: bool
+    ) -> httpx.Response:
+        retry = self._options.get("retry")
+        if retry is None:
+            return await self._exchange(req, stream=stream)
+
+        schedule = RetrySchedule(retry, req)
+        while True:
+            try:
+                res = await self._exchange(req, stream=stream)
+            except httpx.TransportError as e:
+                delay = schedule.next_delay(error=e)
+                if delay is None:
+                    raise
+            else:
+                delay = schedule.next_delay(res)
+                if delay is None:
+                    res.extensions[RETRIES_EXTENSION] = schedule.retries
+                    return res
+                await res.aclose()
+            await asyncio.sleep(delay)
+
+    async def _exchange(
+        self, req: httpx.Request, *, stream: bool
+    ) -> httpx.Response:
+        if self._limiter is None:
+            async with self._concurrency or nullcontext():
+                return await self._guarded_send(req, stream=stream)
+
+        await self._limiter.acquire()
+        start = time.monotonic()
+        try:
+            res = await self._guarded_send(req, stream=stream)
+        except httpx.TransportError:
+            self._limiter.release(time.monotonic() - start, overloaded=True)
+            raise
+        except BaseException:
+            self._limiter.release(None)
+            raise
+        self._limiter.release(time.monotonic() - start, is_overload(res))
+        return res
+
+    async def _guarded_send(
+        self, req: httpx.Request, *, stream: bool
+    ) -> httpx.Response:
+        if self._circuit is None:
+            res = await self._client.send(req, stream=stream)
+        else:
+            token = self._circuit.before_request()
+            start = time.monotonic()
+            try:
+                res = await self._client.send(req, stream=stream)
+            except httpx.TransportError:
+                self._circuit.record(token, True, time.monotonic() - start)
+                raise
+            except BaseException:
+                self._circuit.release(token)
+                raise
+            self._circuit.record(
+                token, self._circuit.is_failure(res), time.monotonic() - start
+            )
+        if stream and is_small(res):
+            await res.aread()
+        return res
+
     async def _get(
-        self, route: str, params: Mapping[str, Any] | None = None
+        self,
+        route: str,
+        params: Mapping[str, Any] | None = None,
+        *,
+        headers: Mapping[str, str] | None = None,
+        hedge: bool = False,
     ) -> httpx.Response:
-        req = self._build_request("GET", route, params=params)
-        return await self._client.send(req)
+        req = self._build_request("GET", route, params=params, headers=headers)
+        return await self._send(req, hedge=hedge)
 
     async def _post(
-        self, route: str, body: Mapping[str, Any] | None = None
+        self,
+        route: str,
+        body: Mapping[str, Any] | None = None,
+        *,
+        poll: bool = False,
+        hedge: bool = False,
+        content: bytes | None = None,
+        headers: Mapping[str, str] | None = None,
     ) -> httpx.Response:
-        req = self._build_request("POST", route, body=body)
-        return await self._client.send(req)
+        req = self._build_request(
+            "POST", route, body=body, content=content, headers=headers
+        )
+        return await self._send(req, poll=poll, hedge=hedge)
@@ -0,0 +1,99 @@
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    TypedDict,
+    TypeVar,
+)
+
+from typing_extensions import NotRequired
+
+_I = TypeVar("_I")
+_R = TypeVar("_R")
+
+
+class LoadBatchOptions(TypedDict, total=False):
+    window: NotRequired[float]
+    """Seconds to wait for more queries before sending a batch. Defaults to 0.005"""
+
+    max_queries: NotRequired[int]
+    """Maximum number of queries in a single batch. Defaults to 50"""
+
+
+class _Batch:
+    def __init__(self) -> None:
+        self.items: list[tuple[Any, asyncio.Future[Any]]] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class AsyncBatcher(Generic[_I, _R]):
+    """
+    Collects items submitted within a short window and sends them together.
+
+    Items are only batched with items of the same key. `send` receives the
+    items of a batch and returns one outcome per item, either a value or the
+    exception to raise for that item.
+    """
+
+    def __init__(
+        self,
+        options: LoadBatchOptions,
+        send: Callable[[Hashable, list[_I]], Awaitable[list[Any]]],
+    ) -> None:
+        self._window = options.get("window", 0.005)
+        self._max_items = options.get("max_queries", 50)
+        self._send = send
+        self._open: dict[Hashable, _Batch] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, key: Hashable, item: _I) -> _R:
+        loop = asyncio.get_running_loop()
+        batch = self._open.get(key)
+        if batch is None:
+            batch = self._open[key] = _Batch()
+            batch.timer = loop.call_later(self._window, self._flush, key, batch)
+
+        future: asyncio.Future[_R] = loop.create_future()
+        batch.items.append((item, future))
+        if len(batch.items) >= self._max_items:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: Hashable, batch: _Batch) -> None:
+        if self._open.get(key) is not batch:
+            return
+        del self._open[key]
+        if batch.timer is not None:
+            batch.timer.cancel()
+        task = asyncio.ensure_future(self._run(key, batch))
+        # Keep a reference so the task is not garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: Hashable, batch: _Batch) -> None:
+        futures = [future for _, future in batch.items]
+        try:
+            outcomes = await self._send(key, [item for item, _ in batch.items])
+            if len(outcomes) != len(futures):
+                raise ValueError(
+                    f"Expected {len(futures)} batch outcomes, got {len(outcomes)}"
+                )
+        except BaseException as e:
+            outcomes = [e] * len(futures)
+            if not isinstance(e, Exception):
+                self._settle(futures, outcomes)
+                raise
+        self._settle(futures, outcomes)
+
+    @staticmethod
+    def _settle(futures: list[asyncio.Future[Any]], outcomes: list[Any]) -> None:
+        for future, outcome in zip(futures, outcomes, strict=True):
+            if future.done():
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
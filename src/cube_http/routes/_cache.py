@@ -0,0 +1,275 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Hashable, Iterable, Mapping, TypedDict
+
+from typing_extensions import NotRequired
+
+from .._canonical import request_queries
+from ..types.v1.load_response import V1LoadResponse
+
+
+class MetaCacheOptions(TypedDict, total=False):
+    ttl: NotRequired[float]
+    """Seconds a cached response is served without revalidation. Defaults to 300"""
+
+    stale_while_revalidate: NotRequired[bool]
+    """Serve expired responses while revalidating them in a background task. Only supported by `AsyncClient`. Defaults to False"""
+
+
+class LoadCacheOptions(TypedDict, total=False):
+    max_entries: NotRequired[int]
+    """Maximum number of cached results. Defaults to 256"""
+
+    max_bytes: NotRequired[int | None]
+    """Maximum summed size of the cached response bodies. Defaults to None for no limit"""
+
+    ttl: NotRequired[float | None]
+    """Seconds a result stays cached. Defaults to 60, or None with `refresh_keys`, to keep results until evicted"""
+
+    refresh_keys: NotRequired[bool]
+    """Invalidate results once Cube reports a newer `lastRefreshTime` for a cube they read. Defaults to False"""
+
+    probe_interval: NotRequired[float | None]
+    """With `refresh_keys`, seconds after which a cached result is revalidated with a `limit: 1` probe of the same query. Defaults to None for no probes"""
+
+
+@dataclass
+class _MetaEntry:
+    value: Any
+    etag: str | None
+    fetched_at: float
+
+
+class MetaCache:
+    """Parsed `/v1/meta` responses revalidated with the server's ETag."""
+
+    def __init__(self, options: MetaCacheOptions) -> None:
+        self.ttl = options.get("ttl", 300.0)
+        self.stale_while_revalidate = options.get(
+            "stale_while_revalidate", False
+        )
+        self._entries: dict[Hashable, _MetaEntry] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(params: Mapping[str, Any], response_model: type) -> Hashable:
+        return tuple(sorted(params.items())), response_model
+
+    def get(self, key: Hashable) -> _MetaEntry | None:
+        with self._lock:
+            return self._entries.get(key)
+
+    def is_fresh(self, entry: _MetaEntry) -> bool:
+        return time.monotonic() - entry.fetched_at < self.ttl
+
+    def store(self, key: Hashable, value: Any, etag: str | None) -> None:
+        with self._lock:
+            self._entries[key] = _MetaEntry(value, etag, time.monotonic())
+
+    def touch(self, key: Hashable) -> None:
+        """Mark an entry as fresh after the server confirmed it is unchanged."""
+        with self._lock:
+            if entry := self._entries.get(key):
+                entry.fetched_at = time.monotonic()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _parse_refresh_time(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _filter_members(filters: Iterable[Mapping[str, Any]]) -> Iterable[str]:
+    for item in filters:
+        if member := item.get("member"):
+            yield member
+        for logical in ("and", "or"):
+            yield from _filter_members(item.get(logical) or [])
+
+
+def query_cubes(query: Mapping[str, Any]) -> frozenset[str]:
+    """Names of the cubes and views a load query reads from."""
+    time_dimensions: list[Mapping[str, Any]] = query.get("timeDimensions") or []
+    members: list[Any] = [
+        *(query.get("measures") or []),
+        *(query.get("dimensions") or []),
+        *(query.get("segments") or []),
+        *(td["dimension"] for td in time_dimensions),
+        *_filter_members(query.get("filters") or []),
+    ]
+    return frozenset(
+        member.split(".", 1)[0]
+        for member in members
+        if isinstance(member, str) and "." in member
+    )
+
+
+@dataclass
+class RefreshState:
+    cubes: frozenset[str]
+    last_refresh: datetime | None
+    refresh_key_values: list[Any]
+    validated_at: float
+
+
+@dataclass
+class _LoadEntry:
+    value: Any
+    size: int
+    expires_at: float | None
+    refresh: RefreshState | None = None
+
+
+class LoadCache:
+    """LRU cache of parsed `/v1/load` responses bounded by count and bytes."""
+
+    def __init__(self, options: LoadCacheOptions) -> None:
+        self.max_entries = options.get("max_entries", 256)
+        self.max_bytes = options.get("max_bytes")
+        self.refresh_keys = options.get("refresh_keys", False)
+        self.probe_interval = options.get("probe_interval")
+        self.ttl = options.get("ttl", None if self.refresh_keys else 60.0)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries: OrderedDict[Hashable, _LoadEntry] = OrderedDict()
+        self._newest_refresh: dict[str, datetime] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and (
+                    entry.expires_at is None
+                    or entry.expires_at > time.monotonic()
+                )
+                and not self._is_outdated(entry.refresh)
+            ):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        size: int,
+        refresh: RefreshState | None = None,
+    ) -> None:
+        if refresh is not None:
+            self.observe(refresh)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires_at = (
+            time.monotonic() + self.ttl if self.ttl is not None else None
+        )
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _LoadEntry(value, size, expires_at, refresh)
+            self.size += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.size > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._newest_refresh.clear()
+            self.size = 0
+
+    def refresh_state(
+        self, request: Mapping[str, Any], response: V1LoadResponse
+    ) -> RefreshState | None:
+        """Collect the refresh information Cube reported for a response."""
+        if not self.refresh_keys:
+            return None
+        times = [
+            _parse_refresh_time(result.last_refresh_time)
+            for result in response.results
+        ]
+        known = [t for t in times if t is not None]
+        return RefreshState(
+            cubes=frozenset[str]().union(
+                *map(query_cubes, request_queries(request))
+            ),
+            last_refresh=min(known) if len(known) == len(times) else None,
+            refresh_key_values=[
+                result.refresh_key_values for result in response.results
+            ],
+            validated_at=time.monotonic(),
+        )
+
+    def observe(self, refresh: RefreshState) -> None:
+        """Record refresh times so results of sibling queries can be invalidated."""
+        if refresh.last_refresh is None:
+            return
+        with self._lock:
+            for cube in refresh.cubes:
+                newest = self._newest_refresh.get(cube)
+                if newest is None or newest < refresh.last_refresh:
+                    self._newest_refresh[cube] = refresh.last_refresh
+
+    def probe_due(self, key: Hashable | None) -> bool:
+        if self.probe_interval is None:
+            return False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refresh is None:
+                return False
+            elapsed = time.monotonic() - entry.refresh.validated_at
+            return elapsed >= self.probe_interval
+
+    def confirm(self, key: Hashable | None, probe: RefreshState | None) -> bool:
+        """Check a probe against a cached result, dropping it when outdated."""
+        if probe is None:
+            return False
+        self.observe(probe)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refresh is None:
+                return False
+            if (
+                entry.refresh.refresh_key_values == probe.refresh_key_values
+                and not self._is_outdated(entry.refresh)
+            ):
+                entry.refresh.validated_at = probe.validated_at
+                return True
+            self._remove(key)
+            return False
+
+    def _is_outdated(self, refresh: RefreshState | None) -> bool:
+        if refresh is None or refresh.last_refresh is None:
+            return False
+        last_refresh = refresh.last_refresh
+        return any(
+            newest > last_refresh
+            for cube in refresh.cubes
+            if (newest := self._newest_refresh.get(cube)) is not None
+        )
+
+    def _remove(self, key: Hashable) -> None:
+        self.size -= self._entries.pop(key).size
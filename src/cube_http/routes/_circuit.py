@@ -0,0 +1,152 @@
+import threading
+import time
+from collections import deque
+from typing import Collection, Literal, TypedDict
+
+import httpx
+from typing_extensions import NotRequired
+
+from ..exc import CircuitOpenError
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreakerOptions(TypedDict, total=False):
+    failure_rate: NotRequired[float]
+    """Share of failed requests in the window that opens the circuit. Defaults to 0.5"""
+
+    slow_call_duration: NotRequired[float | None]
+    """Seconds after which a request counts as slow. Defaults to None to ignore latency"""
+
+    slow_call_rate: NotRequired[float]
+    """Share of slow requests in the window that opens the circuit. Defaults to 0.5"""
+
+    window: NotRequired[int]
+    """Number of most recent requests the rates are computed over. Defaults to 20"""
+
+    min_calls: NotRequired[int]
+    """Number of requests in the window before the circuit can open. Defaults to 10"""
+
+    open_duration: NotRequired[float]
+    """Seconds to fail fast before letting probe requests through. Defaults to 30.0"""
+
+    half_open_probes: NotRequired[int]
+    """Probe requests that must succeed in a row to close the circuit. Defaults to 1"""
+
+    status_codes: NotRequired[Collection[int] | None]
+    """Response status codes counted as failures. Defaults to None for any 5xx"""
+
+
+class CircuitBreaker:
+    """
+    Fails fast while a Cube deployment keeps failing.
+
+    The circuit opens when the failure or slow-request rate over the recent
+    window crosses its threshold. After `open_duration` it half-opens and
+    lets probe requests through: their success closes the circuit again and
+    any failure reopens it.
+    """
+
+    def __init__(self, options: CircuitBreakerOptions) -> None:
+        self._options = options
+        self._failure_rate = options.get("failure_rate", 0.5)
+        self._slow_call_duration = options.get("slow_call_duration")
+        self._slow_call_rate = options.get("slow_call_rate", 0.5)
+        self._min_calls = options.get("min_calls", 10)
+        self._open_duration = options.get("open_duration", 30.0)
+        self._probes = options.get("half_open_probes", 1)
+        self._calls: deque[tuple[bool, bool]] = deque(
+            maxlen=options.get("window", 20)
+        )
+        self._state: CircuitState = "closed"
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+        # Bumped on every state change so outcomes of requests reserved in an
+        # earlier state are not mistaken for probes or closed-state calls
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            if self._state == "open" and self._remaining() <= 0:
+                return "half_open"
+            return self._state
+
+    def before_request(self) -> int:
+        """
+        Reserve a request, raising if the circuit does not let it through.
+
+        Returns:
+            The token to pass to `record` or `release` once the request ends
+
+        Raises:
+            CircuitOpenError: If the circuit is open or all probes are in flight
+        """
+        with self._lock:
+            if self._state == "open":
+                remaining = self._remaining()
+                if remaining > 0:
+                    raise CircuitOpenError(remaining)
+                self._state = "half_open"
+                self._generation += 1
+                self._probes_in_flight = self._probe_successes = 0
+            if self._state == "half_open":
+                if self._probes_in_flight >= self._probes:
+                    raise CircuitOpenError(0.0)
+                self._probes_in_flight += 1
+            return self._generation
+
+    def is_failure(self, res: httpx.Response) -> bool:
+        status_codes = self._options.get("status_codes")
+        if status_codes is None:
+            return res.status_code >= 500
+        return res.status_code in status_codes
+
+    def record(self, token: int, failed: bool, duration: float) -> None:
+        """Record the outcome of a request reserved with `before_request`."""
+        slow = (
+            self._slow_call_duration is not None
+            and duration >= self._slow_call_duration
+        )
+        with self._lock:
+            if token != self._generation:
+                return
+            if self._state == "half_open":
+                self._probes_in_flight -= 1
+                if failed or slow:
+                    self._open()
+                    return
+                self._probe_successes += 1
+                if self._probe_successes >= self._probes:
+                    self._state = "closed"
+                    self._generation += 1
+                    self._calls.clear()
+                return
+
+            self._calls.append((failed, slow))
+            if len(self._calls) < self._min_calls:
+                return
+            failures = sum(call[0] for call in self._calls) / len(self._calls)
+            slows = sum(call[1] for call in self._calls) / len(self._calls)
+            if failures >= self._failure_rate or (
+                self._slow_call_duration is not None
+                and slows >= self._slow_call_rate
+            ):
+                self._open()
+
+    def release(self, token: int) -> None:
+        """Release a reserved request that ended without an outcome, e.g. cancelled."""
+        with self._lock:
+            if token == self._generation and self._state == "half_open":
+                self._probes_in_flight -= 1
+
+    def _open(self) -> None:
+        self._state = "open"
+        self._generation += 1
+        self._opened_at = time.monotonic()
+        self._calls.clear()
+
+    def _remaining(self) -> float:
+        return self._opened_at + self._open_duration - time.monotonic()
@@ -0,0 +1,65 @@
+import zlib
+from typing import Callable, Literal, TypedDict
+
+from typing_extensions import NotRequired
+
+CompressionAlgorithm = Literal["gzip", "zstd"]
+
+
+class CompressionOptions(TypedDict, total=False):
+    algorithm: NotRequired[CompressionAlgorithm]
+    """Encoding of compressed request bodies. `zstd` needs the `zstd` extra and a server or proxy decoding it. Defaults to "gzip\""""
+
+    threshold: NotRequired[int]
+    """Size in bytes from which request bodies are compressed. Defaults to 1024"""
+
+    level: NotRequired[int | None]
+    """Compression level. Defaults to None for 6 with gzip and 3 with zstd"""
+
+
+def _zstd_compressor(level: int) -> Callable[[bytes], bytes]:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstandard is required for zstd compression. "
+            "Install it with `pip install cube-http-client[zstd]`"
+        ) from e
+
+    def compress(data: bytes) -> bytes:
+        # Compressor instances must not be shared between threads
+        return zstandard.ZstdCompressor(level=level).compress(data)
+
+    return compress
+
+
+def _gzip_compressor(level: int) -> Callable[[bytes], bytes]:
+    def compress(data: bytes) -> bytes:
+        # wbits=31 writes a gzip header and trailer around the deflate stream
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+        return compressor.compress(data) + compressor.flush()
+
+    return compress
+
+
+class BodyCompressor:
+    """Compresses request bodies above a size threshold."""
+
+    def __init__(self, options: CompressionOptions) -> None:
+        self.encoding = options.get("algorithm", "gzip")
+        self._threshold = options.get("threshold", 1024)
+        level = options.get("level")
+        # Compressors with the same key produce the same bodies
+        self.key = self.encoding, self._threshold, level
+        if self.encoding == "gzip":
+            self._compress = _gzip_compressor(6 if level is None else level)
+        elif self.encoding == "zstd":
+            self._compress = _zstd_compressor(3 if level is None else level)
+        else:
+            raise ValueError(f"Unknown compression algorithm: {self.encoding!r}")
+
+    def compress(self, content: bytes) -> tuple[bytes, dict[str, str]]:
+        """Return the body to send and the headers describing it."""
+        if len(content) < self._threshold:
+            return content, {}
+        return self._compress(content), {"Content-Encoding": self.encoding}
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, TypedDict, TypeVar
+
+import httpx
+from typing_extensions import NotRequired
+
+_R = TypeVar("_R")
+
+
+class HedgeOptions(TypedDict, total=False):
+    percentile: NotRequired[float]
+    """Percentile of recent latencies after which a duplicate request is sent. Defaults to 95.0"""
+
+    min_delay: NotRequired[float]
+    """Lower bound for the delay before hedging, in seconds. Defaults to 0.05"""
+
+    max_delay: NotRequired[float | None]
+    """Upper bound for the delay before hedging, in seconds. Defaults to None for no bound"""
+
+    window: NotRequired[int]
+    """Number of recent latencies per route the percentile is computed over. Defaults to 200"""
+
+    min_samples: NotRequired[int]
+    """Number of latencies observed for a route before it is hedged. Defaults to 20"""
+
+    max_hedge_rate: NotRequired[float]
+    """Maximum share of requests that may send a duplicate. Defaults to 0.1"""
+
+
+def is_hedge_success(res: httpx.Response) -> bool:
+    """Check whether a response can win a hedge, rather than wait for the other attempt."""
+    return res.status_code < 500 and res.status_code != 429
+
+
+class Hedger:
+    """
+    Tracks per-route latencies and decides when to send a duplicate request.
+
+    Hedges are paid for with a budget that grows by `max_hedge_rate` with
+    every request, so a slow deployment is never sent more than that share
+    of extra requests.
+    """
+
+    _max_budget = 10.0
+
+    def __init__(self, options: HedgeOptions) -> None:
+        self._percentile = options.get("percentile", 95.0)
+        self._min_delay = options.get("min_delay", 0.05)
+        self._max_delay = options.get("max_delay")
+        self._window = options.get("window", 200)
+        self._min_samples = options.get("min_samples", 20)
+        self._rate = options.get("max_hedge_rate", 0.1)
+        self._latencies: dict[str, deque[float]] = {}
+        self._budget = 1.0
+        self._lock = threading.Lock()
+        self.hedged = 0
+
+    def delay(self, route: str) -> float | None:
+        """Seconds to wait before hedging a new request, or None not to hedge."""
+        with self._lock:
+            self._budget = min(self._budget + self._rate, self._max_budget)
+            latencies = self._latencies.get(route)
+            if latencies is None or len(latencies) < self._min_samples:
+                return None
+            ordered = sorted(latencies)
+        index = round(self._percentile / 100 * (len(ordered) - 1))
+        delay = max(ordered[index], self._min_delay)
+        if self._max_delay is not None:
+            delay = min(delay, self._max_delay)
+        return delay
+
+    def observe(self, route: str, latency: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(route)
+            if latencies is None:
+                latencies = self._latencies[route] = deque(maxlen=self._window)
+            latencies.append(latency)
+
+    def acquire(self) -> bool:
+        """Spend the budget for one hedge, if there is enough of it left."""
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self.hedged += 1
+            return True
+
+    async def run(
+        self,
+        route: str,
+        send: Callable[[], Awaitable[_R]],
+        succeeded: Callable[[_R], bool] = lambda _: True,
+    ) -> _R:
+        """
+        Call `send`, calling it again if the first call is slow.
+
+        Returns the first result `succeeded` accepts. A rejected result counts
+        as a failed attempt like an error: it is only returned, or the first
+        error raised, once every attempt failed.
+        """
+        delay = self.delay(route)
+        start = time.monotonic()
+        if delay is None:
+            result = await send()
+            self.observe(route, time.monotonic() - start)
+            return result
+
+        first = asyncio.ensure_future(send())
+        pending: set[asyncio.Future[_R]] = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done and self.acquire():
+                pending.add(asyncio.ensure_future(send()))
+
+            failed: list[_R] = []
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        error = error or task.exception()
+                    elif succeeded(task.result()):
+                        self.observe(route, time.monotonic() - start)
+                        return task.result()
+                    else:
+                        failed.append(task.result())
+            if failed:
+                return failed[0]
+            assert error is not None
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import TypedDict
+
+import httpx
+from typing_extensions import NotRequired
+
+from ._polling import is_continue_wait
+
+
+class AdaptiveConcurrencyOptions(TypedDict, total=False):
+    initial_limit: NotRequired[int]
+    """Number of requests allowed in flight before any has completed, within `min_limit` and `max_limit`. Defaults to 10"""
+
+    min_limit: NotRequired[int]
+    """Lower bound for the limit. Defaults to 1"""
+
+    max_limit: NotRequired[int]
+    """Upper bound for the limit. Defaults to 100"""
+
+    latency_tolerance: NotRequired[float]
+    """Multiple of the lowest recent latency above which Cube is considered overloaded. Defaults to 2.0"""
+
+    backoff_ratio: NotRequired[float]
+    """Factor applied to the limit when Cube is overloaded. Defaults to 0.9"""
+
+    window: NotRequired[int]
+    """Number of recent latencies the lowest latency is taken from. Defaults to 100"""
+
+
+def is_overload(res: httpx.Response) -> bool:
+    """Check whether a response tells the client to send fewer requests."""
+    return res.status_code in (429, 503) or is_continue_wait(res)
+
+
+class _AdaptiveLimit:
+    """
+    Additive-increase, multiplicative-decrease limit on requests in flight.
+
+    The limit grows by one per round of requests that complete fast, while
+    it is in use, and shrinks by `backoff_ratio` at most once per round when
+    a request is rejected, fails or is much slower than the lowest recent
+    latency.
+    """
+
+    def __init__(self, options: AdaptiveConcurrencyOptions) -> None:
+        self._min_limit = options.get("min_limit", 1)
+        self._max_limit = options.get("max_limit", 100)
+        self._tolerance = options.get("latency_tolerance", 2.0)
+        self._backoff = options.get("backoff_ratio", 0.9)
+        self._latencies: deque[float] = deque(maxlen=options.get("window", 100))
+        initial_limit = options.get("initial_limit", 10)
+        self._limit = float(
+            min(max(initial_limit, self._min_limit), self._max_limit)
+        )
+        self._decreased_at = 0.0
+        self.in_flight: int = 0
+        self.queued: int = 0
+        self.acquired: int = 0
+        self.wait_time: float = 0.0
+        self.overloads: int = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight"""
+        return min(self._max_limit, max(self._min_limit, int(self._limit)))
+
+    def _update(self, latency: float | None, overloaded: bool) -> None:
+        busy = self.in_flight >= self.limit / 2
+        self.in_flight -= 1
+        if latency is None:
+            return
+        self._latencies.append(latency)
+        now = time.monotonic()
+        if overloaded or latency > min(self._latencies) * self._tolerance:
+            self.overloads += 1
+            if now - self._decreased_at >= latency:
+                self._limit = max(self._min_limit, self._limit * self._backoff)
+                self._decreased_at = now
+        elif busy:
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+
+class AdaptiveLimiter(_AdaptiveLimit):
+    """Adaptive concurrency limit shared by the threads of a client."""
+
+    def __init__(self, options: AdaptiveConcurrencyOptions) -> None:
+        super().__init__(options)
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        start = time.monotonic()
+        with self._condition:
+            self.queued += 1
+            try:
+                self._condition.wait_for(lambda: self.in_flight < self.limit)
+            finally:
+                self.queued -= 1
+            self.in_flight += 1
+            self.acquired += 1
+            self.wait_time += time.monotonic() - start
+
+    def release(self, latency: float | None, overloaded: bool = False) -> None:
+        """Free a slot, learning from its latency unless it is None."""
+        with self._condition:
+            self._update(latency, overloaded)
+            self._condition.notify_all()
+
+
+class AsyncAdaptiveLimiter(_AdaptiveLimit):
+    """Adaptive concurrency limit shared by the tasks of a client."""
+
+    def __init__(self, options: AdaptiveConcurrencyOptions) -> None:
+        super().__init__(options)
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    async def acquire(self) -> None:
+        if not self._waiters and self.in_flight < self.limit:
+            self.in_flight += 1
+            self.acquired += 1
+            return
+
+        start = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self.in_flight -= 1
+                self._wake()
+            raise
+        finally:
+            self.queued -= 1
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        self.acquired += 1
+        self.wait_time += time.monotonic() - start
+
+    def release(self, latency: float | None, overloaded: bool = False) -> None:
+        """Free a slot, learning from its latency unless it is None."""
+        self._update(latency, overloaded)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
@@ -0,0 +1,79 @@
+import time
+from json.decoder import JSONDecodeError
+from typing import TypedDict
+
+import httpx
+from typing_extensions import NotRequired
+
+CONTINUE_WAIT = "Continue wait"
+
+# A `Continue wait` body is tiny, anything larger is a real result
+_MAX_CONTINUE_WAIT_BYTES = 128
+
+
+class ContinueWaitOptions(TypedDict, total=False):
+    interval: NotRequired[float]
+    """Seconds to wait before the first re-poll. Defaults to 0.5"""
+
+    backoff: NotRequired[float]
+    """Multiplier applied to the interval after every poll. Defaults to 1.5"""
+
+    max_interval: NotRequired[float]
+    """Upper bound for the interval between polls. Defaults to 5.0"""
+
+    timeout: NotRequired[float | None]
+    """Overall deadline in seconds for a single query. Defaults to None for no deadline"""
+
+
+def is_continue_wait(res: httpx.Response) -> bool:
+    """Check whether Cube answered with `{"error": "Continue wait"}`."""
+    if res.status_code != 200:
+        return False
+    try:
+        if len(res.content) > _MAX_CONTINUE_WAIT_BYTES:
+            return False
+    except httpx.ResponseNotRead:
+        # Streamed bodies are only read up front when they are small
+        return False
+    try:
+        return res.json().get("error") == CONTINUE_WAIT
+    except (JSONDecodeError, AttributeError):
+        return False
+
+
+def is_small(res: httpx.Response) -> bool:
+    """Check whether a streamed response could be a `Continue wait` answer."""
+    length = res.headers.get("content-length")
+    return (
+        res.status_code == 200
+        and length is not None
+        and length.isdigit()
+        and int(length) <= _MAX_CONTINUE_WAIT_BYTES
+    )
+
+
+class PollSchedule:
+    """Tracks polling delays and the overall deadline for one query."""
+
+    def __init__(self, options: ContinueWaitOptions) -> None:
+        self.polls = 0
+        self._interval = options.get("interval", 0.5)
+        self._backoff = options.get("backoff", 1.5)
+        self._max_interval = options.get("max_interval", 5.0)
+        timeout = options.get("timeout")
+        self._deadline = (
+            time.monotonic() + timeout if timeout is not None else None
+        )
+
+    def next_delay(self) -> float | None:
+        """Return the delay before the next poll or None if the deadline passed."""
+        delay = self._interval
+        if self._deadline is not None:
+            remaining = self._deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            delay = min(delay, remaining)
+
+        self.polls += 1
+        self._interval = min(self._interval * self._backoff, self._max_interval)
+        return delay
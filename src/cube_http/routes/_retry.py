@@ -0,0 +1,113 @@
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Collection, TypedDict
+
+import httpx
+from typing_extensions import NotRequired
+
+
+class RetryOptions(TypedDict, total=False):
+    max_attempts: NotRequired[int]
+    """Maximum number of attempts, the first one included. Defaults to 3"""
+
+    status_codes: NotRequired[Collection[int]]
+    """Response status codes worth retrying. Defaults to 429, 502, 503 and 504"""
+
+    transport_errors: NotRequired[bool]
+    """Retry connection failures and timeouts raised by httpx. Defaults to True"""
+
+    methods: NotRequired[Collection[str]]
+    """HTTP methods to retry. Defaults to GET and POST since Cube requests are reads"""
+
+    routes: NotRequired[Collection[str]]
+    """Routes to retry, e.g. `/v1/load`. Defaults to None for every route"""
+
+    backoff: NotRequired[float]
+    """Seconds to wait before the first retry. Defaults to 0.25"""
+
+    backoff_multiplier: NotRequired[float]
+    """Multiplier applied to the backoff after every retry. Defaults to 2.0"""
+
+    max_backoff: NotRequired[float]
+    """Upper bound for the backoff between retries. Defaults to 10.0"""
+
+    jitter: NotRequired[bool]
+    """Wait a random time up to the backoff to spread out retries. Defaults to True"""
+
+    max_elapsed: NotRequired[float | None]
+    """Seconds after which no more retries are attempted. Defaults to 30.0"""
+
+    respect_retry_after: NotRequired[bool]
+    """Wait as long as the `Retry-After` response header asks. Defaults to True"""
+
+
+def retry_after(res: httpx.Response) -> float | None:
+    """Seconds to wait according to the `Retry-After` header, if any."""
+    value = res.headers.get("retry-after")
+    if value is None:
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetrySchedule:
+    """Decides whether and when one request is retried."""
+
+    def __init__(self, options: RetryOptions, req: httpx.Request) -> None:
+        self.retries = 0
+        self._options = options
+        self._max_attempts = options.get("max_attempts", 3)
+        self._backoff = options.get("backoff", 0.25)
+        self._max_backoff = options.get("max_backoff", 10.0)
+        max_elapsed = options.get("max_elapsed", 30.0)
+        self._deadline = (
+            time.monotonic() + max_elapsed if max_elapsed is not None else None
+        )
+        routes = options.get("routes")
+        self._enabled = req.method in options.get(
+            "methods", ("GET", "POST")
+        ) and (routes is None or any(req.url.path.endswith(r) for r in routes))
+
+    def next_delay(
+        self,
+        res: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> float | None:
+        """Return the delay before retrying, or None if the outcome is final."""
+        if not self._enabled or self.retries + 1 >= self._max_attempts:
+            return None
+        if error is not None:
+            if not (
+                self._options.get("transport_errors", True)
+                and isinstance(error, httpx.TransportError)
+            ):
+                return None
+        elif res is None or res.status_code not in self._options.get(
+            "status_codes", (429, 502, 503, 504)
+        ):
+            return None
+
+        delay = self._backoff
+        if self._options.get("jitter", True):
+            delay = random.uniform(0, delay)
+        if res is not None and self._options.get("respect_retry_after", True):
+            delay = max(delay, retry_after(res) or 0.0)
+        if (
+            self._deadline is not None
+            and time.monotonic() + delay > self._deadline
+        ):
+            return None
+
+        self.retries += 1
+        self._backoff = min(
+            self._backoff * self._options.get("backoff_multiplier", 2.0),
+            self._max_backoff,
+        )
+        return delay
@@ -1,80 +1,850 @@
-from typing import TypeVar, overload
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generator,
+    Hashable,
+    Mapping,
+    TypeVar,
+    cast,
+    overload,
+)
 
+import httpx
+
+from ..._canonical import canonical_key, request_queries
 from ...exc import V1LoadError
+from ...types._base import DecodeOptions
+from ...types.v1.load_prepared import V1PreparedLoadRequest
 from ...types.v1.load_request import V1LoadRequest
 from ...types.v1.load_response import V1LoadResponse
+from ...types.v1.time_granularities import TimeGranularity
 from .._base import AsyncRoute, SyncRoute
+from .._batching import AsyncBatcher
+from .._cache import LoadCache
+from .._polling import is_continue_wait
+from .load_pages import Paginator, page_rows
+from .load_shards import merge_shards, shard_requests
+from .load_stream import AsyncLoadStream, SyncLoadStream
 
 T = TypeVar("T", bound=V1LoadResponse)
 
 
+def _create_load_cache(options: Mapping[str, Any]) -> LoadCache | None:
+    cache_options = options.get("load_cache")
+    return LoadCache(cache_options) if cache_options is not None else None
+
+
+def _variant(
+    model: type[V1LoadResponse], decode: DecodeOptions
+) -> tuple[type[V1LoadResponse], frozenset[tuple[str, Any]]]:
+    """Everything besides the request that shapes the decoded response."""
+    return model, frozenset(decode.items())
+
+
+def _unprepared(
+    request: V1LoadRequest | V1PreparedLoadRequest,
+) -> tuple[V1LoadRequest, V1PreparedLoadRequest | None]:
+    """The plain request, and the prepared request it came from if any."""
+    if isinstance(request, V1PreparedLoadRequest):
+        return request.request, request
+    return request, None
+
+
+def _cache_lookup(
+    cache: LoadCache | None,
+    request: V1LoadRequest,
+    variant: Hashable,
+    prepared: V1PreparedLoadRequest | None = None,
+) -> tuple[Hashable | None, Any]:
+    """Return the cache key for a request and its cached response, if any."""
+    # Renewed queries must reach Cube, so they bypass the cache
+    if cache is None or any(
+        query.get("renewQuery") for query in request_queries(request)
+    ):
+        return None, None
+    request_key = prepared.key if prepared is not None else None
+    key = request_key or canonical_key(request), variant
+    return key, cache.get(key)
+
+
+def _batch_key(request: V1LoadRequest) -> tuple[str, str] | None:
+    """
+    Key of the batches a request can join, or None to send it on its own.
+
+    Cube answers several queries in one request as a blending query, which
+    needs every query grouped by the same time granularity, so only queries
+    whose time dimensions share one granularity are batched, and only with
+    requests matching in everything but the query.
+    """
+    query = request["query"]
+    if isinstance(query, list):
+        return None
+    granularities = {
+        time_dimension.get("granularity")
+        for time_dimension in query.get("timeDimensions", [])
+    }
+    if len(granularities) != 1:
+        return None
+    granularity = granularities.pop()
+    if granularity is None:
+        return None
+    return canonical_key(request | {"query": {}}), granularity
+
+
+def _probe_request(request: V1LoadRequest) -> V1LoadRequest:
+    """Same queries limited to one row, enough for Cube to report refresh keys."""
+    queries = [
+        {k: v for k, v in query.items() if k != "offset"} | {"limit": 1}
+        for query in request_queries(request)
+    ]
+    probe = queries if isinstance(request["query"], list) else queries[0]
+    return cast(V1LoadRequest, request | {"query": probe})
+
+
+async def _load_pages_concurrently(
+    paginator: Paginator,
+    fetch: Callable[[V1LoadRequest], Awaitable[V1LoadResponse]],
+    concurrency: int,
+    ordered: bool,
+) -> AsyncIterator[Any]:
+    """Keep up to `concurrency` pages in flight until a short page is seen."""
+    pending: dict[asyncio.Future[V1LoadResponse], tuple[int, int]] = {}
+    loaded: dict[int, V1LoadResponse] = {}
+    # Index of the first short page, once seen
+    end: int | None = None
+    issued = 0
+    next_index = 0
+
+    def issue() -> None:
+        nonlocal issued
+        while end is None and len(pending) < concurrency:
+            page = paginator.next_request()
+            if page is None:
+                return
+            task = asyncio.ensure_future(fetch(page))
+            pending[task] = issued, paginator.last_limit
+            issued += 1
+
+    try:
+        issue()
+        while pending:
+            finished, _ = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in finished:
+                index, limit = pending.pop(task)
+                response = task.result()
+                if page_rows(response) < limit and (end is None or index < end):
+                    end = index
+                loaded[index] = response
+
+            if end is not None:
+                # Pages past the end can only be empty
+                for task, (index, _) in list(pending.items()):
+                    if index > end:
+                        task.cancel()
+                        del pending[task]
+            issue()
+
+            if ordered:
+                while next_index in loaded:
+                    yield loaded.pop(next_index)
+                    if next_index == end:
+                        return
+                    next_index += 1
+            else:
+                for index in sorted(loaded):
+                    response = loaded.pop(index)
+                    if (end is None or index <= end) and page_rows(response):
+                        yield response
+    finally:
+        for task in pending:
+            task.cancel()
+
+
 class SyncLoadRoute(SyncRoute):
+    def __init__(
+        self,
+        client: httpx.Client,
+        options: Mapping[str, Any] | None = None,
+    ) -> None:
+        super().__init__(client, options)
+        self._load_cache = _create_load_cache(self._options)
+
+    @property
+    def load_cache(self) -> LoadCache | None:
+        """Result cache for `/v1/load`, if enabled through `load_cache`"""
+        return self._load_cache
+
     @overload
     def load(
-        self, request: V1LoadRequest, *, response_model: None = None
+        self,
+        request: V1LoadRequest | V1PreparedLoadRequest,
+        *,
+        response_model: None = None,
+        decode: DecodeOptions | None = None,
     ) -> V1LoadResponse: ...
 
     @overload
-    def load(self, request: V1LoadRequest, *, response_model: type[T]) -> T: ...
+    def load(
+        self,
+        request: V1LoadRequest | V1PreparedLoadRequest,
+        *,
+        response_model: type[T],
+        decode: DecodeOptions | None = None,
+    ) -> T: ...
 
     def load(
-        self, request: V1LoadRequest, *, response_model: type[T] | None = None
+        self,
+        request: V1LoadRequest | V1PreparedLoadRequest,
+        *,
+        response_model: type[T] | None = None,
+        decode: DecodeOptions | None = None,
     ) -> T | V1LoadResponse:
         """
         Execute a load query.
 
         Args:
-            request: The load request parameters
+            request: The load request parameters, or a prepared request
             response_model: Optional custom response model class to use instead of the default
                             Must inherit from `V1LoadResponse` model.
+            decode: Optional decoding options overriding the client's `decode` options
 
         Returns:
             The response model instance
 
         Raises:
-            V1LoadError: If the request failed
+            V1LoadError: If the request failed or Cube asked to continue waiting
         """
-        res = self._post("/v1/load", request | {"queryType": "multi"})
-        if res.status_code == 200:
-            if response_model is not None:
-                return response_model.from_response(res)
-            return V1LoadResponse.from_response(res)
+        raw_request, prepared = _unprepared(request)
+        model = response_model or V1LoadResponse
+        decode_options = self._options.get("decode", {}) | (decode or {})
+        variant = _variant(model, decode_options)
+        cache = self._load_cache
+        key, cached = _cache_lookup(cache, raw_request, variant, prepared)
+        if (
+            cache is not None
+            and cached is not None
+            and (
+                not cache.probe_due(key)
+                or self._probe_load(cache, key, raw_request)
+            )
+        ):
+            return cached
+
+        return self._coalesce(
+            "/v1/load",
+            raw_request,
+            variant,
+            lambda: self._fetch_load(
+                raw_request, model, decode_options, key, prepared
+            ),
+            prepared.key if prepared is not None else None,
+        )
+
+    def _fetch_load(
+        self,
+        request: V1LoadRequest,
+        model: type[T] | type[V1LoadResponse],
+        decode: DecodeOptions,
+        key: Hashable | None,
+        prepared: V1PreparedLoadRequest | None = None,
+    ) -> Any:
+        if prepared is None:
+            res = self._post(
+                "/v1/load", request | {"queryType": "multi"}, poll=True
+            )
+        else:
+            content, headers = prepared.compressed_body(self._compressor)
+            res = self._post(
+                "/v1/load", content=content, headers=headers, poll=True
+            )
+        if res.status_code == 200 and not is_continue_wait(res):
+            value = model.from_response(res, decode, self._codec)
+            if self._load_cache is not None and key is not None:
+                refresh = self._load_cache.refresh_state(request, value)
+                self._load_cache.put(key, value, len(res.content), refresh)
+            return value
         else:
             raise V1LoadError.from_response(res)
 
+    def _probe_load(
+        self, cache: LoadCache, key: Hashable | None, request: V1LoadRequest
+    ) -> bool:
+        probe = _probe_request(request)
+        res = self._post("/v1/load", probe | {"queryType": "multi"}, poll=True)
+        if res.status_code != 200 or is_continue_wait(res):
+            return False
+        response = V1LoadResponse.from_response(res, codec=self._codec)
+        return cache.confirm(key, cache.refresh_state(probe, response))
+
+    @contextmanager
+    def load_stream(
+        self, request: V1LoadRequest, *, chunk_size: int | None = None
+    ) -> Generator[SyncLoadStream, None, None]:
+        """
+        Execute a load query and stream its rows while the body downloads.
+
+        Args:
+            request: The load request parameters
+            chunk_size: Optional number of bytes to read from the body at a time
+
+        Returns:
+            A context manager yielding an iterable of result rows
+
+        Raises:
+            V1LoadError: If the request failed or Cube asked to continue waiting
+        """
+        req = self._build_request(
+            "POST", "/v1/load", body=request | {"queryType": "multi"}
+        )
+        res = self._send(req, poll=True, stream=True)
+        try:
+            if res.status_code != 200 or is_continue_wait(res):
+                res.read()
+                raise V1LoadError.from_response(res)
+            yield SyncLoadStream(res, chunk_size)
+        finally:
+            res.close()
+
+    @overload
+    def load_pages(
+        self,
+        request: V1LoadRequest,
+        *,
+        page_size: int = 10_000,
+        prefetch: bool = False,
+        response_model: None = None,
+        decode: DecodeOptions | None = None,
+    ) -> Generator[V1LoadResponse, None, None]: ...
+
+    @overload
+    def load_pages(
+        self,
+        request: V1LoadRequest,
+        *,
+        page_size: int = 10_000,
+        prefetch: bool = False,
+        response_model: type[T],
+        decode: DecodeOptions | None = None,
+    ) -> Generator[T, None, None]: ...
+
+    def load_pages(
+        self,
+        request: V1LoadRequest,
+        *,
+        page_size: int = 10_000,
+        prefetch: bool = False,
+        response_model: type[T] | None = None,
+        decode: DecodeOptions | None = None,
+    ) -> Generator[T | V1LoadResponse, None, None]:
+        """
+        Execute a load query page by page using `limit` and `offset`.
+
+        Pages are loaded lazily and paging stops after the first short page or
+        once the query's own `limit` is reached. The query should have an
+        `order` so pages do not overlap.
+
+        Args:
+            request: The load request parameters
+            page_size: Number of rows to request per page. Defaults to 10,000.
+            prefetch: Load the next page in a background thread while the
+                      current one is processed. Defaults to False.
+            response_model: Optional custom response model class to use instead of the default
+                            Must inherit from `V1LoadResponse` model.
+            decode: Optional decoding options overriding the client's `decode` options
+
+        Returns:
+            An iterator of response model instances, one per page
+
+        Raises:
+            V1LoadError: If a page failed or Cube asked to continue waiting
+        """
+        paginator = Paginator(request, page_size)
+        pool = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+        def start(page: V1LoadRequest) -> Callable[[], Any]:
+            def fetch() -> Any:
+                return self.load(
+                    page, response_model=response_model, decode=decode
+                )
+
+            return fetch if pool is None else pool.submit(fetch).result
+
+        try:
+            page = paginator.next_request()
+            pending = start(page) if page is not None else None
+            while pending is not None:
+                response = pending()
+                page = paginator.next_request(response)
+                pending = start(page) if page is not None else None
+                yield response
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    @overload
+    def load_sharded(
+        self,
+        request: V1LoadRequest,
+        *,
+        granularity: TimeGranularity = "month",
+        dimension: str | None = None,
+        concurrency: int = 4,
+        response_model: None = None,
+        decode: DecodeOptions | None = None,
+    ) -> V1LoadResponse: ...
+
+    @overload
+    def load_sharded(
+        self,
+        request: V1LoadRequest,
+        *,
+        granularity: TimeGranularity = "month",
+        dimension: str | None = None,
+        concurrency: int = 4,
+        response_model: type[T],
+        decode: DecodeOptions | None = None,
+    ) -> T: ...
+
+    def load_sharded(
+        self,
+        request: V1LoadRequest,
+        *,
+        granularity: TimeGranularity = "month",
+        dimension: str | None = None,
+        concurrency: int = 4,
+        response_model: type[T] | None = None,
+        decode: DecodeOptions | None = None,
+    ) -> T | V1LoadResponse:
+        """
+        Execute a load query as one query per period of a time dimension's date range.
+
+        Shards run concurrently and their rows are merged in period order,
+        then sorted by the query's `order` and sliced by its `offset` and
+        `limit`. Other result fields are taken from the first shard.
+
+        Args:
+            request: The load request parameters, with an explicit `[start, end]` `dateRange`
+            granularity: Period covered by each shard. Grouped queries need a
+                         time dimension granularity that nests within it.
+                         Defaults to month.
+            dimension: Optional time dimension to shard by. Defaults to the
+                       first one with a `dateRange`.
+            concurrency: Maximum number of shards loaded at once. Defaults to 4.
+            response_model: Optional custom response model class to use instead of the default
+                            Must inherit from `V1LoadResponse` model.
+            decode: Optional decoding options overriding the client's `decode` options
+
+        Returns:
+            The merged response model instance
+
+        Raises:
+            ValueError: If the query cannot be sharded without changing its results
+            V1LoadError: If a shard failed or Cube asked to continue waiting
+        """
+        shards = shard_requests(request, granularity, dimension)
+        options = self._options.get("decode", {}) | (decode or {})
+        # Rows are merged before columns are built or coerced
+        shard_decode = options | {"columnar": False, "coerce": False}
+
+        def load_shard(shard: V1LoadRequest) -> V1LoadResponse:
+            return self.load(
+                shard, response_model=response_model, decode=shard_decode
+            )
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            responses = list(pool.map(load_shard, shards))
+        merged = merge_shards(request, responses)
+        merged.apply_decode(options)
+        return merged
+
 
 class AsyncLoadRoute(AsyncRoute):
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        options: Mapping[str, Any] | None = None,
+    ) -> None:
+        super().__init__(client, options)
+        self._load_cache = _create_load_cache(self._options)
+        batch_options = self._options.get("load_batching")
+        self._load_batcher: AsyncBatcher[Any, tuple[Any, int]] | None = (
+            AsyncBatcher(batch_options, self._send_load_batch)
+            if batch_options is not None
+            else None
+        )
+
+    @property
+    def load_cache(self) -> LoadCache | None:
+        """Result cache for `/v1/load`, if enabled through `load_cache`"""
+        return self._load_cache
+
     @overload
     async def load(
-        self, request: V1LoadRequest, *, response_model: None = None
+        self,
+        request: V1LoadRequest | V1PreparedLoadRequest,
+        *,
+        response_model: None = None,
+        decode: DecodeOptions | None = None,
     ) -> V1LoadResponse: ...
 
     @overload
     async def load(
-        self, request: V1LoadRequest, *, response_model: type[T]
+        self,
+        request: V1LoadRequest | V1PreparedLoadRequest,
+        *,
+        response_model: type[T],
+        decode: DecodeOptions | None = None,
     ) -> T: ...
 
     async def load(
-        self, request: V1LoadRequest, *, response_model: type[T] | None = None
+        self,
+        request: V1LoadRequest | V1PreparedLoadRequest,
+        *,
+        response_model: type[T] | None = None,
+        decode: DecodeOptions | None = None,
     ) -> T | V1LoadResponse:
         """
         Execute a load query asynchronously.
 
         Args:
-            request: The load request parameters
+            request: The load request parameters, or a prepared request
             response_model: Optional custom response model class to use instead of the default
                             Must inherit from `V1LoadResponse` model.
+            decode: Optional decoding options overriding the client's `decode` options
 
         Returns:
             The response model instance
 
         Raises:
-            V1LoadError: If the request failed
+            V1LoadError: If the request failed or Cube asked to continue waiting
         """
-        res = await self._post("/v1/load", request | {"queryType": "multi"})
-        if res.status_code == 200:
-            if response_model is not None:
-                return response_model.from_response(res)
-            return V1LoadResponse.from_response(res)
+        raw_request, prepared = _unprepared(request)
+        model = response_model or V1LoadResponse
+        decode_options = self._options.get("decode", {}) | (decode or {})
+        variant = _variant(model, decode_options)
+        cache = self._load_cache
+        key, cached = _cache_lookup(cache, raw_request, variant, prepared)
+        if (
+            cache is not None
+            and cached is not None
+            and (
+                not cache.probe_due(key)
+                or await self._probe_load(cache, key, raw_request)
+            )
+        ):
+            return cached
+
+        return await self._coalesce(
+            "/v1/load",
+            raw_request,
+            variant,
+            lambda: self._fetch_load(
+                raw_request, model, decode_options, key, prepared
+            ),
+            prepared.key if prepared is not None else None,
+        )
+
+    async def _fetch_load(
+        self,
+        request: V1LoadRequest,
+        model: type[T] | type[V1LoadResponse],
+        decode: DecodeOptions,
+        key: Hashable | None,
+        prepared: V1PreparedLoadRequest | None = None,
+    ) -> Any:
+        batch_key = _batch_key(request)
+        if self._load_batcher is not None and batch_key is not None:
+            value, size = await self._load_batcher.submit(
+                (_variant(model, decode), batch_key),
+                (request, model, decode, prepared),
+            )
+        else:
+            value, size = await self._load_response(
+                request, model, decode, prepared
+            )
+        if self._load_cache is not None and key is not None:
+            refresh = self._load_cache.refresh_state(request, value)
+            self._load_cache.put(key, value, size, refresh)
+        return value
+
+    async def _load_response(
+        self,
+        request: V1LoadRequest,
+        model: type[T] | type[V1LoadResponse],
+        decode: DecodeOptions,
+        prepared: V1PreparedLoadRequest | None = None,
+    ) -> tuple[Any, int]:
+        """Load and decode a response, returned with its body size."""
+        if prepared is None:
+            res = await self._post(
+                "/v1/load",
+                request | {"queryType": "multi"},
+                poll=True,
+                hedge=True,
+            )
+        else:
+            content, headers = prepared.compressed_body(self._compressor)
+            res = await self._post(
+                "/v1/load",
+                content=content,
+                headers=headers,
+                poll=True,
+                hedge=True,
+            )
+        if res.status_code == 200 and not is_continue_wait(res):
+            return model.from_response(res, decode, self._codec), len(
+                res.content
+            )
         else:
             raise V1LoadError.from_response(res)
+
+    async def _send_load_batch(
+        self, key: Hashable, items: list[Any]
+    ) -> list[Any]:
+        """Load batched queries in one request, splitting the results."""
+        if len(items) == 1:
+            return [await self._load_response(*items[0])]
+        request, model, decode, _ = items[0]
+        batch = request | {"query": [item[0]["query"] for item in items]}
+        res = await self._post(
+            "/v1/load", batch | {"queryType": "multi"}, poll=True
+        )
+        if res.status_code == 200 and not is_continue_wait(res):
+            response = model.from_response(res, decode, self._codec)
+            size = len(res.content) // len(items)
+            return [
+                (response.model_copy(update={"results": [result]}), size)
+                for result in response.results
+            ]
+        if res.status_code != 400:
+            # Overloaded or failing: every query would fail the same way
+            raise V1LoadError.from_response(res)
+        # A single bad query fails the whole batch, so load each on its own
+        return await asyncio.gather(
+            *(self._load_response(*item) for item in items),
+            return_exceptions=True,
+        )
+
+    async def _probe_load(
+        self, cache: LoadCache, key: Hashable | None, request: V1LoadRequest
+    ) -> bool:
+        probe = _probe_request(request)
+        res = await self._post(
+            "/v1/load", probe | {"queryType": "multi"}, poll=True
+        )
+        if res.status_code != 200 or is_continue_wait(res):
+            return False
+        response = V1LoadResponse.from_response(res, codec=self._codec)
+        return cache.confirm(key, cache.refresh_state(probe, response))
+
+    @asynccontextmanager
+    async def load_stream(
+        self, request: V1LoadRequest, *, chunk_size: int | None = None
+    ) -> AsyncGenerator[AsyncLoadStream, None]:
+        """
+        Execute a load query asynchronously and stream its rows while the body downloads.
+
+        Args:
+            request: The load request parameters
+            chunk_size: Optional number of bytes to read from the body at a time
+
+        Returns:
+            An async context manager yielding an async iterable of result rows
+
+        Raises:
+            V1LoadError: If the request failed or Cube asked to continue waiting
+        """
+        req = self._build_request(
+            "POST", "/v1/load", body=request | {"queryType": "multi"}
+        )
+        res = await self._send(req, poll=True, stream=True)
+        try:
+            if res.status_code != 200 or is_continue_wait(res):
+                await res.aread()
+                raise V1LoadError.from_response(res)
+            yield AsyncLoadStream(res, chunk_size)
+        finally:
+            await res.aclose()
+
+    @overload
+    def load_pages(
+        self,
+        request: V1LoadRequest,
+        *,
+        page_size: int = 10_000,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        ordered: bool = True,
+        response_model: None = None,
+        decode: DecodeOptions | None = None,
+    ) -> AsyncGenerator[V1LoadResponse, None]: ...
+
+    @overload
+    def load_pages(
+        self,
+        request: V1LoadRequest,
+        *,
+        page_size: int = 10_000,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        ordered: bool = True,
+        response_model: type[T],
+        decode: DecodeOptions | None = None,
+    ) -> AsyncGenerator[T, None]: ...
+
+    async def load_pages(
+        self,
+        request: V1LoadRequest,
+        *,
+        page_size: int = 10_000,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        ordered: bool = True,
+        response_model: type[T] | None = None,
+        decode: DecodeOptions | None = None,
+    ) -> AsyncGenerator[T | V1LoadResponse, None]:
+        """
+        Execute a load query asynchronously page by page using `limit` and `offset`.
+
+        Pages are loaded lazily and paging stops after the first short page or
+        once the query's own `limit` is reached. The query should have an
+        `order` so pages do not overlap.
+
+        Args:
+            request: The load request parameters
+            page_size: Number of rows to request per page. Defaults to 10,000.
+            prefetch: Load the next page in a background task while the
+                      current one is processed. Defaults to False.
+            concurrency: Number of pages to request at once. Pages past the
+                         end are requested speculatively until a short page
+                         is seen. Defaults to 1.
+            ordered: Yield concurrently loaded pages in offset order rather
+                     than as they complete. Pages without rows are skipped
+                     when unordered. Defaults to True.
+            response_model: Optional custom response model class to use instead of the default
+                            Must inherit from `V1LoadResponse` model.
+            decode: Optional decoding options overriding the client's `decode` options
+
+        Returns:
+            An async iterator of response model instances, one per page
+
+        Raises:
+            V1LoadError: If a page failed or Cube asked to continue waiting
+        """
+        paginator = Paginator(request, page_size)
+        if concurrency > 1:
+            pages = _load_pages_concurrently(
+                paginator,
+                lambda page: self.load(
+                    page, response_model=response_model, decode=decode
+                ),
+                concurrency,
+                ordered,
+            )
+            async for response in pages:
+                yield response
+            return
+
+        def start(page: V1LoadRequest) -> Awaitable[Any]:
+            fetch = self.load(page, response_model=response_model, decode=decode)
+            return asyncio.ensure_future(fetch) if prefetch else fetch
+
+        page = paginator.next_request()
+        pending = start(page) if page is not None else None
+        try:
+            while pending is not None:
+                response = await pending
+                page = paginator.next_request(response)
+                pending = start(page) if page is not None else None
+                yield response
+        finally:
+            if isinstance(pending, asyncio.Future):
+                pending.cancel()
+            elif pending is not None:
+                cast(Coroutine[Any, Any, Any], pending).close()
+
+    @overload
+    async def load_sharded(
+        self,
+        request: V1LoadRequest,
+        *,
+        granularity: TimeGranularity = "month",
+        dimension: str | None = None,
+        concurrency: int = 4,
+        response_model: None = None,
+        decode: DecodeOptions | None = None,
+    ) -> V1LoadResponse: ...
+
+    @overload
+    async def load_sharded(
+        self,
+        request: V1LoadRequest,
+        *,
+        granularity: TimeGranularity = "month",
+        dimension: str | None = None,
+        concurrency: int = 4,
+        response_model: type[T],
+        decode: DecodeOptions | None = None,
+    ) -> T: ...
+
+    async def load_sharded(
+        self,
+        request: V1LoadRequest,
+        *,
+        granularity: TimeGranularity = "month",
+        dimension: str | None = None,
+        concurrency: int = 4,
+        response_model: type[T] | None = None,
+        decode: DecodeOptions | None = None,
+    ) -> T | V1LoadResponse:
+        """
+        Execute a load query asynchronously as one query per period of a time dimension's date range.
+
+        Shards run concurrently and their rows are merged in period order,
+        then sorted by the query's `order` and sliced by its `offset` and
+        `limit`. Other result fields are taken from the first shard.
+
+        Args:
+            request: The load request parameters, with an explicit `[start, end]` `dateRange`
+            granularity: Period covered by each shard. Grouped queries need a
+                         time dimension granularity that nests within it.
+                         Defaults to month.
+            dimension: Optional time dimension to shard by. Defaults to the
+                       first one with a `dateRange`.
+            concurrency: Maximum number of shards loaded at once. Defaults to 4.
+            response_model: Optional custom response model class to use instead of the default
+                            Must inherit from `V1LoadResponse` model.
+            decode: Optional decoding options overriding the client's `decode` options
+
+        Returns:
+            The merged response model instance
+
+        Raises:
+            ValueError: If the query cannot be sharded without changing its results
+            V1LoadError: If a shard failed or Cube asked to continue waiting
+        """
+        shards = shard_requests(request, granularity, dimension)
+        options = self._options.get("decode", {}) | (decode or {})
+        # Rows are merged before columns are built or coerced
+        shard_decode = options | {"columnar": False, "coerce": False}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def load_shard(shard: V1LoadRequest) -> V1LoadResponse:
+            async with semaphore:
+                return await self.load(
+                    shard, response_model=response_model, decode=shard_decode
+                )
+
+        responses = await asyncio.gather(*map(load_shard, shards))
+        merged = merge_shards(request, responses)
+        merged.apply_decode(options)
+        return merged
@@ -0,0 +1,50 @@
+from ...types.v1.load_request import V1LoadRequest, single_query
+from ...types.v1.load_response import V1LoadResponse
+
+
+def page_rows(response: V1LoadResponse) -> int:
+    """Number of rows in a page, whether decoded as rows or columns."""
+    result = response.results[0]
+    return len(result.data) if result.data else len(result.to_columns())
+
+
+class Paginator:
+    """
+    Splits a load request into `limit`/`offset` pages.
+
+    Paging starts at the query's own `offset` and stops after the query's
+    own `limit`, if any, or after the first short page.
+    """
+
+    def __init__(self, request: V1LoadRequest, page_size: int) -> None:
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        query = single_query(request, "Pagination")
+        self._request = request
+        self._query = query
+        self._page_size = page_size
+        self._offset = query.get("offset") or 0
+        self._remaining = query.get("limit")
+        self._last_limit = 0
+
+    @property
+    def last_limit(self) -> int:
+        """Limit of the last page requested"""
+        return self._last_limit
+
+    def next_request(
+        self, previous: V1LoadResponse | None = None
+    ) -> V1LoadRequest | None:
+        """Request for the page after `previous`, or None when done."""
+        if previous is not None and page_rows(previous) < self._last_limit:
+            return None
+        limit = self._page_size
+        if self._remaining is not None:
+            if self._remaining <= 0:
+                return None
+            limit = min(limit, self._remaining)
+            self._remaining -= limit
+        query = self._query | {"offset": self._offset, "limit": limit}
+        self._offset += limit
+        self._last_limit = limit
+        return self._request | {"query": query}
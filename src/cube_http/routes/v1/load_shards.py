@@ -0,0 +1,193 @@
+from datetime import datetime, timedelta
+from typing import Any, Sequence
+
+from ..._canonical import order_pairs
+from ...types.v1.load_coercion import NUMBER_TYPES
+from ...types.v1.load_request import V1LoadRequest, single_query
+from ...types.v1.load_response import V1LoadResponse
+from ...types.v1.time_granularities import TimeGranularity
+
+_GRANULARITIES: tuple[TimeGranularity, ...] = (
+    "second",
+    "minute",
+    "hour",
+    "day",
+    "week",
+    "month",
+    "quarter",
+    "year",
+)
+
+_FIXED = {
+    "second": timedelta(seconds=1),
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+
+_MONTHS = {"month": 1, "quarter": 3, "year": 12}
+
+_MILLISECOND = timedelta(milliseconds=1)
+
+
+def _parse_bound(value: str, end: bool) -> datetime:
+    """Parse a `dateRange` bound, padding bare dates the way Cube does."""
+    # Before Python 3.11, fromisoformat rejects a `Z` suffix. Bounds are
+    # local to the query timezone, so an offset is dropped, not applied.
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    bound = datetime.fromisoformat(value).replace(tzinfo=None)
+    if end and len(value) == 10:
+        bound += timedelta(days=1) - _MILLISECOND
+    return bound
+
+
+def _format(value: datetime) -> str:
+    return (
+        value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}"
+    )
+
+
+def _floor(value: datetime, granularity: TimeGranularity) -> datetime:
+    if granularity == "second":
+        return value.replace(microsecond=0)
+    if granularity == "minute":
+        return value.replace(second=0, microsecond=0)
+    if granularity == "hour":
+        return value.replace(minute=0, second=0, microsecond=0)
+    day = value.replace(hour=0, minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        return day
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    month = (day.month - 1) // _MONTHS[granularity] * _MONTHS[granularity] + 1
+    return day.replace(month=month, day=1)
+
+
+def _next(start: datetime, granularity: TimeGranularity) -> datetime:
+    """Start of the period after the one starting at `start`."""
+    if granularity in _FIXED:
+        return start + _FIXED[granularity]
+    months = start.year * 12 + start.month - 1 + _MONTHS[granularity]
+    return start.replace(year=months // 12, month=months % 12 + 1)
+
+
+def _nests(inner: TimeGranularity | None, outer: TimeGranularity) -> bool:
+    """Whether every `inner` period falls within a single `outer` period."""
+    if inner is None:
+        return False
+    if inner == outer:
+        return True
+    if "week" in (inner, outer):
+        return outer == "week" and inner in ("second", "minute", "hour", "day")
+    return _GRANULARITIES.index(inner) < _GRANULARITIES.index(outer)
+
+
+def shard_requests(
+    request: V1LoadRequest,
+    granularity: TimeGranularity,
+    dimension: str | None = None,
+) -> list[V1LoadRequest]:
+    """
+    Split a load request into one request per `granularity` period of a time
+    dimension's `dateRange`.
+
+    Shards are aligned to period boundaries and clipped to the original range.
+    Each shard keeps enough rows for the original `limit` and `offset` to be
+    applied after merging.
+
+    Raises:
+        ValueError: If the query cannot be sharded without changing its results
+    """
+    query = single_query(request, "Sharding")
+    time_dimensions = query.get("timeDimensions") or []
+    index = next(
+        (
+            i
+            for i, td in enumerate(time_dimensions)
+            if td.get("dateRange") is not None
+            and dimension in (None, td["dimension"])
+        ),
+        None,
+    )
+    if index is None:
+        raise ValueError("Sharding requires a time dimension with a `dateRange`")
+    time_dimension = time_dimensions[index]
+    date_range = time_dimension.get("dateRange")
+    if not isinstance(date_range, list) or len(date_range) != 2:
+        raise ValueError(
+            "Sharding requires an explicit `[start, end]` date range, "
+            f"got {date_range!r}"
+        )
+    if not query.get("ungrouped") and not _nests(
+        time_dimension.get("granularity"), granularity
+    ):
+        # Otherwise rows of a group would be split between shards
+        raise ValueError(
+            f"Cannot shard by {granularity}: grouped queries need a time "
+            f"dimension granularity that nests within it"
+        )
+
+    start = _parse_bound(date_range[0], end=False)
+    end = _parse_bound(date_range[1], end=True)
+    shard_query = query.copy()
+    shard_query.pop("offset", None)
+    if (limit := query.get("limit")) is not None:
+        shard_query["limit"] = limit + (query.get("offset") or 0)
+
+    shards: list[V1LoadRequest] = []
+    period = _floor(start, granularity)
+    while period <= end:
+        following = _next(period, granularity)
+        bounds = [
+            _format(max(start, period)),
+            _format(min(end, following - _MILLISECOND)),
+        ]
+        shard_dimension = time_dimension.copy()
+        shard_dimension["dateRange"] = bounds
+        shard_dimensions = list(time_dimensions)
+        shard_dimensions[index] = shard_dimension
+        shard = shard_query.copy()
+        shard["timeDimensions"] = shard_dimensions
+        shards.append(request | {"query": shard})
+        period = following
+    return shards
+
+
+def _sort_key(member: str, member_type: str | None, descending: bool):
+    def key(row: dict[str, Any]) -> tuple[bool, Any]:
+        value = row.get(member)
+        if value is not None and member_type in NUMBER_TYPES:
+            value = float(value)
+        # Nulls sort last in both directions
+        return (value is not None) if descending else (value is None), value
+
+    return key
+
+
+def merge_shards(
+    request: V1LoadRequest, responses: Sequence[V1LoadResponse]
+) -> V1LoadResponse:
+    """
+    Merge sharded responses in shard order, then re-apply the original
+    `order`, `offset` and `limit`.
+    """
+    first = responses[0]
+    result = first.results[0]
+    rows = [row for response in responses for row in response.results[0].data]
+
+    query = single_query(request, "Merging shards")
+    types = result.annotation.member_types()
+    # Stable sorts from the least to the most significant member
+    for member, direction in reversed(order_pairs(query.get("order") or [])):
+        descending = direction == "desc"
+        rows.sort(
+            key=_sort_key(member, types.get(member), descending),
+            reverse=descending,
+        )
+    offset = query.get("offset") or 0
+    limit = query.get("limit")
+    rows = rows[offset : None if limit is None else offset + limit]
+
+    return first.model_copy(update={"results": [result.with_data(rows)]})
@@ -0,0 +1,80 @@
+from typing import Any, AsyncIterator, Iterable, Iterator
+
+import httpx
+
+from ..._json_stream import Event, LoadResponseParser
+from ...exc import V1LoadError
+from ...types.v1.load_response import (
+    V1LoadResponse,
+    V1LoadResult,
+    V1LoadResultAnnotation,
+)
+
+
+class _LoadStream:
+    def __init__(self, res: httpx.Response, chunk_size: int | None) -> None:
+        self._res = res
+        self._chunk_size = chunk_size
+        self._parser = LoadResponseParser()
+        self._results: list[dict[str, Any]] = []
+
+        self.result_index = 0
+        """Index of the result the latest rows belong to"""
+
+        self.metadata: dict[str, Any] = {}
+        """Fields of the current result that arrived before its rows"""
+
+        self.results: list[V1LoadResult] = []
+        """Completed results, with empty `data` since rows are streamed"""
+
+        self.response: V1LoadResponse | None = None
+        """The complete response without rows, once the body is consumed"""
+
+    @property
+    def annotation(self) -> V1LoadResultAnnotation | None:
+        """Annotation of the current result, once it has been received"""
+        if (annotation := self.metadata.get("annotation")) is None:
+            return None
+        return V1LoadResultAnnotation.model_validate(annotation)
+
+    def _handle(self, events: Iterable[Event]) -> Iterator[dict[str, Any]]:
+        for event in events:
+            if event[0] == "row":
+                yield event[2]
+            elif event[0] == "result_start":
+                self.result_index, self.metadata = event[1], event[2]
+            elif event[0] == "result":
+                result: dict[str, Any] = event[2] | {"data": []}
+                self._results.append(result)
+                self.results.append(V1LoadResult.model_validate(result))
+            else:
+                top = event[1]
+                if "error" in top:
+                    raise V1LoadError(self._res.status_code, str(top["error"]))
+                self.response = V1LoadResponse.model_validate(
+                    top | {"results": self._results}
+                )
+
+
+class SyncLoadStream(_LoadStream):
+    """Rows of a `/v1/load` response, decoded while the body downloads."""
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for chunk in self._res.iter_bytes(self._chunk_size):
+            self._parser.feed(chunk)
+            yield from self._handle(self._parser.events())
+        self._parser.feed(b"", final=True)
+        yield from self._handle(self._parser.events())
+
+
+class AsyncLoadStream(_LoadStream):
+    """Rows of a `/v1/load` response, decoded while the body downloads."""
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        async for chunk in self._res.aiter_bytes(self._chunk_size):
+            self._parser.feed(chunk)
+            for row in self._handle(self._parser.events()):
+                yield row
+        self._parser.feed(b"", final=True)
+        for row in self._handle(self._parser.events()):
+            yield row
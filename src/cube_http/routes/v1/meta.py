@@ -1,14 +1,30 @@
-from typing import TypeVar, overload
+import asyncio
+import contextlib
+from typing import Any, Hashable, Mapping, TypeVar, overload
+
+import httpx
 
 from ...exc import V1MetaError
 from ...types.v1.meta_request import V1MetaRequest
 from ...types.v1.meta_response import V1MetaResponse
 from .._base import AsyncRoute, SyncRoute
+from .._cache import MetaCache
 
 T = TypeVar("T", bound=V1MetaResponse)
 
 
 class SyncMetaRoute(SyncRoute):
+    def __init__(
+        self,
+        client: httpx.Client,
+        options: Mapping[str, Any] | None = None,
+    ) -> None:
+        super().__init__(client, options)
+        cache_options = self._options.get("meta_cache")
+        self._meta_cache = (
+            MetaCache(cache_options) if cache_options is not None else None
+        )
+
     @overload
     def meta(
         self,
@@ -45,16 +61,53 @@ class SyncMetaRoute(SyncRoute):
         Raises:
             V1MetaError: If the request failed
         """
-        res = self._get("/v1/meta", params=request or {})
+        params = request or {}
+        model = response_model or V1MetaResponse
+        if self._meta_cache is None:
+            return self._fetch_meta(params, model)
+
+        key = self._meta_cache.key(params, model)
+        entry = self._meta_cache.get(key)
+        if entry is not None and self._meta_cache.is_fresh(entry):
+            return entry.value
+        return self._fetch_meta(params, model, key)
+
+    def _fetch_meta(
+        self,
+        params: Mapping[str, Any],
+        model: type[V1MetaResponse],
+        key: Hashable | None = None,
+    ) -> Any:
+        cache = self._meta_cache
+        entry = cache.get(key) if cache is not None else None
+        headers = {"If-None-Match": entry.etag} if entry and entry.etag else None
+
+        res = self._get("/v1/meta", params=params, headers=headers)
+        if res.status_code == 304 and cache is not None and entry is not None:
+            cache.touch(key)
+            return entry.value
         if res.status_code == 200:
-            if response_model is not None:
-                return response_model.from_response(res)
-            return V1MetaResponse.from_response(res)
+            value = model.from_response(res, codec=self._codec)
+            if cache is not None:
+                cache.store(key, value, res.headers.get("etag"))
+            return value
         else:
             raise V1MetaError.from_response(res)
 
 
 class AsyncMetaRoute(AsyncRoute):
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        options: Mapping[str, Any] | None = None,
+    ) -> None:
+        super().__init__(client, options)
+        cache_options = self._options.get("meta_cache")
+        self._meta_cache = (
+            MetaCache(cache_options) if cache_options is not None else None
+        )
+        self._meta_refreshes: dict[Hashable, asyncio.Task[Any]] = {}
+
     @overload
     async def meta(
         self,
@@ -91,10 +144,71 @@ class AsyncMetaRoute(AsyncRoute):
         Raises:
             V1MetaError: If the request failed
         """
-        res = await self._get("/v1/meta", params=request or {})
+        params = request or {}
+        model = response_model or V1MetaResponse
+        if self._meta_cache is None:
+            return await self._fetch_meta(params, model)
+
+        key = self._meta_cache.key(params, model)
+        entry = self._meta_cache.get(key)
+        if entry is not None:
+            if self._meta_cache.is_fresh(entry):
+                return entry.value
+            if self._meta_cache.stale_while_revalidate:
+                self._schedule_meta_refresh(params, model, key)
+                return entry.value
+        return await self._fetch_meta(params, model, key)
+
+    async def _fetch_meta(
+        self,
+        params: Mapping[str, Any],
+        model: type[V1MetaResponse],
+        key: Hashable | None = None,
+    ) -> Any:
+        cache = self._meta_cache
+        entry = cache.get(key) if cache is not None else None
+        headers = {"If-None-Match": entry.etag} if entry and entry.etag else None
+
+        res = await self._get(
+            "/v1/meta", params=params, headers=headers, hedge=True
+        )
+        if res.status_code == 304 and cache is not None and entry is not None:
+            cache.touch(key)
+            return entry.value
         if res.status_code == 200:
-            if response_model is not None:
-                return response_model.from_response(res)
-            return V1MetaResponse.from_response(res)
+            value = model.from_response(res, codec=self._codec)
+            if cache is not None:
+                cache.store(key, value, res.headers.get("etag"))
+            return value
         else:
             raise V1MetaError.from_response(res)
+
+    def _schedule_meta_refresh(
+        self,
+        params: Mapping[str, Any],
+        model: type[V1MetaResponse],
+        key: Hashable,
+    ) -> None:
+        if key in self._meta_refreshes:
+            return
+        task = asyncio.create_task(self._refresh_meta(params, model, key))
+        self._meta_refreshes[key] = task
+        task.add_done_callback(lambda _: self._meta_refreshes.pop(key, None))
+
+    async def _refresh_meta(
+        self,
+        params: Mapping[str, Any],
+        model: type[V1MetaResponse],
+        key: Hashable,
+    ) -> None:
+        # Callers keep getting the stale response if revalidation fails for
+        # any reason, e.g. an open circuit or the client being closed
+        with contextlib.suppress(Exception):
+            await self._fetch_meta(params, model, key)
+
+    async def aclose(self) -> None:
+        """Cancel background meta refreshes, called when the client is closed."""
+        refreshes = list(self._meta_refreshes.values())
+        for task in refreshes:
+            task.cancel()
+        await asyncio.gather(*refreshes, return_exceptions=True)
@@ -1,9 +1,11 @@
-from typing import TypeVar, overload
+from typing import Any, TypeVar, overload
 
+from ..._canonical import exact_key
 from ...exc import V1SqlError
 from ...types.v1.sql_request import V1SqlRequest
 from ...types.v1.sql_response import V1SqlResponse
 from .._base import AsyncRoute, SyncRoute
+from .._polling import is_continue_wait
 
 T = TypeVar("T", bound=V1SqlResponse)
 
@@ -32,13 +34,24 @@ class SyncSqlRoute(SyncRoute):
             The response model instance
 
         Raises:
-            V1SqlError: If the request failed
+            V1SqlError: If the request failed or Cube asked to continue waiting
         """
-        res = self._post("/v1/sql", body=request)
-        if res.status_code == 200:
-            if response_model is not None:
-                return response_model.from_response(res)
-            return V1SqlResponse.from_response(res)
+        model = response_model or V1SqlResponse
+        # Compiled SQL lists columns in the order members were requested
+        return self._coalesce(
+            "/v1/sql",
+            request,
+            model,
+            lambda: self._fetch_sql(request, model),
+            exact_key(request),
+        )
+
+    def _fetch_sql(
+        self, request: V1SqlRequest, model: type[T] | type[V1SqlResponse]
+    ) -> Any:
+        res = self._post("/v1/sql", body=request, poll=True)
+        if res.status_code == 200 and not is_continue_wait(res):
+            return model.from_response(res, codec=self._codec)
         else:
             raise V1SqlError.from_response(res)
 
@@ -69,12 +82,23 @@ class AsyncSqlRoute(AsyncRoute):
             The response model instance
 
         Raises:
-            V1SqlError: If the request failed
+            V1SqlError: If the request failed or Cube asked to continue waiting
         """
-        res = await self._post("/v1/sql", body=request)
-        if res.status_code == 200:
-            if response_model is not None:
-                return response_model.from_response(res)
-            return V1SqlResponse.from_response(res)
+        model = response_model or V1SqlResponse
+        # Compiled SQL lists columns in the order members were requested
+        return await self._coalesce(
+            "/v1/sql",
+            request,
+            model,
+            lambda: self._fetch_sql(request, model),
+            exact_key(request),
+        )
+
+    async def _fetch_sql(
+        self, request: V1SqlRequest, model: type[T] | type[V1SqlResponse]
+    ) -> Any:
+        res = await self._post("/v1/sql", body=request, poll=True)
+        if res.status_code == 200 and not is_continue_wait(res):
+            return model.from_response(res, codec=self._codec)
         else:
             raise V1SqlError.from_response(res)
@@ -1,10 +1,78 @@
+from typing import Any, Literal, TypedDict
+
 import httpx
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from typing_extensions import NotRequired, Self
+
+from .._json import JsonCodec
+
+POLLS_EXTENSION = "cube_http.polls"
+"""Response extension key holding the number of `Continue wait` polls"""
+
+RETRIES_EXTENSION = "cube_http.retries"
+"""Response extension key holding the number of retried attempts"""
+
+
+class DecodeOptions(TypedDict, total=False):
+    trusted: NotRequired[bool]
+    """Trust the server payload and skip validating bulk row data. Defaults to False"""
+
+    columnar: NotRequired[bool]
+    """Store load result rows as columns, see `V1LoadResult.to_columns`. Defaults to False"""
+
+    coerce: NotRequired[bool]
+    """Convert load result columns according to their annotation types. Defaults to False"""
+
+    numbers: NotRequired[Literal["auto", "float", "decimal"]]
+    """How `coerce` converts numbers: `auto` for ints when every value is integral, `float` or `decimal`. Defaults to auto"""
+
+    numpy: NotRequired[bool]
+    """Have `coerce` return NumPy arrays for number and time columns. Defaults to False"""
 
 
 class ResponseModel(BaseModel):
     model_config = ConfigDict(extra="allow")
 
+    _polls: int = PrivateAttr(default=0)
+    _retries: int = PrivateAttr(default=0)
+
+    @classmethod
+    def from_response(
+        cls,
+        res: httpx.Response,
+        decode: DecodeOptions | None = None,
+        codec: JsonCodec | None = None,
+    ):
+        trusted = bool(decode and decode.get("trusted"))
+        if codec is not None and not trusted:
+            # Validate straight from the body bytes with pydantic's own parser,
+            # faster than decoding with the codec and validating the result
+            model = cls.model_validate_json(res.content)
+        elif codec is not None:
+            model = cls.from_trusted_payload(codec.loads(res.content))
+        elif trusted:
+            model = cls.from_trusted_payload(res.json())
+        else:
+            model = cls.model_validate(res.json())
+        model._polls = res.extensions.get(POLLS_EXTENSION, 0)
+        model._retries = res.extensions.get(RETRIES_EXTENSION, 0)
+        return model
+
     @classmethod
-    def from_response(cls, res: httpx.Response):
-        return cls.model_validate(res.json())
+    def from_trusted_payload(cls, payload: dict[str, Any]) -> Self:
+        """
+        Build the model from a payload known to come from Cube.
+
+        Models holding bulk data override this to leave that data unvalidated.
+        """
+        return cls.model_validate(payload)
+
+    @property
+    def polls(self) -> int:
+        """Number of `Continue wait` polls needed before the response was ready"""
+        return self._polls
+
+    @property
+    def retries(self) -> int:
+        """Number of retried attempts, across polls, before the response was received"""
+        return self._retries
@@ -1,5 +1,8 @@
+from .load_columns import V1LoadColumns
+from .load_prepared import V1PreparedLoadRequest
 from .load_request import V1LoadRequest, V1LoadRequestQuery
 from .load_response import V1LoadResponse
+from .load_template import V1LoadRequestTemplate, V1QueryParam
 from .meta_request import V1MetaRequest
 from .meta_response import V1MetaResponse
 from .sql_request import V1SqlRequest
@@ -7,11 +10,15 @@ from .sql_response import V1SqlResponse
 
 
 __all__ = [
+    "V1LoadColumns",
     "V1LoadRequest",
     "V1LoadRequestQuery",
+    "V1LoadRequestTemplate",
     "V1LoadResponse",
     "V1MetaRequest",
     "V1MetaResponse",
+    "V1PreparedLoadRequest",
+    "V1QueryParam",
     "V1SqlRequest",
     "V1SqlResponse",
 ]
@@ -0,0 +1,145 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Literal, Sequence
+
+NumberMode = Literal["auto", "float", "decimal"]
+
+NUMBER_TYPES = frozenset(
+    {
+        "number",
+        "count",
+        "count_distinct",
+        "count_distinct_approx",
+        "sum",
+        "avg",
+        "min",
+        "max",
+        "running_total",
+    }
+)
+
+_BOOLEANS: dict[Any, bool] = {
+    "true": True,
+    "false": False,
+    "1": True,
+    "0": False,
+    True: True,
+    False: False,
+}
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "numpy is required for NumPy coercion. "
+            "Install it with `pip install cube-http-client[numpy]`"
+        ) from e
+    return numpy
+
+
+def _int(value: Any) -> int:
+    # `int` would silently truncate floats
+    if isinstance(value, float):
+        raise ValueError(value)
+    return int(value)
+
+
+def _decimal(value: Any) -> Decimal:
+    return Decimal(value if isinstance(value, str) else str(value))
+
+
+def _parse_time(value: str | datetime) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _apply(values: Sequence[Any], parse: Callable[[Any], Any]) -> list[Any]:
+    return [None if value is None else parse(value) for value in values]
+
+
+def _apply_distinct(
+    values: Sequence[Any], parse: Callable[[Any], Any]
+) -> list[Any]:
+    """Parse each distinct value once, for low-cardinality columns like dates."""
+    parsed = {value: parse(value) for value in set(values) if value is not None}
+    return [None if value is None else parsed[value] for value in values]
+
+
+def coerce_numbers(values: Sequence[Any], numbers: NumberMode = "auto") -> Any:
+    """
+    Convert a number column.
+
+    With `auto`, the column becomes ints when every value is integral and
+    floats otherwise.
+    """
+    if numbers == "decimal":
+        return _apply(values, _decimal)
+    if numbers == "auto":
+        try:
+            return _apply(values, _int)
+        except ValueError:
+            pass
+    return _apply(values, float)
+
+
+def coerce_times(values: Sequence[Any]) -> list[datetime | None]:
+    return _apply_distinct(values, _parse_time)
+
+
+def coerce_booleans(values: Sequence[Any]) -> list[Any]:
+    return [_BOOLEANS.get(value, value) for value in values]
+
+
+def coerce_numbers_numpy(
+    values: Sequence[Any], numbers: NumberMode = "auto"
+) -> Any:
+    """Convert a number column to an `int64` or `float64` array, nulls as NaN."""
+    np = _numpy()
+    if numbers == "decimal":
+        return np.array(coerce_numbers(values, "decimal"), dtype=object)
+    if numbers == "auto" and not any(
+        value is None or isinstance(value, float) for value in values
+    ):
+        try:
+            return np.array(values, dtype=np.int64)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return np.array(
+        ["nan" if value is None else value for value in values],
+        dtype=np.float64,
+    )
+
+
+def coerce_times_numpy(values: Sequence[Any]) -> Any:
+    """Convert a time column to a `datetime64[ms]` array, nulls as NaT."""
+    np = _numpy()
+    return np.array(
+        [
+            value.removesuffix("Z") if isinstance(value, str) else value
+            for value in values
+        ],
+        dtype="datetime64[ms]",
+    )
+
+
+def coerce_column(
+    values: Sequence[Any],
+    member_type: str | None,
+    numbers: NumberMode = "auto",
+    numpy: bool = False,
+) -> Any:
+    """Convert a column according to its annotation type, if it has one."""
+    if member_type in NUMBER_TYPES:
+        if numpy:
+            return coerce_numbers_numpy(values, numbers)
+        return coerce_numbers(values, numbers)
+    if member_type == "time":
+        return coerce_times_numpy(values) if numpy else coerce_times(values)
+    if member_type == "boolean":
+        return coerce_booleans(values)
+    return values
@@ -0,0 +1,147 @@
+from array import array
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableSequence,
+    Sequence,
+    cast,
+)
+
+from .load_coercion import NumberMode, coerce_column
+
+Column = MutableSequence[Any]
+
+
+def _compact(values: list[Any]) -> Column:
+    """Store all-int or all-float columns in typed arrays."""
+    if values and all(type(value) is int for value in values):
+        try:
+            return array("q", values)
+        except OverflowError:
+            return values
+    if values and all(type(value) is float for value in values):
+        return array("d", values)
+    return values
+
+
+class V1LoadColumns:
+    """
+    Column-oriented view of load result rows.
+
+    Each member is stored once with its values in a contiguous column, a
+    typed `array` for int and float columns and a list otherwise. Rows are
+    rebuilt on demand when iterating.
+    """
+
+    def __init__(self, columns: Mapping[str, Column], length: int) -> None:
+        self._columns = dict(columns)
+        self._length = length
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Mapping[str, Any]],
+        members: Sequence[str] | None = None,
+    ) -> "V1LoadColumns":
+        """
+        Build columns from row dicts, consuming `rows` only once.
+
+        Args:
+            rows: Result rows, e.g. `result.data` or a load stream
+            members: Optional members to keep, in order. Defaults to every
+                     member found in the rows.
+        """
+        if isinstance(rows, Sequence):
+            if members is None and rows:
+                first = rows[0].keys()
+                if all(row.keys() == first for row in rows):
+                    members = list(first)
+            if members is not None or not rows:
+                # Build one column at a time, much faster than row by row
+                return cls(
+                    {
+                        member: _compact([row.get(member) for row in rows])
+                        for member in members or []
+                    },
+                    len(rows),
+                )
+
+        columns: dict[str, list[Any]] = {member: [] for member in members or []}
+        length = 0
+        for row in rows:
+            if members is None and not row.keys() <= columns.keys():
+                for member in row:
+                    if member not in columns:
+                        columns[member] = [None] * length
+            for member, column in columns.items():
+                column.append(row.get(member))
+            length += 1
+        return cls(
+            {member: _compact(column) for member, column in columns.items()},
+            length,
+        )
+
+    @property
+    def members(self) -> list[str]:
+        return list(self._columns)
+
+    @property
+    def columns(self) -> dict[str, Column]:
+        return self._columns
+
+    def coerce(
+        self,
+        types: Mapping[str, str],
+        numbers: NumberMode = "auto",
+        numpy: bool = False,
+    ) -> "V1LoadColumns":
+        """
+        Convert whole columns according to their member types.
+
+        Numbers become ints, floats or `Decimal`s, times become `datetime`s
+        and booleans become `bool`s. Other columns are kept as they are.
+
+        Args:
+            types: Member types, e.g. `result.annotation.member_types()`
+            numbers: `auto` for ints when every value is integral and floats
+                     otherwise, `float` or `decimal`. Defaults to `auto`.
+            numpy: Return NumPy arrays for number and time columns. Defaults to False.
+        """
+        columns: dict[str, Column] = {}
+        for member, column in self._columns.items():
+            values = coerce_column(column, types.get(member), numbers, numpy)
+            if isinstance(values, list) and values is not column:
+                values = _compact(cast(list[Any], values))
+            columns[member] = values
+        return V1LoadColumns(columns, self._length)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, member: str) -> Column:
+        return self._columns[member]
+
+    def __contains__(self, member: object) -> bool:
+        return member in self._columns
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        members = self.members
+        for values in self.iter_tuples():
+            yield dict(zip(members, values, strict=True))
+
+    def iter_tuples(self) -> Iterator[tuple[Any, ...]]:
+        """Iterate rows as tuples ordered like `members`."""
+        return zip(*self._columns.values(), strict=True)
+
+    def row(self, index: int) -> dict[str, Any]:
+        return {
+            member: column[index] for member, column in self._columns.items()
+        }
+
+    def to_rows(self) -> list[dict[str, Any]]:
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"V1LoadColumns(members={self.members}, rows={self._length})"
@@ -0,0 +1,99 @@
+import importlib
+from array import array
+from typing import Any, Mapping, cast
+
+from .load_coercion import NUMBER_TYPES, coerce_column
+from .load_columns import V1LoadColumns
+
+
+def _require(module: str, extra: str) -> Any:
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"{module} is required for this export. "
+            f"Install it with `pip install cube-http-client[{extra}]`"
+        ) from e
+
+
+def _arrow_cast(pa: Any, arr: Any, *types: Any) -> Any:
+    """Parse a string array with Arrow, trying each type in turn."""
+    for arrow_type in types:
+        try:
+            return arr.cast(arrow_type)
+        except pa.ArrowInvalid:
+            continue
+    return None
+
+
+def _arrow_array(pa: Any, pc: Any, values: Any, member_type: str | None) -> Any:
+    if isinstance(values, array):
+        # Typed columns are handed over as buffers, without copying
+        typed = cast("array[Any]", values)
+        arrow_type = pa.int64() if typed.typecode == "q" else pa.float64()
+        return pa.Array.from_buffers(
+            arrow_type, len(typed), [None, pa.py_buffer(typed)]
+        )
+    if member_type == "string":
+        return pa.array(values, type=pa.string())
+    arr = pa.array(values)
+    if pa.types.is_string(arr.type):
+        # Strings from Cube are parsed by Arrow's vectorized casts, falling
+        # back to Python coercion for formats Arrow does not accept
+        if member_type in NUMBER_TYPES:
+            # A failed int cast is slow, so only try it when no value has a
+            # fraction or exponent
+            fractional = pc.any(pc.match_substring_regex(arr, "[.eEnN]"))
+            if fractional.as_py():
+                parsed = _arrow_cast(pa, arr, pa.float64())
+            else:
+                parsed = _arrow_cast(pa, arr, pa.int64(), pa.float64())
+        elif member_type == "time":
+            parsed = _arrow_cast(pa, arr, pa.timestamp("ms"))
+        elif member_type == "boolean":
+            parsed = _arrow_cast(pa, arr, pa.bool_())
+        else:
+            return arr
+        if parsed is None:
+            return pa.array(coerce_column(values, member_type))
+        return parsed
+    return arr
+
+
+def to_arrow(columns: V1LoadColumns, types: Mapping[str, str]) -> Any:
+    """Build a `pyarrow.Table` from columns, typed from the member types."""
+    pa = _require("pyarrow", "arrow")
+    pc = _require("pyarrow.compute", "arrow")
+    return pa.table(
+        {
+            member: _arrow_array(pa, pc, values, types.get(member))
+            for member, values in columns.columns.items()
+        }
+    )
+
+
+def to_polars(columns: V1LoadColumns, types: Mapping[str, str]) -> Any:
+    """Build a `polars.DataFrame` from coerced columns."""
+    pl = _require("polars", "polars")
+    try:
+        return pl.from_arrow(to_arrow(columns, types))
+    except ImportError:
+        pass
+    coerced = columns.coerce(types)
+    return pl.DataFrame(
+        [
+            pl.Series(
+                member,
+                values.tolist() if isinstance(values, array) else values,
+                dtype=pl.Utf8 if types.get(member) == "string" else None,
+            )
+            for member, values in coerced.columns.items()
+        ]
+    )
+
+
+def to_pandas(columns: V1LoadColumns, types: Mapping[str, str]) -> Any:
+    """Build a `pandas.DataFrame` from columns coerced to NumPy arrays."""
+    pd = _require("pandas", "pandas")
+    coerced = columns.coerce(types, numpy=True)
+    return pd.DataFrame(coerced.columns, copy=False)
@@ -0,0 +1,70 @@
+import copy
+import json
+from typing import Any, Hashable
+
+from ..._canonical import canonical_key
+from ...routes._compression import BodyCompressor
+from .load_request import V1LoadRequest
+
+
+class V1PreparedLoadRequest:
+    """
+    A load request encoded once, for queries sent over and over.
+
+    The request body is serialized when the object is built, together with
+    the canonical key used by the result cache and request coalescing, so
+    loading a prepared request skips both. Prepared requests compare and
+    hash by that key, which makes them usable as keys of your own caches.
+    The request is copied, so later changes to the given dict are ignored.
+    """
+
+    __slots__ = ("request", "body", "key", "_compressed")
+
+    def __init__(self, request: V1LoadRequest) -> None:
+        self.request: V1LoadRequest = copy.deepcopy(request)
+        self.body: bytes = json.dumps(
+            self.request | {"queryType": "multi"}, separators=(",", ":")
+        ).encode()
+        self.key: str = canonical_key(self.request)
+        # Compressed bodies per compression settings, filled on first send
+        self._compressed: dict[Hashable, tuple[bytes, dict[str, str]]] = {}
+
+    @classmethod
+    def from_encoded(
+        cls, request: V1LoadRequest, body: bytes, key: str
+    ) -> "V1PreparedLoadRequest":
+        """
+        Wrap a request whose body and key were computed elsewhere.
+
+        The body and key are trusted as given: they must be what preparing
+        the request would produce, as done by `V1LoadRequestTemplate`.
+        """
+        prepared = cls.__new__(cls)
+        prepared.request = request
+        prepared.body = body
+        prepared.key = key
+        prepared._compressed = {}
+        return prepared
+
+    def compressed_body(
+        self, compressor: BodyCompressor | None
+    ) -> tuple[bytes, dict[str, str]]:
+        """Body to send with its extra headers, compressed once per compressor."""
+        if compressor is None:
+            return self.body, {}
+        compressed = self._compressed.get(compressor.key)
+        if compressed is None:
+            compressed = compressor.compress(self.body)
+            self._compressed[compressor.key] = compressed
+        return compressed
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, V1PreparedLoadRequest):
+            return NotImplemented
+        return self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return f"V1PreparedLoadRequest(key={self.key[:12]}..., {len(self.body)} bytes)"
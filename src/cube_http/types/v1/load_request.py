@@ -99,5 +99,18 @@ class V1LoadRequestQuery(TypedDict):
 
 
 class V1LoadRequest(TypedDict):
-    query: Required[V1LoadRequestQuery]
-    """A single URL encoded Cube Query"""
+    query: Required[Union[V1LoadRequestQuery, list[V1LoadRequestQuery]]]
+    """A single Cube Query, or a list of queries answered with one result each"""
+
+
+def single_query(request: V1LoadRequest, action: str) -> V1LoadRequestQuery:
+    """
+    The query of a request holding a single query.
+
+    Raises:
+        ValueError: If the request holds a list of queries
+    """
+    query = request["query"]
+    if isinstance(query, list):
+        raise ValueError(f"{action} requires a single query")
+    return query
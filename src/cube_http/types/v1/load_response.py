@@ -1,8 +1,13 @@
 from typing import Any
 
-from pydantic import BaseModel, Field
-
-from .._base import ResponseModel
+import httpx
+from pydantic import BaseModel, Field, PrivateAttr
+from typing_extensions import Self
+
+from ..._json import JsonCodec
+from .._base import DecodeOptions, ResponseModel
+from . import load_export
+from .load_columns import V1LoadColumns
 from .operators import FilterOperator
 from .time_granularities import TimeGranularity
 
@@ -25,6 +30,20 @@ class V1LoadResultAnnotation(BaseModel):
         description="Annotations for time dimensions in the result.",
     )
 
+    def member_types(self) -> dict[str, str]:
+        """Type of every annotated member, e.g. `number` or `time`."""
+        return {
+            member: annotation["type"]
+            for members in (
+                self.measures,
+                self.dimensions,
+                self.segments,
+                self.time_dimensions,
+            )
+            for member, annotation in members.items()
+            if "type" in annotation
+        }
+
 
 class V1LoadRequestQueryFilterBase(BaseModel):
     member: str | None = Field(
@@ -219,6 +238,76 @@ class V1LoadResult(BaseModel):
         description="Indicates if the query is considered slow.",
     )
 
+    _columns: V1LoadColumns | None = PrivateAttr(default=None)
+
+    def to_columns(self) -> V1LoadColumns:
+        """
+        Column-oriented view of `data`, built on first use and then reused.
+
+        With the `columnar` decode option the columns are built while decoding
+        and `data` is left empty. With the `coerce` decode option the columns
+        hold values converted according to the annotation.
+        """
+        if self._columns is None:
+            self._columns = V1LoadColumns.from_rows(self.data)
+        return self._columns
+
+    def with_data(self, data: list[dict[str, Any]]) -> Self:
+        """Copy of the result holding `data`, with columns rebuilt on use."""
+        result = self.model_copy(update={"data": data})
+        result._columns = None
+        return result
+
+    def apply_decode(self, decode: DecodeOptions) -> None:
+        """Build the columns for the `columnar` and `coerce` decode options."""
+        columnar = decode.get("columnar", False)
+        coerce = decode.get("coerce", False)
+        if not (columnar or coerce):
+            return
+        columns = V1LoadColumns.from_rows(self.data)
+        if coerce:
+            columns = columns.coerce(
+                self.annotation.member_types(),
+                decode.get("numbers", "auto"),
+                decode.get("numpy", False),
+            )
+        self._columns = columns
+        if columnar:
+            self.data = []
+
+    def to_arrow(self) -> Any:
+        """
+        Result as a `pyarrow.Table` typed from the annotation.
+
+        Requires the `arrow` extra. Int and float columns are handed to Arrow
+        without copying.
+        """
+        return load_export.to_arrow(
+            self.to_columns(), self.annotation.member_types()
+        )
+
+    def to_polars(self) -> Any:
+        """
+        Result as a `polars.DataFrame` typed from the annotation.
+
+        Requires the `polars` extra, and goes through Arrow when `pyarrow` is
+        installed.
+        """
+        return load_export.to_polars(
+            self.to_columns(), self.annotation.member_types()
+        )
+
+    def to_pandas(self) -> Any:
+        """
+        Result as a `pandas.DataFrame` typed from the annotation.
+
+        Requires the `pandas` extra. Number and time columns are built as
+        NumPy arrays rather than inferred from row dicts.
+        """
+        return load_export.to_pandas(
+            self.to_columns(), self.annotation.member_types()
+        )
+
 
 class V1LoadResponse(ResponseModel):
     pivot_query: dict[str, Any] | None = Field(
@@ -243,6 +332,40 @@ class V1LoadResponse(ResponseModel):
         description="list of results obtained from the load response."
     )
 
+    @classmethod
+    def from_response(
+        cls,
+        res: httpx.Response,
+        decode: DecodeOptions | None = None,
+        codec: JsonCodec | None = None,
+    ):
+        decode = decode or {}
+        if decode.get("columnar"):
+            # Rows are repacked into columns, so validating them is wasted work
+            decode = decode | {"trusted": True}
+        model = super().from_response(res, decode, codec)
+        model.apply_decode(decode)
+        return model
+
+    def apply_decode(self, decode: DecodeOptions) -> None:
+        """Apply the `columnar` and `coerce` decode options to every result."""
+        for result in self.results:
+            result.apply_decode(decode)
+
+    @classmethod
+    def from_trusted_payload(cls, payload: dict[str, Any]) -> Self:
+        """
+        Validate everything but the result rows, which are attached as decoded.
+        """
+        results: list[dict[str, Any]] = payload.get("results") or []
+        rows = [result.get("data", []) for result in results]
+        model = cls.model_validate(
+            payload | {"results": [result | {"data": []} for result in results]}
+        )
+        for result, data in zip(model.results, rows, strict=True):
+            result.data = data
+        return model
+
 
 # Handle forward references
 V1LoadRequestQueryFilterLogicalOr.model_rebuild()
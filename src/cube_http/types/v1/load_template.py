@@ -0,0 +1,169 @@
+import hashlib
+import json
+import re
+from typing import Any, Mapping, cast
+
+from ..._canonical import canonical_key, request_queries
+from .load_prepared import V1PreparedLoadRequest
+from .load_request import V1LoadRequest
+
+# Placeholders are encoded as strings no real member value contains, so they
+# can be found again in the serialized body and split out of it
+_SENTINEL = "\x00{}\x00"
+_ENCODED_SENTINEL = re.compile(rb'"\\u0000(.*?)\\u0000"')
+
+
+class V1QueryParam:
+    """
+    A placeholder for a value bound when a `V1LoadRequestTemplate` is used.
+
+    Stands in for the whole `values` list of a filter or a `dateRange`, or
+    for a single item of either.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        if not name.isidentifier():
+            raise ValueError(
+                f"Parameter name must be an identifier, got {name!r}"
+            )
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"V1QueryParam({self.name!r})"
+
+
+def _placeholders(value: Any) -> Any:
+    if isinstance(value, V1QueryParam):
+        return _SENTINEL.format(value.name)
+    if isinstance(value, list):
+        return [_placeholders(item) for item in cast(list[Any], value)]
+    return value
+
+
+def _template_filter(item: Mapping[str, Any]) -> dict[str, Any]:
+    out = dict(item)
+    for logical in ("and", "or"):
+        if logical in out:
+            out[logical] = [_template_filter(f) for f in out[logical]]
+    if "values" in out:
+        out["values"] = _placeholders(out["values"])
+    return out
+
+
+def _template_query(query: Mapping[str, Any]) -> dict[str, Any]:
+    out = dict(query)
+    if "filters" in out:
+        out["filters"] = [_template_filter(f) for f in out["filters"]]
+    if "timeDimensions" in out:
+        out["timeDimensions"] = [
+            {**td, "dateRange": _placeholders(td["dateRange"])}
+            if "dateRange" in td
+            else td
+            for td in out["timeDimensions"]
+        ]
+    return out
+
+
+def _misplaced(value: Any) -> Any:
+    if isinstance(value, V1QueryParam):
+        raise ValueError(
+            f"Parameter {value.name!r} can only be used in filter values "
+            "and time dimension date ranges"
+        )
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable"
+    )
+
+
+def _bind(value: Any, values: Mapping[str, Any]) -> Any:
+    if isinstance(value, dict):
+        items = cast(dict[str, Any], value).items()
+        return {key: _bind(item, values) for key, item in items}
+    if isinstance(value, list):
+        return [_bind(item, values) for item in cast(list[Any], value)]
+    if isinstance(value, str) and value[:1] == value[-1:] == "\x00":
+        return values[value[1:-1]]
+    return value
+
+
+class V1LoadRequestTemplate:
+    """
+    A load request with `V1QueryParam` placeholders, bound at call time.
+
+    The request is serialized once, split around its placeholders, so
+    binding encodes only the given values and splices them between the
+    prepared fragments. Bound requests share the result cache and request
+    coalescing among themselves, keyed by the template and the values.
+
+    Example:
+        ```python
+        template = V1LoadRequestTemplate(
+            {
+                "query": {
+                    "measures": ["tasks.count"],
+                    "filters": [
+                        {
+                            "member": "tasks.status",
+                            "operator": "equals",
+                            "values": [V1QueryParam("status")],
+                        }
+                    ],
+                }
+            }
+        )
+        cube.v1.load(template.bind(status="done"))
+        ```
+    """
+
+    __slots__ = ("request", "params", "_parts", "_key")
+
+    def __init__(self, request: Mapping[str, Any]) -> None:
+        queries = [_template_query(q) for q in request_queries(request)]
+        self.request: dict[str, Any] = dict(request) | {
+            "query": queries
+            if isinstance(request["query"], list)
+            else queries[0]
+        }
+        body = json.dumps(
+            self.request | {"queryType": "multi"},
+            separators=(",", ":"),
+            default=_misplaced,
+        ).encode()
+        # Even items are literal JSON, odd items the names spliced between
+        split = _ENCODED_SENTINEL.split(body)
+        names = [name.decode() for name in split[1::2]]
+        self._parts: list[bytes | str] = [
+            part if i % 2 == 0 else names[i // 2] for i, part in enumerate(split)
+        ]
+        self.params: tuple[str, ...] = tuple(dict.fromkeys(names))
+        self._key = canonical_key(self.request)
+
+    def bind(self, **values: Any) -> V1PreparedLoadRequest:
+        """Fill in the placeholders, returning a request ready to load."""
+        missing = [name for name in self.params if name not in values]
+        if missing:
+            raise ValueError(
+                f"Missing values for parameters: {', '.join(missing)}"
+            )
+        unknown = values.keys() - set(self.params)
+        if unknown:
+            raise ValueError(f"Unknown parameters: {', '.join(sorted(unknown))}")
+
+        encoded = {
+            name: json.dumps(values[name], separators=(",", ":")).encode()
+            for name in self.params
+        }
+        body = b"".join(
+            part if isinstance(part, bytes) else encoded[part]
+            for part in self._parts
+        )
+        key = hashlib.sha256(
+            b"\x00".join([self._key.encode(), *encoded.values()])
+        ).hexdigest()
+        request: V1LoadRequest = _bind(self.request, values)
+        return V1PreparedLoadRequest.from_encoded(request, body, key)
+
+    def __repr__(self) -> str:
+        return f"V1LoadRequestTemplate(params={list(self.params)})"
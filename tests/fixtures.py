@@ -1,5 +1,37 @@
+from typing import Any, Callable
+
+import httpx
+
+import cube_http
 from cube_http.types.v1 import V1LoadRequestQuery
 
+MOCK_URL = "http://cube.test/cubejs-api"
+
+
+def mock_client(
+    handler: Callable[[httpx.Request], httpx.Response], **options: Any
+) -> cube_http.Client:
+    """Build a client whose requests are answered by `handler`."""
+    http_client = httpx.Client(
+        base_url=MOCK_URL,
+        headers={"Authorization": "test-token"},
+        transport=httpx.MockTransport(handler),
+    )
+    return cube_http.Client({"http_client": http_client, **options})
+
+
+def mock_async_client(
+    handler: Callable[[httpx.Request], Any], **options: Any
+) -> cube_http.AsyncClient:
+    """Build an async client whose requests are answered by `handler`."""
+    http_client = httpx.AsyncClient(
+        base_url=MOCK_URL,
+        headers={"Authorization": "test-token"},
+        transport=httpx.MockTransport(handler),
+    )
+    return cube_http.AsyncClient({"http_client": http_client, **options})
+
+
 TEST_QUERIES: list[V1LoadRequestQuery] = [
     {
         "measures": ["accounts.count"],
@@ -149,3 +181,30 @@ TEST_QUERIES: list[V1LoadRequestQuery] = [
         "limit": 100,
     },
 ]
+
+LOAD_RESPONSE: dict[str, Any] = {
+    "queryType": "regularQuery",
+    "results": [
+        {
+            "query": {
+                "measures": ["tasks.count"],
+                "dimensions": ["tasks.status"],
+            },
+            "lastRefreshTime": "2024-06-01T00:00:00.000Z",
+            "annotation": {
+                "measures": {
+                    "tasks.count": {"title": "Tasks Count", "type": "number"}
+                },
+                "dimensions": {
+                    "tasks.status": {"title": "Tasks Status", "type": "string"}
+                },
+                "segments": {},
+                "timeDimensions": {},
+            },
+            "data": [
+                {"tasks.status": "Completed", "tasks.count": "42"},
+                {"tasks.status": "Open", "tasks.count": "7"},
+            ],
+        }
+    ],
+}
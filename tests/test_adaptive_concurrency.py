@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from cube_http.exc import V1LoadError
+from cube_http.routes._limiter import AdaptiveLimiter, AsyncAdaptiveLimiter
+from cube_http.types.v1 import V1LoadRequest, V1LoadResponse
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+QUERY: V1LoadRequest = {"query": {"measures": ["tasks.count"]}}
+
+
+def _run(limiter: AdaptiveLimiter, latency: float, overloaded: bool = False):
+    limiter.acquire()
+    limiter.release(latency, overloaded)
+
+
+def test_limit_grows_additively_while_in_use():
+    """Test that fast requests using the limit slowly raise it up to the maximum."""
+    limiter = AdaptiveLimiter({"initial_limit": 2, "max_limit": 4})
+    limits: list[int] = []
+    for _ in range(4):
+        slots = limiter.limit
+        for _ in range(slots):
+            limiter.acquire()
+        for _ in range(slots):
+            limiter.release(0.01)
+        limits.append(limiter.limit)
+
+    assert limits == [2, 3, 3, 4]
+    _run(limiter, 0.01)
+    assert limiter.limit == 4
+
+
+def test_limit_shrinks_on_overload_and_latency():
+    """Test the multiplicative decrease and its lower bound."""
+    limiter = AdaptiveLimiter(
+        {"initial_limit": 10, "backoff_ratio": 0.5, "min_limit": 3}
+    )
+    _run(limiter, 0.0, overloaded=True)
+    assert limiter.limit == 5
+
+    limiter = AdaptiveLimiter({"initial_limit": 10, "backoff_ratio": 0.5})
+    _run(limiter, 0.01)
+    _run(limiter, 0.05)  # 5x the lowest latency
+    assert limiter.limit == 5
+    _run(limiter, 0.05, overloaded=True)  # within the same round
+    assert limiter.limit == 5
+    assert limiter.overloads == 2
+
+    limiter = AdaptiveLimiter({"initial_limit": 2, "min_limit": 1})
+    for _ in range(20):
+        _run(limiter, 0, overloaded=True)
+        time.sleep(0.001)
+    assert limiter.limit == 1
+
+
+def test_sync_client_stays_within_the_limit():
+    """Test that threads queue once the limit is reached."""
+    active: list[None] = []
+    peak: list[int] = []
+    lock = threading.Lock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            active.append(None)
+            peak.append(len(active))
+        time.sleep(0.01)
+        with lock:
+            active.pop()
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    cube = mock_client(
+        handler, adaptive_concurrency={"initial_limit": 2}, max_concurrency=2
+    )
+
+    def load(_: int) -> V1LoadResponse:
+        return cube.v1.load(QUERY)
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        list(pool.map(load, range(6)))
+
+    limiter = cube.v1.concurrency_limiter
+    assert limiter is not None
+    assert max(peak) == 2
+    assert limiter.acquired == 6
+    assert limiter.in_flight == limiter.queued == 0
+    assert limiter.wait_time > 0
+
+
+def test_limit_stays_within_its_bounds():
+    """Test that the initial limit is clamped to the minimum and maximum."""
+    assert AdaptiveLimiter({"max_limit": 5, "initial_limit": 50}).limit == 5
+    assert AdaptiveLimiter({"min_limit": 4, "initial_limit": 2}).limit == 4
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_caps_the_adaptive_limit():
+    """Test that max_concurrency bounds requests in flight from the start."""
+    peak: list[int] = []
+    active: list[None] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        active.append(None)
+        peak.append(len(active))
+        await asyncio.sleep(0.01)
+        active.pop()
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    cube = mock_async_client(handler, adaptive_concurrency={}, max_concurrency=3)
+    await asyncio.gather(*(cube.v1.load(QUERY) for _ in range(10)))
+
+    assert max(peak) == 3
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_async_client_backs_off_on_rate_limits():
+    """Test that 429 answers shrink the limit of the async client."""
+    peak: list[int] = []
+    active: list[None] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        active.append(None)
+        peak.append(len(active))
+        await asyncio.sleep(0.01)
+        active.pop()
+        return httpx.Response(429, json={"error": "Too many requests"})
+
+    cube = mock_async_client(
+        handler, adaptive_concurrency={"initial_limit": 4, "backoff_ratio": 0.5}
+    )
+    results = await asyncio.gather(
+        *(cube.v1.load(QUERY) for _ in range(8)), return_exceptions=True
+    )
+
+    limiter = cube.v1.concurrency_limiter
+    assert limiter is not None
+    assert all(isinstance(r, V1LoadError) for r in results)
+    assert max(peak) == 4
+    assert limiter.limit < 4
+    assert limiter.in_flight == limiter.queued == 0
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiters_do_not_leak_slots():
+    """Test that cancelling a queued task leaves the limit intact."""
+    limiter = AsyncAdaptiveLimiter({"initial_limit": 1})
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.queued == 1
+
+    waiter.cancel()
+    await asyncio.sleep(0)
+    limiter.release(None)
+
+    assert limiter.in_flight == limiter.queued == 0
+    await asyncio.wait_for(limiter.acquire(), timeout=1)
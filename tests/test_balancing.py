@@ -0,0 +1,163 @@
+import asyncio
+import json
+from collections import Counter
+from typing import AsyncIterator, Callable
+
+import httpx
+import pytest
+from typing_extensions import Unpack
+
+import cube_http
+from cube_http._balancing import (
+    AsyncLoadBalancingTransport,
+    EndpointPool,
+    LoadBalancingOptions,
+    LoadBalancingTransport,
+)
+from cube_http.types.v1 import V1LoadRequest
+
+from .fixtures import LOAD_RESPONSE
+
+URLS = ["http://a.test/cubejs-api", "http://b.test/cubejs-api"]
+QUERY: V1LoadRequest = {"query": {"measures": ["tasks.count"]}}
+
+
+def _balanced_client(
+    handler: Callable[[httpx.Request], httpx.Response],
+    **options: Unpack[LoadBalancingOptions],
+) -> cube_http.Client:
+    """Build a client whose balanced requests are answered by `handler`."""
+    pool = EndpointPool(URLS, options)
+    transport = LoadBalancingTransport(httpx.MockTransport(handler), pool)
+    http_client = httpx.Client(
+        base_url=URLS[0],
+        headers={"Authorization": "test-token"},
+        transport=transport,
+    )
+    return cube_http.Client({"http_client": http_client})
+
+
+def test_round_robin_spreads_requests():
+    """Test that requests alternate between endpoints with the same path."""
+    seen: list[httpx.URL] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url)
+        assert request.headers["host"] == request.url.host
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    cube = _balanced_client(handler, strategy="round_robin")
+    for _ in range(4):
+        cube.v1.load(QUERY)
+
+    assert Counter(url.host for url in seen) == {"a.test": 2, "b.test": 2}
+    assert {url.path for url in seen} == {"/cubejs-api/v1/load"}
+
+
+def test_failover_and_health():
+    """Test that a dead endpoint fails over and is taken out of rotation."""
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.host)
+        if request.url.host == "a.test":
+            raise httpx.ConnectError("refused")
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    cube = _balanced_client(handler, strategy="round_robin", max_failures=1)
+    for _ in range(4):
+        cube.v1.load(QUERY)
+
+    assert seen.count("a.test") == 1
+    assert seen.count("b.test") == 4
+
+
+def test_failover_can_be_disabled():
+    """Test that transport errors are raised as is without failover."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused")
+
+    cube = _balanced_client(handler, failover=False)
+    with pytest.raises(httpx.ConnectError):
+        cube.v1.load(QUERY)
+
+
+def test_least_outstanding_and_ewma_selection():
+    """Test that busy and slow endpoints are avoided."""
+    pool = EndpointPool(URLS, {"strategy": "least_outstanding"})
+    busy = pool.acquire()
+    assert busy is not None
+    assert pool.acquire() is not busy
+
+    pool = EndpointPool(URLS, {"strategy": "ewma"})
+    slow, fast = pool.endpoints
+    pool.record(slow, 1.0, httpx.Response(200))
+    pool.record(fast, 0.1, httpx.Response(200))
+    assert all(pool.acquire() is fast for _ in range(3))
+
+
+@pytest.mark.asyncio
+async def test_client_accepts_a_list_of_urls(monkeypatch: pytest.MonkeyPatch):
+    """Test that a list of URLs balances the client's own transport."""
+    seen: list[str] = []
+
+    def handle(
+        transport: httpx.BaseTransport, request: httpx.Request
+    ) -> httpx.Response:
+        seen.append(request.url.host)
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    async def handle_async(
+        transport: httpx.AsyncBaseTransport, request: httpx.Request
+    ) -> httpx.Response:
+        return handle(httpx.BaseTransport(), request)
+
+    monkeypatch.setattr(httpx.HTTPTransport, "handle_request", handle)
+    monkeypatch.setattr(
+        httpx.AsyncHTTPTransport, "handle_async_request", handle_async
+    )
+
+    cube = cube_http.Client({"url": URLS, "token": "test-token"})
+    assert cube.http_client.base_url == httpx.URL(URLS[0] + "/")
+    cube.v1.load(QUERY)
+    cube.v1.load(QUERY)
+
+    async_cube = cube_http.AsyncClient({"url": URLS, "token": "test-token"})
+    await async_cube.v1.load(QUERY)
+    await async_cube.v1.load(QUERY)
+    await async_cube.close()
+
+    assert sorted(seen) == ["a.test", "a.test", "b.test", "b.test"]
+
+    with pytest.raises(ValueError):
+        cube_http.Client({"url": URLS, "http_client": httpx.Client()})
+
+
+@pytest.mark.asyncio
+async def test_async_outstanding_requests_are_released():
+    """Test that outstanding counts drop once responses are read."""
+
+    class Body(httpx.AsyncByteStream):
+        async def __aiter__(self) -> AsyncIterator[bytes]:
+            yield json.dumps(LOAD_RESPONSE).encode()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.01)
+        assert sum(e.outstanding for e in pool.endpoints) > 0
+        return httpx.Response(200, stream=Body())
+
+    pool = EndpointPool(URLS, {})
+    http_client = httpx.AsyncClient(
+        base_url=URLS[0],
+        headers={"Authorization": "test-token"},
+        transport=AsyncLoadBalancingTransport(
+            httpx.MockTransport(handler), pool
+        ),
+    )
+    cube = cube_http.AsyncClient({"http_client": http_client})
+
+    await asyncio.gather(*(cube.v1.load(QUERY) for _ in range(6)))
+
+    assert [e.outstanding for e in pool.endpoints] == [0, 0]
+    await cube.close()
@@ -0,0 +1,147 @@
+import asyncio
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from cube_http.exc import V1LoadError
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+
+def _handler(bodies: list[Any]):
+    """Answer each query with one row naming its measure, failing `bad.*`."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)["query"]
+        bodies.append(query)
+        queries: list[dict[str, Any]] = (
+            [query] if isinstance(query, dict) else query
+        )
+        if any(q["measures"][0].startswith("bad.") for q in queries):
+            return httpx.Response(400, json={"error": "Bad query"})
+        if any(q["measures"][0].startswith("down.") for q in queries):
+            return httpx.Response(503, json={"error": "Unavailable"})
+        results = [
+            LOAD_RESPONSE["results"][0]
+            | {"query": q, "data": [{"measure": q["measures"][0]}]}
+            for q in queries
+        ]
+        return httpx.Response(200, json=LOAD_RESPONSE | {"results": results})
+
+    return handler
+
+
+def _query(measure: str, granularity: str | None = "day") -> Any:
+    time_dimension = {"dimension": "tasks.created_at", "dateRange": "last week"}
+    if granularity is not None:
+        time_dimension["granularity"] = granularity
+    return {"query": {"measures": [measure], "timeDimensions": [time_dimension]}}
+
+
+def test_load_accepts_a_list_of_queries():
+    """Test that several queries are answered in one round trip."""
+    bodies: list[Any] = []
+    cube = mock_client(_handler(bodies))
+
+    response = cube.v1.load(
+        {"query": [{"measures": ["a.count"]}, {"measures": ["b.count"]}]}
+    )
+
+    assert len(bodies) == 1
+    assert [r.data[0]["measure"] for r in response.results] == [
+        "a.count",
+        "b.count",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_loads_are_batched():
+    """Test that loads issued together share one request."""
+    bodies: list[Any] = []
+    cube = mock_async_client(_handler(bodies), load_batching={"window": 0.01})
+
+    responses = await asyncio.gather(
+        *(cube.v1.load(_query(f"tile{i}.count")) for i in range(5))
+    )
+
+    assert len(bodies) == 1
+    assert len(bodies[0]) == 5
+    assert [r.results[0].data[0]["measure"] for r in responses] == [
+        f"tile{i}.count" for i in range(5)
+    ]
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_async_batches_respect_max_queries():
+    """Test that full batches are sent without waiting for the window."""
+    bodies: list[Any] = []
+    cube = mock_async_client(
+        _handler(bodies), load_batching={"window": 10, "max_queries": 3}
+    )
+
+    responses = await asyncio.wait_for(
+        asyncio.gather(*(cube.v1.load(_query(f"t{i}.count")) for i in range(6))),
+        timeout=1,
+    )
+
+    assert [len(body) for body in bodies] == [3, 3]
+    assert len(responses) == 6
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_to_single_queries():
+    """Test that one bad query only fails its own caller."""
+    bodies: list[Any] = []
+    cube = mock_async_client(_handler(bodies), load_batching={"window": 0.01})
+
+    good, bad = await asyncio.gather(
+        cube.v1.load(_query("good.count")),
+        cube.v1.load(_query("bad.count")),
+        return_exceptions=True,
+    )
+
+    assert not isinstance(good, BaseException)
+    assert good.results[0].data[0]["measure"] == "good.count"
+    assert isinstance(bad, V1LoadError)
+    assert len(bodies) == 3
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_async_batches_share_one_granularity():
+    """Test that only queries grouped by the same granularity are batched."""
+    bodies: list[Any] = []
+    cube = mock_async_client(_handler(bodies), load_batching={"window": 0.01})
+
+    await asyncio.gather(
+        cube.v1.load(_query("a.count")),
+        cube.v1.load(_query("b.count")),
+        cube.v1.load(_query("c.count", "month")),
+        cube.v1.load(_query("d.count", None)),
+        cube.v1.load({"query": {"measures": ["e.count"]}}),
+    )
+
+    assert len(bodies) == 4
+    assert sum(isinstance(body, list) for body in bodies) == 1
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_overloaded_batch_fails_every_query():
+    """Test that a 5xx batch is not retried as single queries."""
+    bodies: list[Any] = []
+    cube = mock_async_client(_handler(bodies), load_batching={"window": 0.01})
+
+    results = await asyncio.gather(
+        cube.v1.load(_query("good.count")),
+        cube.v1.load(_query("down.count")),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, V1LoadError) for r in results)
+    assert len(bodies) == 1
+    await cube.close()
@@ -0,0 +1,136 @@
+import time
+
+import httpx
+import pytest
+
+from cube_http.exc import CircuitOpenError, V1LoadError
+from cube_http.routes._circuit import CircuitBreaker, CircuitBreakerOptions
+from cube_http.types.v1 import V1LoadRequest
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+QUERY: V1LoadRequest = {"query": {"measures": ["tasks.count"]}}
+BREAKER: CircuitBreakerOptions = {
+    "window": 4,
+    "min_calls": 4,
+    "open_duration": 0.05,
+}
+
+
+def _switchable():
+    """Fail with 503 while `state["down"]` is set, else succeed."""
+    state = {"down": True, "calls": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        state["calls"] += 1
+        if state["down"]:
+            return httpx.Response(503, json={"error": "down"})
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    return handler, state
+
+
+def test_opens_after_failure_rate_and_fails_fast():
+    """Test that the circuit opens and no more requests reach Cube."""
+    handler, state = _switchable()
+    cube = mock_client(handler, circuit_breaker=BREAKER)
+
+    for _ in range(4):
+        with pytest.raises(V1LoadError):
+            cube.v1.load(QUERY)
+    with pytest.raises(CircuitOpenError) as e:
+        cube.v1.load(QUERY)
+
+    assert state["calls"] == 4
+    assert e.value.retry_after > 0
+    assert cube.v1.circuit_breaker is not None
+    assert cube.v1.circuit_breaker.state == "open"
+
+
+def test_half_open_probe_closes_or_reopens():
+    """Test that a successful probe closes the circuit and a failed one reopens it."""
+    handler, state = _switchable()
+    cube = mock_client(handler, circuit_breaker=BREAKER)
+    for _ in range(4):
+        with pytest.raises(V1LoadError):
+            cube.v1.load(QUERY)
+
+    time.sleep(0.06)
+    assert cube.v1.circuit_breaker.state == "half_open"  # type: ignore
+    with pytest.raises(V1LoadError):
+        cube.v1.load(QUERY)
+    with pytest.raises(CircuitOpenError):
+        cube.v1.load(QUERY)
+
+    time.sleep(0.06)
+    state["down"] = False
+    cube.v1.load(QUERY)
+    assert cube.v1.circuit_breaker.state == "closed"  # type: ignore
+    assert state["calls"] == 6
+
+
+def test_slow_calls_and_transport_errors_count():
+    """Test the latency threshold and connection failures as failures."""
+    breaker = CircuitBreaker(
+        {"window": 2, "min_calls": 2, "slow_call_duration": 1}
+    )
+    breaker.record(breaker.before_request(), False, 2.0)
+    breaker.record(breaker.before_request(), False, 0.1)
+    assert breaker.state == "open"
+
+    def refuse(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused")
+
+    cube = mock_client(refuse, circuit_breaker={"window": 1, "min_calls": 1})
+    with pytest.raises(httpx.ConnectError):
+        cube.v1.load(QUERY)
+    with pytest.raises(CircuitOpenError):
+        cube.v1.load(QUERY)
+
+
+def test_outcomes_from_an_earlier_state_are_ignored():
+    """Test that a request reserved while closed does not count as a probe."""
+    breaker = CircuitBreaker(BREAKER)
+    stale = breaker.before_request()
+    for _ in range(4):
+        breaker.record(breaker.before_request(), True, 0.0)
+    assert breaker.state == "open"
+
+    time.sleep(0.06)
+    probe = breaker.before_request()
+    breaker.record(stale, False, 0.0)
+    assert breaker.state == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record(probe, False, 0.0)
+    assert breaker.state == "closed"
+
+
+def test_client_errors_do_not_count():
+    """Test that 4xx responses leave the circuit closed."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(400, json={"error": "Bad query"})
+
+    cube = mock_client(handler, circuit_breaker=BREAKER)
+    for _ in range(8):
+        with pytest.raises(V1LoadError):
+            cube.v1.load(QUERY)
+    assert cube.v1.circuit_breaker.state == "closed"  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_async_circuit_breaker():
+    """Test that the async client fails fast the same way."""
+    handler, state = _switchable()
+    cube = mock_async_client(handler, circuit_breaker=BREAKER)
+
+    for _ in range(4):
+        with pytest.raises(V1LoadError):
+            await cube.v1.load(QUERY)
+    with pytest.raises(CircuitOpenError):
+        await cube.v1.load(QUERY)
+
+    assert state["calls"] == 4
+    await cube.close()
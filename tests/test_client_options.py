@@ -1,3 +1,6 @@
+import socket
+from typing import Any
+
 import httpx
 import pytest
 
@@ -141,3 +144,42 @@ def test_client_without_changes():
     )
     assert cube.http_client.headers["authorization"] == "test-token"
     assert cube.http_client.headers["content-type"] == "application/json"
+
+
+def test_transport_options(monkeypatch: pytest.MonkeyPatch):
+    """Test that HTTP/2, pool limits and socket options reach the transport."""
+    pytest.importorskip("h2")
+    nodelay = (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    transports: list[dict[str, Any]] = []
+    init = httpx.AsyncHTTPTransport.__init__
+
+    def record(self: httpx.AsyncHTTPTransport, **kwargs: Any) -> None:
+        transports.append(kwargs)
+        init(self, **kwargs)
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "__init__", record)
+    cube_http.AsyncClient(
+        {
+            "url": "http://localhost:4000/cubejs-api",
+            "token": "test-token",
+            "http2": True,
+            "limits": {"max_connections": 50},
+            "socket_options": [nodelay],
+        }
+    )
+
+    [transport] = transports
+    assert transport["http2"]
+    assert transport["limits"] == httpx.Limits(
+        max_connections=50, max_keepalive_connections=20, keepalive_expiry=5.0
+    )
+    assert transport["socket_options"] == [nodelay]
+
+    with pytest.raises(ValueError, match="http2, limits"):
+        cube_http.Client(
+            {
+                "http_client": httpx.Client(),
+                "http2": True,
+                "limits": httpx.Limits(),
+            }
+        )
@@ -0,0 +1,147 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from cube_http.exc import V1LoadError
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+
+@pytest.mark.asyncio
+async def test_async_identical_loads_share_one_request():
+    """Test that concurrent identical loads share a request and response."""
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    cube = mock_async_client(handler, coalesce_requests=True)
+    results = await asyncio.gather(
+        *(
+            cube.v1.load({"query": {"measures": ["tasks.count"]}})
+            for _ in range(20)
+        ),
+        cube.v1.load({"query": {"measures": ["accounts.count"]}}),
+    )
+
+    assert len(requests) == 2
+    assert all(result is results[0] for result in results[:20])
+    assert results[20] is not results[0]
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_async_member_order_is_not_coalesced_without_order():
+    """Test that loads differing in member order do not share a request."""
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    cube = mock_async_client(handler, coalesce_requests=True)
+    first, second = await asyncio.gather(
+        cube.v1.load(
+            {"query": {"measures": ["tasks.count", "tasks.hours"], "limit": 10}}
+        ),
+        cube.v1.load(
+            {"query": {"measures": ["tasks.hours", "tasks.count"], "limit": 10}}
+        ),
+    )
+
+    assert len(requests) == 2
+    assert first is not second
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_async_sql_keeps_member_order():
+    """Test that SQL compilations differing in member order are not coalesced."""
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"sql": {"sql": ["SELECT 1", []]}})
+
+    cube = mock_async_client(handler, coalesce_requests=True)
+    order: list[list[str]] = [["tasks.count", "desc"]]
+    await asyncio.gather(
+        cube.v1.sql(
+            {
+                "query": {
+                    "measures": ["tasks.count", "tasks.hours"],
+                    "order": order,
+                }
+            }
+        ),
+        cube.v1.sql(
+            {
+                "query": {
+                    "measures": ["tasks.count", "tasks.hours"],
+                    "order": order,
+                }
+            }
+        ),
+        cube.v1.sql(
+            {
+                "query": {
+                    "measures": ["tasks.hours", "tasks.count"],
+                    "order": order,
+                }
+            }
+        ),
+    )
+
+    assert len(requests) == 2
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_async_coalesced_errors_reach_every_caller():
+    """Test that a failed shared request raises for all callers."""
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(400, json={"error": "Bad query"})
+
+    cube = mock_async_client(handler, coalesce_requests=True)
+    results = await asyncio.gather(
+        *(cube.v1.load({"query": {"measures": ["x.y"]}}) for _ in range(5)),
+        return_exceptions=True,
+    )
+
+    assert len(requests) == 1
+    assert all(isinstance(result, V1LoadError) for result in results)
+    await cube.close()
+
+
+def test_sync_identical_loads_share_one_request():
+    """Test that identical loads from a thread pool share a request."""
+    requests: list[httpx.Request] = []
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        release.wait(timeout=5)
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    cube = mock_client(handler, coalesce_requests=True)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [
+            pool.submit(cube.v1.load, {"query": {"measures": ["tasks.count"]}})
+            for _ in range(8)
+        ]
+        threading.Timer(0.2, release.set).start()
+        results = [future.result() for future in futures]
+
+    assert len(requests) == 1
+    assert all(result is results[0] for result in results)
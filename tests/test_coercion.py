@@ -0,0 +1,103 @@
+from array import array
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+import httpx
+import pytest
+
+from cube_http.types.v1 import V1LoadColumns
+
+from .fixtures import LOAD_RESPONSE, mock_client
+
+TYPES = {
+    "orders.count": "number",
+    "orders.amount": "number",
+    "orders.createdAt.day": "time",
+    "orders.isPaid": "boolean",
+    "orders.status": "string",
+}
+
+ROWS = [
+    {
+        "orders.count": "3",
+        "orders.amount": "10.5",
+        "orders.createdAt.day": "2024-01-02T00:00:00.000",
+        "orders.isPaid": "true",
+        "orders.status": "shipped",
+    },
+    {
+        "orders.count": "4",
+        "orders.amount": None,
+        "orders.createdAt.day": "2024-01-02T00:00:00.000",
+        "orders.isPaid": False,
+        "orders.status": "open",
+    },
+]
+
+
+def test_coerce_converts_columns_by_type():
+    """Test that columns are converted according to member types."""
+    columns = V1LoadColumns.from_rows(ROWS).coerce(TYPES)
+
+    assert columns["orders.count"] == array("q", [3, 4])
+    assert columns["orders.amount"] == [10.5, None]
+    assert columns["orders.createdAt.day"] == [datetime(2024, 1, 2)] * 2
+    assert columns["orders.isPaid"] == [True, False]
+    assert columns["orders.status"] == ["shipped", "open"]
+
+
+def test_coerce_number_modes():
+    """Test float and decimal number conversion."""
+    columns = V1LoadColumns.from_rows(ROWS)
+
+    floats = columns.coerce(TYPES, numbers="float")
+    decimals = columns.coerce(TYPES, numbers="decimal")
+
+    assert floats["orders.count"] == array("d", [3.0, 4.0])
+    assert decimals["orders.count"] == [Decimal("3"), Decimal("4")]
+    assert decimals["orders.amount"] == [Decimal("10.5"), None]
+
+
+def test_coerce_does_not_truncate_floats():
+    """Test that float values never end up in an int column."""
+    columns = V1LoadColumns.from_rows([{"a": 1.5}, {"a": 2}])
+
+    assert list(columns.coerce({"a": "number"})["a"]) == [1.5, 2.0]
+
+
+def test_coerce_parses_utc_suffix():
+    """Test that times with a `Z` suffix are timezone aware."""
+    columns = V1LoadColumns.from_rows([{"t": "2024-06-01T00:00:00.000Z"}])
+
+    assert columns.coerce({"t": "time"})["t"] == [
+        datetime(2024, 6, 1, tzinfo=timezone.utc)
+    ]
+
+
+def test_coerce_numpy():
+    """Test NumPy arrays for number and time columns."""
+    np = pytest.importorskip("numpy")
+
+    columns = V1LoadColumns.from_rows(ROWS).coerce(TYPES, numpy=True)
+
+    # NumPy arrays stand in for the array and list columns here
+    counts: Any = columns["orders.count"]
+    days: Any = columns["orders.createdAt.day"]
+    assert counts.dtype == np.int64
+    assert np.isnan(columns["orders.amount"][1])
+    assert days.dtype == np.dtype("datetime64[ms]")
+
+
+def test_coerce_decode_option():
+    """Test that the coerce decode option converts columns using the annotation."""
+    cube = mock_client(
+        lambda request: httpx.Response(200, json=LOAD_RESPONSE),
+        decode={"coerce": True},
+    )
+
+    result = cube.v1.load({"query": {"measures": ["tasks.count"]}}).results[0]
+
+    assert result.data[0]["tasks.count"] == "42"
+    assert result.to_columns()["tasks.count"] == array("q", [42, 7])
+    assert result.to_columns()["tasks.status"] == ["Completed", "Open"]
@@ -0,0 +1,74 @@
+from array import array
+
+import httpx
+
+from cube_http.types.v1 import V1LoadColumns, V1LoadRequest
+
+from .fixtures import LOAD_RESPONSE, mock_client
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=LOAD_RESPONSE)
+
+
+def test_columns_round_trip_rows():
+    """Test that columns store each member once and rebuild the rows."""
+    rows = [
+        {"orders.status": "shipped", "orders.count": 3, "orders.total": 9.5},
+        {"orders.status": "open", "orders.count": 1, "orders.total": 2.0},
+    ]
+
+    columns = V1LoadColumns.from_rows(rows)
+
+    assert len(columns) == 2
+    assert columns.members == ["orders.status", "orders.count", "orders.total"]
+    assert columns["orders.status"] == ["shipped", "open"]
+    assert columns["orders.count"] == array("q", [3, 1])
+    assert columns["orders.total"] == array("d", [9.5, 2.0])
+    assert columns.to_rows() == rows
+    assert columns.row(1) == rows[1]
+
+
+def test_columns_fill_missing_members():
+    """Test that members missing from some rows are filled with None."""
+    columns = V1LoadColumns.from_rows([{"a": "x"}, {"a": "y", "b": 2}])
+
+    assert columns["a"] == ["x", "y"]
+    assert columns["b"] == [None, 2]
+
+    selected = V1LoadColumns.from_rows([{"a": "x", "b": 1}], members=["b"])
+    assert selected.members == ["b"]
+
+
+def test_to_columns_is_built_once():
+    """Test that the columnar view of a result is cached."""
+    cube = mock_client(_handler)
+    result = cube.v1.load({"query": {"measures": ["tasks.count"]}}).results[0]
+
+    columns = result.to_columns()
+
+    assert columns is result.to_columns()
+    assert list(columns) == result.data
+
+
+def test_columnar_decode_replaces_rows():
+    """Test that columnar decoding leaves only the columns in memory."""
+    cube = mock_client(_handler, decode={"columnar": True})
+    query: V1LoadRequest = {"query": {"measures": ["tasks.count"]}}
+
+    result = cube.v1.load(query).results[0]
+    rows = cube.v1.load(query, decode={"columnar": False}).results[0].data
+
+    assert result.data == []
+    assert result.to_columns()["tasks.count"] == ["42", "7"]
+    assert result.to_columns().to_rows() == rows
+
+
+def test_columns_from_stream():
+    """Test that streamed rows can be collected straight into columns."""
+    cube = mock_client(_handler)
+
+    with cube.v1.load_stream({"query": {"measures": ["tasks.count"]}}) as rows:
+        columns = V1LoadColumns.from_rows(rows)
+
+    assert columns["tasks.status"] == ["Completed", "Open"]
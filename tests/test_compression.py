@@ -0,0 +1,66 @@
+import gzip
+import json
+
+import httpx
+import pytest
+
+from cube_http.routes._compression import BodyCompressor
+from cube_http.types.v1 import V1LoadRequest
+
+from .fixtures import LOAD_RESPONSE, mock_client
+
+IDS = [str(i) for i in range(500)]
+LARGE_QUERY: V1LoadRequest = {
+    "query": {
+        "measures": ["tasks.count"],
+        "filters": [{"member": "tasks.id", "operator": "equals", "values": IDS}],
+    }
+}
+
+
+def _recorder(requests: list[httpx.Request]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    return handler
+
+
+def test_large_bodies_are_gzipped():
+    """Test that bodies above the threshold are sent gzip-encoded."""
+    requests: list[httpx.Request] = []
+    cube = mock_client(_recorder(requests), compression={"threshold": 1024})
+
+    cube.v1.load(LARGE_QUERY)
+    cube.v1.load({"query": {"measures": ["tasks.count"]}})
+
+    large, small = requests
+    assert large.headers["content-encoding"] == "gzip"
+    assert (
+        json.loads(gzip.decompress(large.content))["query"]
+        == LARGE_QUERY["query"]
+    )
+    assert len(large.content) < len(gzip.decompress(large.content)) / 2
+    assert "content-encoding" not in small.headers
+    assert json.loads(small.content)["query"]["measures"] == ["tasks.count"]
+
+
+def test_zstd_bodies():
+    """Test zstd compression with a custom level."""
+    zstandard = pytest.importorskip("zstandard")
+    compressor = BodyCompressor(
+        {"algorithm": "zstd", "threshold": 0, "level": 1}
+    )
+
+    content, headers = compressor.compress(b'{"query":{}}' * 100)
+
+    assert headers == {"Content-Encoding": "zstd"}
+    assert (
+        zstandard.ZstdDecompressor().decompress(content) == b'{"query":{}}' * 100
+    )
+
+
+def test_unknown_algorithm():
+    """Test that unsupported algorithms are rejected up front."""
+    with pytest.raises(ValueError, match="brotli"):
+        BodyCompressor({"algorithm": "brotli"})  # type: ignore
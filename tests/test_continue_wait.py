@@ -0,0 +1,87 @@
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from cube_http.exc import V1LoadError, V1SqlError
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+CONTINUE_WAIT: dict[str, Any] = {"error": "Continue wait"}
+
+SQL_RESPONSE: dict[str, Any] = {"sql": {"sql": ["SELECT 1", []]}}
+
+
+def _responder(
+    payload: dict[str, Any], waits: int
+) -> tuple[Callable[[httpx.Request], httpx.Response], list[httpx.Request]]:
+    """Build a handler answering `Continue wait` a number of times first."""
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if len(seen) <= waits:
+            return httpx.Response(200, json=CONTINUE_WAIT)
+        return httpx.Response(200, json=payload)
+
+    return handler, seen
+
+
+def test_load_polls_until_ready():
+    """Test that load re-sends the request while Cube asks to wait."""
+    handler, seen = _responder(LOAD_RESPONSE, waits=3)
+    cube = mock_client(handler, continue_wait={"interval": 0})
+
+    result = cube.v1.load({"query": {"measures": ["tasks.count"]}})
+
+    assert result.polls == 3
+    assert len(seen) == 4
+    assert len({id(request) for request in seen}) == 1
+    assert result.results[0].data[0]["tasks.count"] == "42"
+
+
+def test_sql_polls_until_ready():
+    """Test that sql re-sends the request while Cube asks to wait."""
+    handler, seen = _responder(SQL_RESPONSE, waits=2)
+    cube = mock_client(handler, continue_wait={"interval": 0})
+
+    result = cube.v1.sql({"query": {"measures": ["tasks.count"]}})
+
+    assert result.polls == 2
+    assert len(seen) == 3
+
+
+def test_continue_wait_without_polling_raises():
+    """Test that a pending query raises instead of failing validation."""
+    handler, seen = _responder(LOAD_RESPONSE, waits=1)
+    cube = mock_client(handler)
+
+    with pytest.raises(V1LoadError, match="Continue wait") as exc_info:
+        cube.v1.load({"query": {"measures": ["tasks.count"]}})
+
+    assert exc_info.value.status_code == 200
+    assert len(seen) == 1
+
+
+def test_continue_wait_deadline():
+    """Test that polling stops once the overall deadline passes."""
+    handler, _ = _responder(SQL_RESPONSE, waits=1000)
+    cube = mock_client(
+        handler, continue_wait={"interval": 0.01, "backoff": 1, "timeout": 0.05}
+    )
+
+    with pytest.raises(V1SqlError, match="Continue wait"):
+        cube.v1.sql({"query": {"measures": ["tasks.count"]}})
+
+
+@pytest.mark.asyncio
+async def test_async_load_polls_until_ready():
+    """Test that the async load route polls without blocking the loop."""
+    handler, seen = _responder(LOAD_RESPONSE, waits=2)
+    cube = mock_async_client(handler, continue_wait={"interval": 0})
+
+    result = await cube.v1.load({"query": {"measures": ["tasks.count"]}})
+
+    assert result.polls == 2
+    assert len(seen) == 3
+    await cube.close()
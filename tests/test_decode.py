@@ -0,0 +1,59 @@
+import httpx
+import pytest
+
+from cube_http.types.v1 import V1LoadRequest, V1LoadResponse
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=LOAD_RESPONSE)
+
+
+def test_trusted_decode_matches_validated_decode():
+    """Test that trusted decoding yields the same typed response."""
+    cube = mock_client(_handler)
+    query: V1LoadRequest = {"query": {"measures": ["tasks.count"]}}
+
+    validated = cube.v1.load(query)
+    trusted = cube.v1.load(query, decode={"trusted": True})
+
+    assert trusted == validated
+    assert trusted.results[0].annotation.measures == (
+        validated.results[0].annotation.measures
+    )
+    assert trusted.results[0].query is not None
+    assert trusted.results[0].query.measures == ["tasks.count"]
+
+
+def test_trusted_decode_skips_row_validation():
+    """Test that rows are attached without validation."""
+    payload = LOAD_RESPONSE | {
+        "results": [LOAD_RESPONSE["results"][0] | {"data": [["not", "a dict"]]}]
+    }
+    res = httpx.Response(200, json=payload)
+
+    response = V1LoadResponse.from_response(res, {"trusted": True})
+
+    assert response.results[0].data == [["not", "a dict"]]
+
+
+def test_trusted_decode_from_client_options():
+    """Test that the client-level decode options apply to every load."""
+    cube = mock_client(_handler, decode={"trusted": True})
+    data = cube.v1.load({"query": {"measures": ["tasks.count"]}}).results[0].data
+
+    assert data is not LOAD_RESPONSE["results"][0]["data"]
+    assert data == LOAD_RESPONSE["results"][0]["data"]
+
+
+@pytest.mark.asyncio
+async def test_async_trusted_decode():
+    """Test trusted decoding on the async client."""
+    cube = mock_async_client(_handler)
+    response = await cube.v1.load(
+        {"query": {"measures": ["tasks.count"]}}, decode={"trusted": True}
+    )
+
+    assert response.results[0].data[0]["tasks.count"] == "42"
+    await cube.close()
@@ -0,0 +1,85 @@
+import importlib.util
+from datetime import datetime
+
+import httpx
+import pytest
+
+from cube_http.types.v1 import V1LoadResponse
+
+from .fixtures import LOAD_RESPONSE
+
+PAYLOAD = LOAD_RESPONSE | {
+    "results": [
+        LOAD_RESPONSE["results"][0]
+        | {
+            "annotation": LOAD_RESPONSE["results"][0]["annotation"]
+            | {
+                "timeDimensions": {
+                    "tasks.createdAt.day": {"title": "Day", "type": "time"}
+                }
+            },
+            "data": [
+                {
+                    "tasks.status": "Completed",
+                    "tasks.count": "42",
+                    "tasks.createdAt.day": "2024-01-01T00:00:00.000",
+                },
+                {
+                    "tasks.status": "Open",
+                    "tasks.count": "7",
+                    "tasks.createdAt.day": "2024-01-02T00:00:00.000",
+                },
+            ],
+        }
+    ]
+}
+
+
+def _result():
+    return V1LoadResponse.from_response(
+        httpx.Response(200, json=PAYLOAD)
+    ).results[0]
+
+
+def test_to_arrow():
+    """Test that Arrow tables are typed from the annotation."""
+    pa = pytest.importorskip("pyarrow")
+
+    table = _result().to_arrow()
+
+    assert table.schema.field("tasks.count").type == pa.int64()
+    assert table.schema.field("tasks.status").type == pa.string()
+    assert table.schema.field("tasks.createdAt.day").type == pa.timestamp("ms")
+    assert table.column("tasks.count").to_pylist() == [42, 7]
+
+
+def test_to_polars():
+    """Test that Polars frames are typed from the annotation."""
+    pl = pytest.importorskip("polars")
+
+    frame = _result().to_polars()
+
+    assert frame["tasks.count"].dtype == pl.Int64
+    assert frame["tasks.count"].to_list() == [42, 7]
+    assert frame["tasks.createdAt.day"][0] == datetime(2024, 1, 1)
+
+
+def test_to_pandas():
+    """Test that pandas frames are typed from the annotation."""
+    pytest.importorskip("pandas")
+
+    frame = _result().to_pandas()
+
+    assert str(frame["tasks.count"].dtype) == "int64"
+    assert str(frame["tasks.createdAt.day"].dtype).startswith("datetime64")
+    assert frame["tasks.status"].tolist() == ["Completed", "Open"]
+
+
+@pytest.mark.skipif(
+    importlib.util.find_spec("pyarrow") is not None,
+    reason="pyarrow is installed",
+)
+def test_missing_extra_hints_install():
+    """Test that a missing library points at the matching extra."""
+    with pytest.raises(ImportError, match=r"cube-http-client\[arrow\]"):
+        _result().to_arrow()
@@ -0,0 +1,130 @@
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from cube_http.routes._hedging import HedgeOptions, Hedger
+from cube_http.types.v1 import V1LoadRequest
+
+from .fixtures import LOAD_RESPONSE, mock_async_client
+
+META_RESPONSE: dict[str, Any] = {"cubes": []}
+QUERY: V1LoadRequest = {"query": {"measures": ["tasks.count"]}}
+HEDGING: HedgeOptions = {
+    "min_samples": 3,
+    "min_delay": 0.01,
+    "max_hedge_rate": 1.0,
+}
+
+
+def _slow_once(body: dict[str, Any], delays: list[float]):
+    """Answer after the given delays in turn, then right away."""
+    calls: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if delays:
+            await asyncio.sleep(delays.pop(0))
+        return httpx.Response(200, json=body)
+
+    return handler, calls
+
+
+def test_delay_follows_the_latency_percentile():
+    """Test the percentile delay, its bounds and the hedge budget."""
+    hedger = Hedger(
+        {
+            "min_samples": 4,
+            "percentile": 50,
+            "max_delay": 0.3,
+            "max_hedge_rate": 0.5,
+        }
+    )
+    assert hedger.delay("/v1/load") is None
+    for latency in (0.1, 0.2, 0.4, 0.8):
+        hedger.observe("/v1/load", latency)
+
+    assert hedger.delay("/v1/load") == 0.3
+    assert hedger.delay("/v1/meta") is None
+    assert hedger.acquire()
+    assert hedger.acquire()
+    assert not hedger.acquire()
+
+
+@pytest.mark.asyncio
+async def test_slow_load_is_hedged():
+    """Test that a duplicate is sent and the faster response is kept."""
+    handler, calls = _slow_once(LOAD_RESPONSE, [0, 0, 0, 5])
+    cube = mock_async_client(handler, hedging=HEDGING)
+    for _ in range(3):
+        await cube.v1.load(QUERY)
+
+    response = await asyncio.wait_for(cube.v1.load(QUERY), timeout=1)
+
+    assert len(calls) == 5
+    assert response.results
+    assert cube.v1.hedger is not None
+    assert cube.v1.hedger.hedged == 1
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_hedge_rate_is_capped():
+    """Test that no duplicate is sent once the hedge budget is spent."""
+    handler, calls = _slow_once(META_RESPONSE, [0, 0, 0, 0.05, 0.05, 0.05])
+    cube = mock_async_client(handler, hedging=HEDGING | {"max_hedge_rate": 0})
+    for _ in range(3):
+        await cube.v1.meta()
+
+    await cube.v1.meta()  # spends the initial budget
+    calls.clear()
+    await cube.v1.meta()
+
+    assert len(calls) == 1
+    assert cube.v1.hedger.hedged == 1  # type: ignore
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_attempt_waits_for_the_other():
+    """Test that an error only wins once every attempt failed."""
+    hedger = Hedger(HEDGING)
+    for _ in range(3):
+        hedger.observe("/v1/load", 0)
+    attempts: list[None] = []
+
+    async def send() -> str:
+        attempts.append(None)
+        if len(attempts) == 1:
+            await asyncio.sleep(0.05)
+            raise httpx.ConnectError("reset")
+        await asyncio.sleep(0.1)
+        return "ok"
+
+    assert await hedger.run("/v1/load", send) == "ok"
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_response_waits_for_the_other():
+    """Test that a fast 5xx from the hedge loses to a slow success."""
+    calls: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 4:
+            await asyncio.sleep(0.1)
+        elif len(calls) == 5:
+            return httpx.Response(503, json={"error": "Overloaded"})
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    cube = mock_async_client(handler, hedging=HEDGING)
+    for _ in range(3):
+        await cube.v1.load(QUERY)
+
+    response = await asyncio.wait_for(cube.v1.load(QUERY), timeout=1)
+
+    assert len(calls) == 5
+    assert response.results
+    await cube.close()
@@ -0,0 +1,93 @@
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from cube_http._json import StdlibJsonCodec, resolve_codec
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+
+class RecordingCodec(StdlibJsonCodec):
+    """Stdlib codec that records what it encodes and decodes."""
+
+    def __init__(self) -> None:
+        self.dumped: list[Any] = []
+        self.loaded = 0
+
+    def dumps(self, value: Any) -> bytes:
+        self.dumped.append(value)
+        return super().dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        self.loaded += 1
+        return super().loads(data)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    assert request.headers["content-type"] == "application/json"
+    assert json.loads(request.content)["queryType"] == "multi"
+    return httpx.Response(200, json=LOAD_RESPONSE)
+
+
+def test_resolve_codec():
+    """Test that codec names resolve to codec instances."""
+    codec = RecordingCodec()
+
+    assert resolve_codec(None) is None
+    assert resolve_codec(codec) is codec
+    assert isinstance(resolve_codec("stdlib"), StdlibJsonCodec)
+    assert resolve_codec("auto") is not None
+    unknown: Any = "yaml"
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        resolve_codec(unknown)
+
+
+def test_custom_codec_encodes_and_decodes():
+    """Test that a custom codec handles request and trusted response bodies."""
+    codec = RecordingCodec()
+    cube = mock_client(_handler, json_codec=codec)
+
+    validated = cube.v1.load({"query": {"measures": ["tasks.count"]}})
+    trusted = cube.v1.load(
+        {"query": {"measures": ["tasks.count"]}}, decode={"trusted": True}
+    )
+
+    assert codec.dumped[0]["query"] == {"measures": ["tasks.count"]}
+    assert codec.loaded == 1
+    assert validated == trusted
+
+
+def test_orjson_codec():
+    """Test loads through the orjson codec."""
+    pytest.importorskip("orjson")
+    cube = mock_client(_handler, json_codec="orjson")
+
+    response = cube.v1.load({"query": {"measures": ["tasks.count"]}})
+
+    assert response.results[0].data == LOAD_RESPONSE["results"][0]["data"]
+
+
+def test_msgspec_codec():
+    """Test loads through the msgspec codec."""
+    pytest.importorskip("msgspec")
+    cube = mock_client(_handler, json_codec="msgspec")
+
+    response = cube.v1.load(
+        {"query": {"measures": ["tasks.count"]}}, decode={"trusted": True}
+    )
+
+    assert response.results[0].data == LOAD_RESPONSE["results"][0]["data"]
+
+
+@pytest.mark.asyncio
+async def test_async_codec():
+    """Test that the async routes use the configured codec."""
+    codec = RecordingCodec()
+    cube = mock_async_client(_handler, json_codec=codec)
+
+    await cube.v1.load({"query": {"measures": ["tasks.count"]}})
+
+    assert len(codec.dumped) == 1
+    await cube.close()
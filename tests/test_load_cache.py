@@ -0,0 +1,241 @@
+import copy
+import json
+
+import httpx
+import pytest
+
+from cube_http._canonical import canonical_key
+from cube_http.types.v1 import V1LoadRequest
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+
+class LoadServer:
+    """Counts `/v1/load` requests and answers with a fixed result."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+        self.last_refresh_time = "2024-06-01T00:00:00.000Z"
+        self.refresh_key_values = [[{"refresh_key": "1"}]]
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        payload = copy.deepcopy(LOAD_RESPONSE)
+        payload["results"][0]["lastRefreshTime"] = self.last_refresh_time
+        payload["results"][0]["refreshKeyValues"] = self.refresh_key_values
+        return httpx.Response(200, json=payload)
+
+
+def test_canonical_key_ignores_member_and_filter_order():
+    """Test that equivalent queries share a key."""
+    first: V1LoadRequest = {
+        "query": {
+            "measures": ["tasks.count", "accounts.count"],
+            "dimensions": ["tasks.status"],
+            "filters": [
+                {
+                    "member": "tasks.priority",
+                    "operator": "equals",
+                    "values": ["High", "Low"],
+                },
+                {"member": "tasks.status", "operator": "set"},
+            ],
+            "order": [["tasks.count", "desc"]],
+            "offset": 0,
+            "segments": [],
+        }
+    }
+    second: V1LoadRequest = {
+        "query": {
+            "dimensions": ["tasks.status"],
+            "filters": [
+                {"member": "tasks.status", "operator": "set"},
+                {
+                    "member": "tasks.priority",
+                    "operator": "equals",
+                    "values": ["Low", "High"],
+                },
+            ],
+            "measures": ["accounts.count", "tasks.count"],
+            "order": [["tasks.count", "desc"]],
+        }
+    }
+
+    assert canonical_key(first) == canonical_key(second)
+
+
+def test_canonical_key_keeps_member_order_without_order():
+    """Test that member order stays significant under default ordering."""
+    first: V1LoadRequest = {
+        "query": {"measures": ["tasks.count", "tasks.hours"], "limit": 10}
+    }
+    second: V1LoadRequest = {
+        "query": {"measures": ["tasks.hours", "tasks.count"], "limit": 10}
+    }
+    unordered: V1LoadRequest = {
+        "query": {
+            "measures": ["tasks.count", "tasks.hours"],
+            "order": [],
+            "limit": 10,
+        }
+    }
+
+    assert canonical_key(first) != canonical_key(second)
+    assert canonical_key(first) != canonical_key(unordered)
+
+
+def test_canonical_key_keeps_order_and_date_ranges():
+    """Test that ordering and ranged filter values stay significant."""
+    asc: V1LoadRequest = {
+        "query": {"order": [["tasks.count", "asc"], ["tasks.status", "asc"]]}
+    }
+    swapped: V1LoadRequest = {
+        "query": {"order": [["tasks.status", "asc"], ["tasks.count", "asc"]]}
+    }
+    as_dict: V1LoadRequest = {
+        "query": {"order": {"tasks.count": "asc", "tasks.status": "asc"}}  # type: ignore
+    }
+    assert canonical_key(asc) != canonical_key(swapped)
+    assert canonical_key(asc) == canonical_key(as_dict)
+
+    in_range: V1LoadRequest = {
+        "query": {
+            "filters": [
+                {
+                    "member": "tasks.created_at",
+                    "operator": "inDateRange",
+                    "values": ["2024-01-01", "2024-12-31"],
+                }
+            ]
+        }
+    }
+    reversed_range = json.loads(json.dumps(in_range))
+    reversed_range["query"]["filters"][0]["values"].reverse()
+    assert canonical_key(in_range) != canonical_key(reversed_range)
+
+
+def test_load_cache_hits_and_misses():
+    """Test that equivalent loads are served from the cache."""
+    server = LoadServer()
+    cube = mock_client(server, load_cache={"max_entries": 8})
+
+    first = cube.v1.load(
+        {
+            "query": {
+                "measures": ["tasks.count", "accounts.count"],
+                "order": [["tasks.count", "desc"]],
+            }
+        }
+    )
+    second = cube.v1.load(
+        {
+            "query": {
+                "measures": ["accounts.count", "tasks.count"],
+                "order": [["tasks.count", "desc"]],
+            }
+        }
+    )
+
+    assert first is second
+    assert len(server.requests) == 1
+    assert cube.v1.load_cache is not None
+    assert cube.v1.load_cache.hits == 1
+    assert cube.v1.load_cache.misses == 1
+
+
+def test_load_cache_evicts_least_recently_used():
+    """Test that the oldest entry is evicted once the cache is full."""
+    server = LoadServer()
+    cube = mock_client(server, load_cache={"max_entries": 2})
+
+    for member in ("a.count", "b.count", "a.count", "c.count", "b.count"):
+        cube.v1.load({"query": {"measures": [member]}})
+
+    assert len(server.requests) == 4
+    assert cube.v1.load_cache is not None
+    assert cube.v1.load_cache.evictions == 2
+    assert len(cube.v1.load_cache) == 2
+
+
+def test_load_cache_byte_limit_and_ttl():
+    """Test that byte limits and expired entries force a new request."""
+    server = LoadServer()
+    size = len(json.dumps(LOAD_RESPONSE))
+    cube = mock_client(server, load_cache={"max_bytes": size * 2, "ttl": 0})
+
+    cube.v1.load({"query": {"measures": ["tasks.count"]}})
+    cube.v1.load({"query": {"measures": ["tasks.count"]}})
+
+    assert len(server.requests) == 2
+    assert cube.v1.load_cache is not None
+    assert cube.v1.load_cache.size <= size * 2
+
+
+def test_load_cache_skips_renewed_queries():
+    """Test that renewQuery always reaches Cube."""
+    server = LoadServer()
+    cube = mock_client(server, load_cache={})
+
+    for _ in range(2):
+        cube.v1.load({"query": {"measures": ["a.count"], "renewQuery": True}})
+
+    assert len(server.requests) == 2
+
+
+def test_load_cache_invalidated_by_newer_sibling_refresh():
+    """Test that a newer refresh seen on a shared cube drops cached results."""
+    server = LoadServer()
+    cube = mock_client(server, load_cache={"refresh_keys": True})
+
+    cube.v1.load({"query": {"measures": ["tasks.count"]}})
+    cube.v1.load({"query": {"measures": ["tasks.count"]}})
+    assert len(server.requests) == 1
+
+    server.last_refresh_time = "2024-06-01T01:00:00.000Z"
+    cube.v1.load(
+        {"query": {"measures": ["tasks.count"], "dimensions": ["tasks.status"]}}
+    )
+    cube.v1.load({"query": {"measures": ["tasks.count"]}})
+    assert len(server.requests) == 3
+
+    # Results of unrelated cubes stay cached
+    cube.v1.load({"query": {"measures": ["accounts.count"]}})
+    server.last_refresh_time = "2024-06-01T02:00:00.000Z"
+    cube.v1.load({"query": {"measures": ["tasks.count"], "limit": 5}})
+    cube.v1.load({"query": {"measures": ["accounts.count"]}})
+    assert len(server.requests) == 5
+
+
+def test_load_cache_probe_revalidates_refresh_keys():
+    """Test that probes keep unchanged results and refetch changed ones."""
+    server = LoadServer()
+    cube = mock_client(
+        server, load_cache={"refresh_keys": True, "probe_interval": 0}
+    )
+
+    first = cube.v1.load({"query": {"measures": ["tasks.count"]}})
+    second = cube.v1.load({"query": {"measures": ["tasks.count"]}})
+
+    assert first is second
+    assert len(server.requests) == 2
+    assert json.loads(server.requests[1].content)["query"]["limit"] == 1
+
+    server.refresh_key_values = [[{"refresh_key": "2"}]]
+    third = cube.v1.load({"query": {"measures": ["tasks.count"]}})
+
+    assert third is not first
+    assert len(server.requests) == 4
+
+
+@pytest.mark.asyncio
+async def test_async_load_cache():
+    """Test that the async load route uses the cache."""
+    server = LoadServer()
+    cube = mock_async_client(server, load_cache={})
+
+    first = await cube.v1.load({"query": {"measures": ["tasks.count"]}})
+    second = await cube.v1.load({"query": {"measures": ["tasks.count"]}})
+
+    assert first is second
+    assert len(server.requests) == 1
+    await cube.close()
@@ -0,0 +1,197 @@
+import asyncio
+import json
+from typing import Any, Iterable
+
+import httpx
+import pytest
+
+from cube_http.types.v1 import V1LoadResponse
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+
+def _paged_handler(total: int, queries: list[dict[str, Any]]):
+    """Serve `total` rows, honouring the requested `limit` and `offset`."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)["query"]
+        queries.append(query)
+        offset, limit = query.get("offset", 0), query.get("limit", total)
+        rows = [
+            {"tasks.id": str(i)}
+            for i in range(offset, min(offset + limit, total))
+        ]
+        result = LOAD_RESPONSE["results"][0] | {"data": rows}
+        return httpx.Response(200, json=LOAD_RESPONSE | {"results": [result]})
+
+    return handler
+
+
+def _ids(pages: Iterable[V1LoadResponse]) -> list[str]:
+    return [row["tasks.id"] for page in pages for row in page.results[0].data]
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_load_pages_stops_on_short_page(prefetch: bool):
+    """Test that paging walks the offsets and stops on a short page."""
+    queries: list[dict[str, Any]] = []
+    cube = mock_client(_paged_handler(25, queries))
+
+    pages = list(
+        cube.v1.load_pages(
+            {"query": {"dimensions": ["tasks.id"]}},
+            page_size=10,
+            prefetch=prefetch,
+        )
+    )
+
+    assert len(pages) == 3
+    assert _ids(pages) == [str(i) for i in range(25)]
+    assert [(q["offset"], q["limit"]) for q in queries] == [
+        (0, 10),
+        (10, 10),
+        (20, 10),
+    ]
+
+
+def test_load_pages_respects_query_limit_and_offset():
+    """Test that the query's own offset and limit bound the pages."""
+    queries: list[dict[str, Any]] = []
+    cube = mock_client(_paged_handler(100, queries))
+
+    pages = cube.v1.load_pages(
+        {"query": {"dimensions": ["tasks.id"], "offset": 5, "limit": 25}},
+        page_size=10,
+    )
+
+    assert _ids(pages) == [str(i) for i in range(5, 30)]
+    assert [(q["offset"], q["limit"]) for q in queries] == [
+        (5, 10),
+        (15, 10),
+        (25, 5),
+    ]
+
+
+def test_load_pages_is_lazy():
+    """Test that pages are only loaded when iterated."""
+    queries: list[dict[str, Any]] = []
+    cube = mock_client(_paged_handler(100, queries))
+
+    pages = cube.v1.load_pages(
+        {"query": {"dimensions": ["tasks.id"]}}, page_size=10
+    )
+    next(pages)
+    pages.close()
+
+    assert len(queries) == 1
+
+
+def test_load_pages_rejects_empty_pages():
+    """Test that page_size must be positive."""
+    cube = mock_client(_paged_handler(0, []))
+
+    with pytest.raises(ValueError):
+        next(cube.v1.load_pages({"query": {}}, page_size=0))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("prefetch", [False, True])
+async def test_async_load_pages(prefetch: bool):
+    """Test async paging, with and without prefetching."""
+    queries: list[dict[str, Any]] = []
+    cube = mock_async_client(_paged_handler(25, queries))
+
+    pages = [
+        page
+        async for page in cube.v1.load_pages(
+            {"query": {"dimensions": ["tasks.id"]}},
+            page_size=10,
+            prefetch=prefetch,
+        )
+    ]
+
+    assert _ids(pages) == [str(i) for i in range(25)]
+    assert len(queries) == 3
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_async_load_pages_prefetches_next_page():
+    """Test that the next page is requested while the caller holds a page."""
+    queries: list[dict[str, Any]] = []
+    cube = mock_async_client(_paged_handler(100, queries))
+
+    pages = cube.v1.load_pages(
+        {"query": {"dimensions": ["tasks.id"]}}, page_size=10, prefetch=True
+    )
+    await pages.__anext__()
+    await asyncio.sleep(0.01)
+
+    assert len(queries) == 2
+    await pages.aclose()
+    await cube.close()
+
+
+def _tracking_handler(
+    total: int, queries: list[dict[str, Any]], peak: list[int]
+):
+    """Paged handler that records the peak number of requests in flight."""
+    serve = _paged_handler(total, queries)
+    in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight
+        in_flight += 1
+        peak[0] = max(peak[0], in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return serve(request)
+
+    return handler
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_async_load_pages_concurrently(ordered: bool):
+    """Test that pages are fetched concurrently and stop after the end."""
+    queries: list[dict[str, Any]] = []
+    peak = [0]
+    cube = mock_async_client(_tracking_handler(95, queries, peak))
+
+    pages = [
+        page
+        async for page in cube.v1.load_pages(
+            {"query": {"dimensions": ["tasks.id"]}},
+            page_size=10,
+            concurrency=4,
+            ordered=ordered,
+        )
+    ]
+
+    ids = _ids(pages)
+    assert (ids if ordered else sorted(ids, key=int)) == [
+        str(i) for i in range(95)
+    ]
+    assert len(pages) == 10
+    assert peak[0] == 4
+    # At most `concurrency - 1` speculative pages past the short one
+    assert len(queries) <= 13
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_limits_requests_in_flight():
+    """Test that the client-wide limit caps concurrent page requests."""
+    peak = [0]
+    cube = mock_async_client(_tracking_handler(100, [], peak), max_concurrency=2)
+
+    pages = [
+        page
+        async for page in cube.v1.load_pages(
+            {"query": {"dimensions": ["tasks.id"]}}, page_size=10, concurrency=8
+        )
+    ]
+
+    assert len(_ids(pages)) == 100
+    assert peak[0] == 2
+    await cube.close()
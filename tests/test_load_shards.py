@@ -0,0 +1,177 @@
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from cube_http.routes.v1.load_shards import shard_requests
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+DAY = "tasks.createdAt.day"
+
+
+def _request(**query: Any) -> Any:
+    return {
+        "query": {
+            "measures": ["tasks.count"],
+            "timeDimensions": [
+                {
+                    "dimension": "tasks.createdAt",
+                    "granularity": "day",
+                    "dateRange": ["2024-01-15", "2024-03-10"],
+                }
+            ],
+        }
+        | query
+    }
+
+
+def _ranges(shards: list[Any]) -> list[list[str]]:
+    return [s["query"]["timeDimensions"][0]["dateRange"] for s in shards]
+
+
+def test_shards_align_to_granularity():
+    """Test that shards follow period boundaries within the date range."""
+    shards = shard_requests(_request(), "month")
+
+    assert _ranges(shards) == [
+        ["2024-01-15T00:00:00.000", "2024-01-31T23:59:59.999"],
+        ["2024-02-01T00:00:00.000", "2024-02-29T23:59:59.999"],
+        ["2024-03-01T00:00:00.000", "2024-03-10T23:59:59.999"],
+    ]
+
+
+def test_shards_by_week_start_on_monday():
+    """Test week shards, which do not nest in months."""
+    shards = shard_requests(_request(), "week")
+
+    assert _ranges(shards)[0] == [
+        "2024-01-15T00:00:00.000",
+        "2024-01-21T23:59:59.999",
+    ]
+    assert len(shards) == 8
+
+
+def test_shards_accept_utc_bounds():
+    """Test that `Z` suffixed bounds parse on every supported Python."""
+    request = _request()
+    request["query"]["timeDimensions"][0]["dateRange"] = [
+        "2024-01-15T00:00:00.000Z",
+        "2024-02-10T12:00:00.000Z",
+    ]
+
+    assert _ranges(shard_requests(request, "month")) == [
+        ["2024-01-15T00:00:00.000", "2024-01-31T23:59:59.999"],
+        ["2024-02-01T00:00:00.000", "2024-02-10T12:00:00.000"],
+    ]
+
+
+def test_shards_keep_rows_for_limit_and_offset():
+    """Test that shards drop the offset and cover it in their limit."""
+    shards: list[Any] = shard_requests(_request(limit=10, offset=5), "month")
+
+    assert all(s["query"]["limit"] == 15 for s in shards)
+    assert all("offset" not in s["query"] for s in shards)
+
+
+@pytest.mark.parametrize(
+    ("query", "granularity"),
+    [
+        ({"timeDimensions": [{"dimension": "tasks.createdAt"}]}, "month"),
+        (
+            {
+                "timeDimensions": [
+                    {"dimension": "tasks.createdAt", "dateRange": "last year"}
+                ]
+            },
+            "month",
+        ),
+        (
+            {
+                "timeDimensions": [
+                    {
+                        "dimension": "tasks.createdAt",
+                        "granularity": "year",
+                        "dateRange": ["2024-01-01", "2024-12-31"],
+                    }
+                ]
+            },
+            "month",
+        ),
+        ({}, "month"),
+    ],
+)
+def test_unshardable_queries_are_rejected(
+    query: dict[str, Any], granularity: Any
+):
+    """Test queries whose results sharding would change."""
+    request: Any = {"query": {"measures": ["tasks.count"]} | query}
+
+    with pytest.raises(ValueError):
+        shard_requests(request, granularity)
+
+
+def _handler(requests: list[dict[str, Any]]):
+    """Serve one row per day of the requested range, counting down."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)["query"]
+        requests.append(query)
+        start, end = query["timeDimensions"][0]["dateRange"]
+        first, last = int(start[8:10]), int(end[8:10])
+        month = start[:8]
+        rows = [
+            {
+                DAY: f"{month}{day:02d}T00:00:00.000",
+                "tasks.count": str(100 - day),
+            }
+            for day in range(first, last + 1)
+        ]
+        result = LOAD_RESPONSE["results"][0] | {"data": rows}
+        return httpx.Response(200, json=LOAD_RESPONSE | {"results": [result]})
+
+    return handler
+
+
+def test_load_sharded_merges_in_order():
+    """Test that shard rows are merged chronologically."""
+    requests: list[dict[str, Any]] = []
+    cube = mock_client(_handler(requests))
+
+    response = cube.v1.load_sharded(_request(), granularity="month")
+
+    days = [row[DAY][:10] for row in response.results[0].data]
+    assert len(requests) == 3
+    assert days[0] == "2024-01-15" and days[-1] == "2024-03-10"
+    assert days == sorted(days)
+
+
+def test_load_sharded_reapplies_order_and_limit():
+    """Test that numeric order, offset and limit apply to the merged rows."""
+    cube = mock_client(_handler([]))
+
+    response = cube.v1.load_sharded(
+        _request(order={"tasks.count": "desc"}, limit=3, offset=1),
+        granularity="month",
+    )
+
+    counts = [row["tasks.count"] for row in response.results[0].data]
+    assert counts == ["99", "98", "98"]
+
+
+@pytest.mark.asyncio
+async def test_async_load_sharded():
+    """Test that async shards are merged the same way."""
+    requests: list[dict[str, Any]] = []
+    cube = mock_async_client(_handler(requests))
+
+    response = await cube.v1.load_sharded(
+        _request(), granularity="month", concurrency=2, decode={"columnar": True}
+    )
+
+    result = response.results[0]
+    assert len(requests) == 3
+    assert result.data == []
+    assert len(result.to_columns()) == 17 + 29 + 10
+    await cube.close()
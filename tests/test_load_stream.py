@@ -0,0 +1,113 @@
+import json
+from typing import Any, AsyncIterator, Iterator
+
+import httpx
+import pytest
+
+from cube_http._json_stream import Event, LoadResponseParser
+from cube_http.exc import V1LoadError
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+BODY = json.dumps(LOAD_RESPONSE, indent=2).encode()
+ROWS = LOAD_RESPONSE["results"][0]["data"]
+
+
+def _chunks(size: int) -> Iterator[bytes]:
+    for i in range(0, len(BODY), size):
+        yield BODY[i : i + size]
+
+
+async def _achunks(size: int) -> AsyncIterator[bytes]:
+    for chunk in _chunks(size):
+        yield chunk
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, len(BODY)])
+def test_parser_handles_any_chunking(size: int):
+    """Test that events do not depend on where the body is split."""
+    parser = LoadResponseParser()
+    events: list[Event] = []
+    for chunk in _chunks(size):
+        parser.feed(chunk)
+        events.extend(parser.events())
+    parser.feed(b"", final=True)
+    events.extend(parser.events())
+
+    assert [event[2] for event in events if event[0] == "row"] == ROWS
+    assert events[0][0] == "result_start"
+    assert events[-1] == ("response", {"queryType": "regularQuery"})
+
+
+def test_parser_rejects_truncated_body():
+    """Test that a truncated body raises instead of ending silently."""
+    parser = LoadResponseParser()
+    parser.feed(BODY[: len(BODY) // 2], final=True)
+
+    with pytest.raises(ValueError):
+        list(parser.events())
+
+
+def test_load_stream_yields_rows_and_metadata():
+    """Test that rows stream and metadata is available once parsed."""
+    cube = mock_client(lambda request: httpx.Response(200, content=_chunks(16)))
+
+    with cube.v1.load_stream({"query": {"measures": ["tasks.count"]}}) as stream:
+        rows: list[dict[str, Any]] = []
+        for row in stream:
+            assert stream.annotation is not None
+            rows.append(row)
+
+    assert rows == ROWS
+    assert stream.results[0].data == []
+    assert stream.results[0].last_refresh_time == "2024-06-01T00:00:00.000Z"
+    assert stream.response is not None
+    assert stream.response.query_type == "regularQuery"
+
+
+def test_load_stream_error_status():
+    """Test that failed requests raise before any row is streamed."""
+    cube = mock_client(
+        lambda request: httpx.Response(400, json={"error": "Bad query"})
+    )
+
+    with (
+        pytest.raises(V1LoadError, match="Bad query"),
+        cube.v1.load_stream({"query": {"measures": ["x.y"]}}),
+    ):
+        pass
+
+
+def test_load_stream_polls_continue_wait():
+    """Test that streaming loads poll while Cube asks to wait."""
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(200, json={"error": "Continue wait"})
+        return httpx.Response(200, content=_chunks(64))
+
+    cube = mock_client(handler, continue_wait={"interval": 0})
+    with cube.v1.load_stream({"query": {"measures": ["tasks.count"]}}) as stream:
+        rows = list(stream)
+
+    assert rows == ROWS
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_load_stream():
+    """Test streaming rows on the async client."""
+    cube = mock_async_client(
+        lambda request: httpx.Response(200, content=_achunks(5))
+    )
+
+    async with cube.v1.load_stream(
+        {"query": {"measures": ["tasks.count"]}}
+    ) as stream:
+        rows = [row async for row in stream]
+
+    assert rows == ROWS
+    assert stream.response is not None
+    await cube.close()
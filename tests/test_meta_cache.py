@@ -0,0 +1,146 @@
+import asyncio
+import gc
+from typing import Any
+
+import httpx
+import pytest
+
+from .fixtures import mock_async_client, mock_client
+
+META_RESPONSE: dict[str, Any] = {"cubes": []}
+
+
+class MetaServer:
+    """Serves `/v1/meta` with an ETag and answers 304 when it matches."""
+
+    def __init__(self) -> None:
+        self.etag = 'W/"v1"'
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("if-none-match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(
+            200, json=META_RESPONSE, headers={"ETag": self.etag}
+        )
+
+
+def test_meta_cache_serves_fresh_entries():
+    """Test that fresh entries are served without a request."""
+    server = MetaServer()
+    cube = mock_client(server, meta_cache={"ttl": 60})
+
+    first = cube.v1.meta()
+    second = cube.v1.meta()
+
+    assert first is second
+    assert len(server.requests) == 1
+
+
+def test_meta_cache_revalidates_with_etag():
+    """Test that expired entries are revalidated with If-None-Match."""
+    server = MetaServer()
+    cube = mock_client(server, meta_cache={"ttl": 0})
+
+    first = cube.v1.meta()
+    second = cube.v1.meta()
+
+    assert first is second
+    assert server.requests[1].headers["if-none-match"] == 'W/"v1"'
+
+    server.etag = 'W/"v2"'
+    third = cube.v1.meta()
+
+    assert third is not first
+    assert len(server.requests) == 3
+
+
+def test_meta_cache_keys_on_params():
+    """Test that extended and regular meta are cached separately."""
+    server = MetaServer()
+    cube = mock_client(server, meta_cache={"ttl": 60})
+
+    cube.v1.meta()
+    cube.v1.meta({"extended": True})
+    cube.v1.meta({"extended": True})
+
+    assert len(server.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_meta_cache_stale_while_revalidate():
+    """Test that stale entries are returned while a background task refreshes."""
+    server = MetaServer()
+    cube = mock_async_client(
+        server, meta_cache={"ttl": 0, "stale_while_revalidate": True}
+    )
+
+    first = await cube.v1.meta()
+    server.etag = 'W/"v2"'
+    stale = await cube.v1.meta()
+
+    assert stale is first
+    await asyncio.sleep(0.05)
+    refreshed = await cube.v1.meta()
+
+    assert len(server.requests) >= 2
+    assert refreshed is not first
+    await cube.close()
+
+
+def test_sync_meta_cache_rejects_stale_while_revalidate():
+    """Test that the sync client refuses background revalidation."""
+    with pytest.raises(ValueError, match="stale_while_revalidate"):
+        mock_client(
+            MetaServer(), meta_cache={"ttl": 0, "stale_while_revalidate": True}
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_failed_refresh_keeps_the_stale_entry():
+    """Test that any refresh error is swallowed, not left in the task."""
+    errors: list[dict[str, Any]] = []
+    asyncio.get_running_loop().set_exception_handler(
+        lambda loop, context: errors.append(context)
+    )
+    responses = [
+        httpx.Response(200, json=META_RESPONSE),
+        httpx.Response(200, json={"cubes": "invalid"}),
+    ]
+    cube = mock_async_client(
+        lambda request: responses.pop(0),
+        meta_cache={"ttl": 0, "stale_while_revalidate": True},
+    )
+
+    first = await cube.v1.meta()
+    assert await cube.v1.meta() is first
+    await asyncio.sleep(0.05)
+    gc.collect()
+
+    assert responses == []
+    assert errors == []
+    await cube.close()
+
+
+@pytest.mark.asyncio
+async def test_async_close_cancels_pending_refreshes():
+    """Test that closing the client does not leave refresh tasks behind."""
+    calls: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) > 1:
+            await asyncio.sleep(10)
+        return httpx.Response(200, json=META_RESPONSE)
+
+    cube = mock_async_client(
+        handler, meta_cache={"ttl": 0, "stale_while_revalidate": True}
+    )
+    await cube.v1.meta()
+    await cube.v1.meta()
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(cube.close(), timeout=1)
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
@@ -0,0 +1,99 @@
+import gzip
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from cube_http.types.v1 import V1LoadRequest, V1PreparedLoadRequest
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+REQUEST: V1LoadRequest = {
+    "query": {
+        "measures": ["tasks.count"],
+        "dimensions": ["tasks.status", "tasks.project"],
+    }
+}
+
+
+def _recorder(bodies: list[bytes]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    return handler
+
+
+def test_prepared_body_and_key():
+    """Test the encoded body, the canonical key and the request snapshot."""
+    request: Any = json.loads(json.dumps(REQUEST))
+    prepared = V1PreparedLoadRequest(request)
+    request["query"]["measures"].append("tasks.hours")
+
+    assert json.loads(prepared.body) == REQUEST | {"queryType": "multi"}
+    equivalent = V1PreparedLoadRequest(
+        {
+            "query": {
+                "measures": ["tasks.count"],
+                "dimensions": ["tasks.status", "tasks.project"],
+                "offset": 0,
+                "segments": [],
+            }
+        }
+    )
+    assert prepared == equivalent
+    assert len({prepared, equivalent}) == 1
+
+
+def test_from_encoded_wraps_a_body_and_key():
+    """Test that a body and key computed elsewhere are used as given."""
+    prepared = V1PreparedLoadRequest(REQUEST)
+    wrapped = V1PreparedLoadRequest.from_encoded(
+        REQUEST, prepared.body, prepared.key
+    )
+
+    assert wrapped == prepared
+    assert wrapped.request is REQUEST
+    assert wrapped.compressed_body(None) == (prepared.body, {})
+
+
+def test_load_sends_the_prepared_body():
+    """Test that prepared requests are sent as encoded and share the cache."""
+    bodies: list[bytes] = []
+    cube = mock_client(_recorder(bodies), load_cache={"ttl": 60})
+    prepared = V1PreparedLoadRequest(REQUEST)
+
+    response = cube.v1.load(prepared)
+    assert cube.v1.load(REQUEST) is response
+
+    assert bodies == [prepared.body]
+
+
+def test_prepared_bodies_are_compressed_once():
+    """Test that the compressed body is kept on the prepared request."""
+    bodies: list[bytes] = []
+    cube = mock_client(_recorder(bodies), compression={"threshold": 0})
+    prepared = V1PreparedLoadRequest(REQUEST)
+
+    cube.v1.load(prepared)
+    cube.v1.load(prepared)
+
+    assert bodies[0] is bodies[1]
+    assert gzip.decompress(bodies[0]) == prepared.body
+
+
+@pytest.mark.asyncio
+async def test_async_load_accepts_prepared_requests():
+    """Test prepared requests on the async client, batched or not."""
+    bodies: list[bytes] = []
+    prepared = V1PreparedLoadRequest(REQUEST)
+    cube = mock_async_client(_recorder(bodies))
+    await cube.v1.load(prepared)
+    assert bodies == [prepared.body]
+    await cube.close()
+
+    cube = mock_async_client(_recorder(bodies), load_batching={"window": 0})
+    response = await cube.v1.load(prepared)
+    assert response.results
+    await cube.close()
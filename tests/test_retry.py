@@ -0,0 +1,114 @@
+import httpx
+import pytest
+
+from cube_http.exc import V1LoadError
+from cube_http.routes._retry import RetryOptions, RetrySchedule, retry_after
+from cube_http.types.v1 import V1LoadRequest
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+FAST: RetryOptions = {"backoff": 0.001, "jitter": False}
+QUERY: V1LoadRequest = {"query": {"measures": ["tasks.count"]}}
+
+
+def _flaky(failures: list[httpx.Response | Exception]):
+    """Fail with the given outcomes in turn, then succeed."""
+    calls: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if failures:
+            outcome = failures.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    return handler, calls
+
+
+def test_retries_gateway_errors():
+    """Test that 502/503/504 are retried and the count is reported."""
+    handler, calls = _flaky(
+        [httpx.Response(502), httpx.Response(503, json={"error": "down"})]
+    )
+    cube = mock_client(handler, retry=FAST)
+
+    response = cube.v1.load(QUERY)
+
+    assert len(calls) == 3
+    assert response.retries == 2
+
+
+def test_retries_transport_errors():
+    """Test that connection failures are retried."""
+    handler, calls = _flaky([httpx.ConnectError("refused")])
+    cube = mock_client(handler, retry=FAST)
+
+    assert cube.v1.load(QUERY).retries == 1
+    assert len(calls) == 2
+
+
+def test_gives_up_after_max_attempts():
+    """Test that the last failing response is raised as usual."""
+    handler, calls = _flaky([httpx.Response(503)] * 5)
+    cube = mock_client(handler, retry=FAST | {"max_attempts": 2})
+
+    with pytest.raises(V1LoadError):
+        cube.v1.load(QUERY)
+    assert len(calls) == 2
+
+
+def test_does_not_retry_client_errors_or_other_routes():
+    """Test that only configured statuses and routes are retried."""
+    handler, calls = _flaky([httpx.Response(400, json={"error": "bad"})])
+    cube = mock_client(handler, retry=FAST)
+    with pytest.raises(V1LoadError):
+        cube.v1.load(QUERY)
+    assert len(calls) == 1
+
+    handler, calls = _flaky([httpx.Response(503)])
+    cube = mock_client(handler, retry=FAST | {"routes": ["/v1/sql"]})
+    with pytest.raises(V1LoadError):
+        cube.v1.load(QUERY)
+    assert len(calls) == 1
+
+
+def test_retry_after_header():
+    """Test Retry-After in seconds and as an HTTP date."""
+    assert retry_after(httpx.Response(503, headers={"Retry-After": "3"})) == 3
+    date = httpx.Response(
+        503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    )
+    assert retry_after(date) == 0
+    assert retry_after(httpx.Response(503)) is None
+
+
+def test_schedule_backs_off_within_the_elapsed_budget():
+    """Test exponential backoff, Retry-After and the max elapsed time."""
+    req = httpx.Request("POST", "http://cube/v1/load")
+    schedule = RetrySchedule(
+        {"backoff": 1, "jitter": False, "max_attempts": 10, "max_elapsed": 5},
+        req,
+    )
+    res = httpx.Response(503)
+
+    assert schedule.next_delay(res) == 1
+    assert schedule.next_delay(res) == 2
+    assert schedule.next_delay(res) == 4
+    assert schedule.next_delay(res) is None  # 8s would end past the budget
+    slow = httpx.Response(503, headers={"Retry-After": "60"})
+    assert RetrySchedule({"max_elapsed": 30}, req).next_delay(slow) is None
+
+
+@pytest.mark.asyncio
+async def test_async_retries():
+    """Test that the async client retries the same way."""
+    handler, calls = _flaky([httpx.Response(504)])
+    cube = mock_async_client(handler, retry=FAST)
+
+    response = await cube.v1.load(QUERY)
+
+    assert response.retries == 1
+    assert len(calls) == 2
+    await cube.close()
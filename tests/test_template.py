@@ -0,0 +1,140 @@
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from cube_http.types.v1 import V1LoadRequestTemplate, V1QueryParam
+
+from .fixtures import LOAD_RESPONSE, mock_async_client, mock_client
+
+
+def _template() -> V1LoadRequestTemplate:
+    return V1LoadRequestTemplate(
+        {
+            "query": {
+                "measures": ["tasks.count"],
+                "filters": [
+                    {
+                        "member": "tasks.status",
+                        "operator": "equals",
+                        "values": [V1QueryParam("status")],
+                    },
+                    {
+                        "or": [
+                            {
+                                "member": "tasks.project_id",
+                                "operator": "equals",
+                                "values": V1QueryParam("projects"),
+                            }
+                        ]
+                    },
+                ],
+                "timeDimensions": [
+                    {
+                        "dimension": "tasks.created_at",
+                        "dateRange": [V1QueryParam("start"), "2024-12-31"],
+                    }
+                ],
+            }
+        }
+    )
+
+
+def test_bind_splices_values_into_the_body():
+    """Test that bound bodies equal encoding the filled in request."""
+    template = _template()
+    prepared = template.bind(
+        status="done", projects=["a", "b"], start="2024-01-01"
+    )
+
+    assert template.params == ("status", "projects", "start")
+    query: Any = prepared.request["query"]
+    assert query["filters"][0]["values"] == ["done"]
+    assert query["filters"][1]["or"][0]["values"] == ["a", "b"]
+    assert query["timeDimensions"][0]["dateRange"] == [
+        "2024-01-01",
+        "2024-12-31",
+    ]
+    assert (
+        prepared.body
+        == json.dumps(
+            prepared.request | {"queryType": "multi"}, separators=(",", ":")
+        ).encode()
+    )
+
+
+def test_bound_keys_follow_the_values():
+    """Test that equal bindings share a key and different ones do not."""
+    template = _template()
+    values: dict[str, Any] = {
+        "status": "done",
+        "projects": ["a"],
+        "start": "2024-01-01",
+    }
+
+    assert template.bind(**values) == _template().bind(**values)
+    assert template.bind(**values) != template.bind(
+        **values | {"status": "open"}
+    )
+
+
+def test_bind_rejects_missing_and_unknown_values():
+    """Test that every placeholder must be bound, and nothing else."""
+    template = _template()
+    with pytest.raises(ValueError, match="Missing values for parameters: start"):
+        template.bind(status="done", projects=[])
+    with pytest.raises(ValueError, match="Unknown parameters: owner"):
+        template.bind(status="done", projects=[], start="2024-01-01", owner="x")
+
+
+def test_placeholders_outside_values_and_date_ranges_are_rejected():
+    """Test that placeholders are limited to filter values and date ranges."""
+    with pytest.raises(ValueError, match="'limit' can only be used"):
+        V1LoadRequestTemplate({"query": {"limit": V1QueryParam("limit")}})
+
+
+def test_load_sends_bound_requests():
+    """Test that bound requests are sent as spliced and cached by their key."""
+    bodies: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    cube = mock_client(handler, load_cache={"ttl": 60})
+    template = _template()
+    values: dict[str, Any] = {
+        "status": "done",
+        "projects": ["a"],
+        "start": "2024-01-01",
+    }
+
+    response = cube.v1.load(template.bind(**values))
+    assert cube.v1.load(template.bind(**values)) is response
+    cube.v1.load(template.bind(**values | {"start": "2024-06-01"}))
+
+    assert len(bodies) == 2
+    assert json.loads(bodies[1])["query"]["timeDimensions"][0]["dateRange"] == [
+        "2024-06-01",
+        "2024-12-31",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_load_sends_bound_requests():
+    """Test that the async client sends bound requests the same way."""
+    bodies: list[bytes] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        return httpx.Response(200, json=LOAD_RESPONSE)
+
+    cube = mock_async_client(handler)
+    prepared = _template().bind(
+        status="done", projects=["a"], start="2024-01-01"
+    )
+
+    await cube.v1.load(prepared)
+
+    assert bodies == [prepared.body]
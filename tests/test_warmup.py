@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+import httpx
+import pytest
+
+import cube_http
+
+from .fixtures import mock_async_client, mock_client
+
+
+class _Ready(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    clients: set[tuple[str, int]] = set()
+
+    def do_GET(self) -> None:
+        self.clients.add(self.client_address)
+        time.sleep(0.01)
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"OK")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    _Ready.clients.clear()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Ready)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/cubejs-api"
+    server.shutdown()
+    server.server_close()
+
+
+def test_warmup_opens_pooled_connections(server_url: str):
+    """Test that each warmup request leaves its own connection in the pool."""
+    with cube_http.Client({"url": server_url, "token": "t"}) as cube:
+        assert cube.warmup(4) == 4
+        assert len(_Ready.clients) == 4
+
+
+@pytest.mark.asyncio
+async def test_async_warmup_opens_pooled_connections(server_url: str):
+    """Test that the async client opens its connections the same way."""
+    async with cube_http.AsyncClient({"url": server_url, "token": "t"}) as cube:
+        assert await cube.warmup(3) == 3
+        assert len(_Ready.clients) == 3
+
+
+@pytest.mark.asyncio
+async def test_warmup_opens_at_most_max_connections(server_url: str):
+    """Test that warmup does not wait on connections the pool cannot open."""
+    options: Any = {
+        "url": server_url,
+        "token": "t",
+        "limits": {"max_connections": 2},
+        "timeout": 2,
+    }
+    start = time.monotonic()
+    with cube_http.Client(options) as cube:
+        assert cube.warmup(3) == 2
+    async with cube_http.AsyncClient(options) as async_cube:
+        assert await async_cube.warmup(3) == 2
+
+    assert time.monotonic() - start < 1
+    assert len(_Ready.clients) == 4
+
+
+def test_warmup_requests_readyz_and_counts_failures():
+    """Test the readiness path from the deployment root and failed requests."""
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if len(paths) == 1:
+            raise httpx.ConnectError("refused")
+        return httpx.Response(200)
+
+    cube = mock_client(handler)
+
+    assert cube.warmup(3) == 2
+    assert paths == ["/readyz"] * 3
+
+
+@pytest.mark.asyncio
+async def test_warmup_without_connections_sends_nothing():
+    """Test that warming up no connections is a no-op rather than an error."""
+    requests: list[httpx.Request] = []
+    cube = mock_client(lambda r: requests.append(r) or httpx.Response(200))
+    async_cube = mock_async_client(
+        lambda r: requests.append(r) or httpx.Response(200)
+    )
+
+    assert cube.warmup(0) == 0
+    assert await async_cube.warmup(-1, keepalive=0.01) == 0
+    assert requests == []
+    await async_cube.close()
+
+
+def test_keepalive_repeats_until_closed():
+    """Test that the keepalive thread pings periodically and stops on close."""
+    paths: list[httpx.Request] = []
+    cube = mock_client(lambda r: paths.append(r) or httpx.Response(200))
+
+    cube.warmup(2, keepalive=0.01)
+    time.sleep(0.1)
+    cube.close()
+    sent = len(paths)
+    time.sleep(0.05)
+
+    assert sent > 4
+    assert len(paths) == sent
+
+
+@pytest.mark.asyncio
+async def test_async_keepalive_repeats_until_closed():
+    """Test that the keepalive task pings periodically and stops on close."""
+    paths: list[httpx.Request] = []
+    cube = mock_async_client(lambda r: paths.append(r) or httpx.Response(200))
+
+    await cube.warmup(1, keepalive=0.01)
+    await asyncio.sleep(0.1)
+    await cube.close()
+    sent = len(paths)
+    await asyncio.sleep(0.05)
+
+    assert sent > 2
+    assert len(paths) == sent